@@ -1,22 +1,85 @@
-from flask import Flask, jsonify, request, send_from_directory
+# 시작 시간 측정 (import 시간 포함, 아래 콜드 스타트 설정 참고)
+import time
+STARTUP_STARTED = time.perf_counter()
+
+from flask import Flask, Response, jsonify, request, send_from_directory, g, has_app_context
 from datetime import datetime
 import os
+import random
 import sqlite3
 import json
+import atexit
+import base64
+import gzip
+import hashlib
+import hmac
+import html
+import io
+import logging
+import mimetypes
+import queue
+import threading
+import uuid
+import zlib
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from werkzeug.exceptions import ClientDisconnected
 from werkzeug.utils import secure_filename
+from urllib.parse import quote
+
+from image_variants import (
+    choose_image_variant, existing_image_variants, generate_image_variants, has_no_variants,
+    image_variants_available, is_image_file, mark_no_variants, remove_image_variants
+)
+
+# 콜드 스타트 설정
+# 서버리스(Vercel)에서는 요청마다 새 프로세스가 뜰 수 있으므로 COLD_START_MODE 에서는
+# import 시 작업을 줄입니다: 정적 JSON 은 첫 요청 때 직렬화하고, 데이터베이스가 없으면
+# 마이그레이션을 실행하는 대신 미리 만든 템플릿(python app.py build-db-template)을 복사합니다.
+# import 단계별 시간과 첫 요청 시간은 첫 요청 후 startup_report 로그와 /metrics 로 확인할 수 있습니다.
+COLD_START_MODE = os.environ.get('COLD_START_MODE', '1' if os.environ.get('VERCEL') else '0') == '1'
+
+_startup_phases = []  # [(단계, 초)]
+_startup_last_mark = STARTUP_STARTED
+_startup_reported_pid = None
 
-app = Flask(__name__, static_folder='static', static_url_path='/static')
+def mark_startup(phase, elapsed=None):
+    """시작 단계의 소요 시간을 기록합니다 (elapsed 가 없으면 직전 기록 이후 경과 시간)."""
+    global _startup_last_mark
+    now = time.perf_counter()
+    if elapsed is None:
+        elapsed = now - _startup_last_mark
+        _startup_last_mark = now
+    _startup_phases.append((phase, elapsed))
+
+mark_startup('imports')
+
+# 정적 파일은 아래 static_files 라우트에서 직접 제공 (Flask 기본 static 라우트가 가로채지 않도록 비활성화)
+app = Flask(__name__, static_folder=None)
 
 # 파일 업로드 설정
 UPLOAD_FOLDER = os.environ.get('UPLOAD_PATH', '/tmp/uploads')
 ALLOWED_EXTENSIONS = {'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'zip', 'rar'}
 
-# 업로드 폴더가 없으면 생성
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
+# 업로드 폴더는 처음 저장할 때 만듭니다 (save_stream_to_temp, store_blob, 분할 업로드 시작)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB 최대 파일 크기
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB 최대 파일 크기 (요청 1건 기준)
+
+# 분할 업로드 설정 (요청 1건은 MAX_CONTENT_LENGTH 이하의 청크, 전체 파일은 아래 한도까지)
+CHUNKED_UPLOAD_MAX_SIZE = int(os.environ.get('CHUNKED_UPLOAD_MAX_SIZE', str(2 * 1024 * 1024 * 1024)))  # 2GB
+UPLOAD_CHUNK_SIZE = int(os.environ.get('UPLOAD_CHUNK_SIZE', str(4 * 1024 * 1024)))  # Vercel 요청 본문 한도(4.5MB) 이하
+UPLOAD_SESSION_TTL_HOURS = int(os.environ.get('UPLOAD_SESSION_TTL_HOURS', '24'))
+UPLOAD_STREAM_BLOCK_SIZE = 64 * 1024
+PARTIAL_UPLOAD_FOLDER = os.path.join(UPLOAD_FOLDER, '.partial')
+# 업로드 파일은 SHA-256 해시 이름으로 저장 (같은 내용은 한 번만 저장)
+BLOB_FOLDER = os.path.join(UPLOAD_FOLDER, 'blobs')
+
+# 파일 전송 오프로드 (리버스 프록시가 파일을 직접 전송하도록 위임)
+# - x-sendfile: Apache mod_xsendfile / lighttpd (X-Sendfile 헤더에 절대 경로)
+# - x-accel-redirect: nginx (internal location 경로, 아래 접두어를 업로드/정적 폴더에 매핑)
+FILE_OFFLOAD = os.environ.get('FILE_OFFLOAD', '').lower()
+X_ACCEL_UPLOADS_PREFIX = os.environ.get('X_ACCEL_UPLOADS_PREFIX', '/_protected/uploads/')
+X_ACCEL_STATIC_PREFIX = os.environ.get('X_ACCEL_STATIC_PREFIX', '/_protected/static/')
+app.config['USE_X_SENDFILE'] = FILE_OFFLOAD == 'x-sendfile'
 
 def allowed_file(filename):
     return '.' in filename and \
@@ -26,27 +89,330 @@ def allowed_file(filename):
 @app.after_request
 def after_request(response):
     response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
+    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Admin-Password')
     response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
     return response
 
+# 로깅
+# 요청마다 반복되는 로그는 print 대신 레벨/샘플링이 적용된 JSON 한 줄 로그로 남깁니다.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', 0.01))  # 샘플링 대상 로그를 남길 비율
+LOG_SLOW_REQUEST_SECONDS = float(os.environ.get('LOG_SLOW_REQUEST_SECONDS', 1.0))
+
+logger = logging.getLogger('hanstar')
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+
+def log_event(level, event, sampled=False, **fields):
+    """구조화 로그를 남깁니다. sampled=True 이면 LOG_SAMPLE_RATE 비율로만 기록합니다."""
+    log_level = getattr(logging, level.upper())
+    if not logger.isEnabledFor(log_level):
+        return
+    if sampled and random.random() >= LOG_SAMPLE_RATE:
+        return
+    
+    record = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'level': level, 'event': event}
+    record.update(fields)
+    if sampled:
+        record['sample_rate'] = LOG_SAMPLE_RATE
+    logger.log(log_level, json.dumps(record, ensure_ascii=False, default=str))
+
+# 요청 지표 (Prometheus 텍스트 형식으로 /metrics 에서 제공)
+# 지표는 워커 프로세스별로 집계됩니다 (gunicorn 다중 워커라면 워커마다 따로 수집됨).
+# 설정하면 Authorization: Bearer <토큰>, 없으면 X-Admin-Password 헤더(관리자 비밀번호)가 필요합니다
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_metrics_lock = threading.Lock()
+_request_latency = {}      # (method, route) -> [버킷별 개수..., 합계, 개수]
+_request_counts = {}       # (method, route, status) -> 개수
+_request_query_counts = {} # (method, route) -> [쿼리 수, 쿼리 시간]
+_request_bytes = {}        # (method, route, 'in'|'out') -> 바이트
+_query_stats = threading.local()
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """요청 처리 중 실행된 쿼리 수와 시간을 기록하는 커서"""
+    def execute(self, *args, **kwargs):
+        stats = getattr(_query_stats, 'current', None)
+        if stats is None:
+            return super().execute(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().execute(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += time.perf_counter() - started
+    
+    def executemany(self, *args, **kwargs):
+        stats = getattr(_query_stats, 'current', None)
+        if stats is None:
+            return super().executemany(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().executemany(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += time.perf_counter() - started
+
+class InstrumentedConnection(sqlite3.Connection):
+    """InstrumentedCursor 를 기본 커서로 사용하는 연결"""
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+    
+    def execute(self, *args, **kwargs):
+        return self.cursor().execute(*args, **kwargs)
+    
+    def executemany(self, *args, **kwargs):
+        return self.cursor().executemany(*args, **kwargs)
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    _query_stats.current = [0, 0.0]
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is None:
+        return response
+    
+    elapsed = time.perf_counter() - started
+    query_count, query_time = getattr(_query_stats, 'current', None) or (0, 0.0)
+    _query_stats.current = None
+    
+    # 라벨 수가 늘어나지 않도록 실제 경로 대신 라우트 규칙을 사용
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    method = request.method
+    status = response.status_code
+    
+    with _metrics_lock:
+        latency = _request_latency.get((method, route))
+        if latency is None:
+            latency = _request_latency[(method, route)] = [0] * (len(METRICS_LATENCY_BUCKETS) + 2)
+        for index, bound in enumerate(METRICS_LATENCY_BUCKETS):
+            if elapsed <= bound:
+                latency[index] += 1
+        latency[-2] += elapsed
+        latency[-1] += 1
+        
+        count_key = (method, route, status)
+        _request_counts[count_key] = _request_counts.get(count_key, 0) + 1
+        
+        queries = _request_query_counts.setdefault((method, route), [0, 0.0])
+        queries[0] += query_count
+        queries[1] += query_time
+        
+        if request.content_length:
+            in_key = (method, route, 'in')
+            _request_bytes[in_key] = _request_bytes.get(in_key, 0) + request.content_length
+        if response.content_length:
+            out_key = (method, route, 'out')
+            _request_bytes[out_key] = _request_bytes.get(out_key, 0) + response.content_length
+    
+    if _startup_reported_pid != os.getpid():
+        report_startup(method, route, elapsed)
+    
+    fields = {'method': method, 'route': route, 'status': status,
+              'duration_ms': round(elapsed * 1000, 2), 'queries': query_count}
+    if status >= 500:
+        log_event('error', 'request', **fields)
+    elif elapsed >= LOG_SLOW_REQUEST_SECONDS:
+        log_event('warning', 'slow_request', **fields)
+    else:
+        log_event('info', 'request', sampled=True, **fields)
+    
+    return response
+
+def report_startup(method, route, elapsed):
+    """프로세스의 첫 요청이 끝나면 시작 단계별 소요 시간을 한 번 로그로 남깁니다."""
+    global _startup_reported_pid
+    with _metrics_lock:
+        if _startup_reported_pid == os.getpid():
+            return
+        _startup_reported_pid = os.getpid()
+    
+    mark_startup('first_request', elapsed)
+    log_event('info', 'startup_report', cold_start_mode=COLD_START_MODE, first_route=f'{method} {route}',
+              phases_ms={phase: round(seconds * 1000, 2) for phase, seconds in _startup_phases})
+
+def _metric_labels(**labels):
+    escaped = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{key}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+def render_metrics():
+    """수집된 지표를 Prometheus 텍스트 형식으로 만듭니다."""
+    with _metrics_lock:
+        latency = {key: list(value) for key, value in _request_latency.items()}
+        counts = dict(_request_counts)
+        queries = {key: list(value) for key, value in _request_query_counts.items()}
+        transferred = dict(_request_bytes)
+    
+    lines = [
+        '# HELP http_request_duration_seconds Request latency by route.',
+        '# TYPE http_request_duration_seconds histogram'
+    ]
+    for (method, route), values in sorted(latency.items()):
+        for index, bound in enumerate(METRICS_LATENCY_BUCKETS):
+            lines.append(f'http_request_duration_seconds_bucket{_metric_labels(method=method, route=route, le=bound)} {values[index]}')
+        lines.append(f'http_request_duration_seconds_bucket{_metric_labels(method=method, route=route, le="+Inf")} {values[-1]}')
+        lines.append(f'http_request_duration_seconds_sum{_metric_labels(method=method, route=route)} {values[-2]:.6f}')
+        lines.append(f'http_request_duration_seconds_count{_metric_labels(method=method, route=route)} {values[-1]}')
+    
+    lines += ['# HELP http_requests_total Requests by route and status code.', '# TYPE http_requests_total counter']
+    for (method, route, status), count in sorted(counts.items()):
+        lines.append(f'http_requests_total{_metric_labels(method=method, route=route, status=status)} {count}')
+    
+    lines += ['# HELP sqlite_queries_total SQLite statements executed while handling requests.', '# TYPE sqlite_queries_total counter']
+    for (method, route), (query_count, _) in sorted(queries.items()):
+        lines.append(f'sqlite_queries_total{_metric_labels(method=method, route=route)} {query_count}')
+    
+    lines += ['# HELP sqlite_query_seconds_total Time spent executing SQLite statements while handling requests.', '# TYPE sqlite_query_seconds_total counter']
+    for (method, route), (_, query_time) in sorted(queries.items()):
+        lines.append(f'sqlite_query_seconds_total{_metric_labels(method=method, route=route)} {query_time:.6f}')
+    
+    lines += ['# HELP http_transfer_bytes_total Request (in) and response (out) body bytes.', '# TYPE http_transfer_bytes_total counter']
+    for (method, route, direction), size in sorted(transferred.items()):
+        lines.append(f'http_transfer_bytes_total{_metric_labels(method=method, route=route, direction=direction)} {size}')
+    
+    lines += ['# HELP app_startup_seconds Time spent in each startup phase of this worker.', '# TYPE app_startup_seconds gauge']
+    for phase, seconds in list(_startup_phases):
+        lines.append(f'app_startup_seconds{_metric_labels(phase=phase)} {seconds:.6f}')
+    
+    writer = get_writer_stats()
+    lines += ['# HELP sqlite_write_queue_depth Writes waiting for the writer thread.', '# TYPE sqlite_write_queue_depth gauge',
+              f'sqlite_write_queue_depth {writer["queue_depth"]}']
+    lines += ['# HELP sqlite_write_batches_total Group-committed write transactions.', '# TYPE sqlite_write_batches_total counter',
+              f'sqlite_write_batches_total {writer["batches"]}']
+    lines += ['# HELP sqlite_writes_total Writes by outcome.', '# TYPE sqlite_writes_total counter']
+    for outcome, key in (('committed', 'writes'), ('failed', 'failed'), ('rejected', 'rejected'), ('timeout', 'timeouts')):
+        lines.append(f'sqlite_writes_total{_metric_labels(outcome=outcome)} {writer[key]}')
+    
+    return '\n'.join(lines) + '\n'
+
+def verify_metrics_access():
+    """운영 지표 조회 권한을 확인합니다 (METRICS_TOKEN 이 있으면 Bearer 토큰, 없으면 관리자 비밀번호)."""
+    if METRICS_TOKEN:
+        return hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {METRICS_TOKEN}')
+    return verify_admin_password(request.headers.get('X-Admin-Password'))
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus 지표 (현재 워커 기준)"""
+    if not verify_metrics_access():
+        return jsonify({'success': False, 'error': '인증에 실패했습니다.'}), 401
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
 # SQLite 데이터베이스 파일 경로 (환경변수 또는 기본값)
 # Vercel에서는 /tmp 디렉토리만 쓰기 가능
 DATABASE_FILE = os.environ.get('DATABASE_PATH', '/tmp/inquiries.db')
 
-def init_database():
-    """SQLite 데이터베이스를 초기화합니다."""
-    try:
-        # Vercel에서는 /tmp 디렉토리가 존재하는지 확인
-        db_dir = os.path.dirname(DATABASE_FILE)
-        if not os.path.exists(db_dir):
-            os.makedirs(db_dir, exist_ok=True)
-            
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        
-        # 문의 테이블 생성
-        cursor.execute('''
+# SQLite 튜닝 프로파일 (SQLITE_PROFILE 환경변수로 선택, 항목별로 SQLITE_<항목> 환경변수로 덮어쓰기)
+# - concurrent: 여러 gunicorn 워커가 동시에 읽고 쓰는 환경 (WAL, 읽기가 쓰기를 기다리지 않음)
+# - safe: SQLite 기본 롤백 저널 방식
+SQLITE_PROFILES = {
+    'concurrent': {
+        'journal_mode': 'WAL',
+        'busy_timeout': 5000,
+        'synchronous': 'NORMAL',
+        'mmap_size': 64 * 1024 * 1024,
+        'cache_size': -16000,  # 음수는 KiB 단위 (약 16MB)
+        'temp_store': 'MEMORY',
+    },
+    'safe': {
+        'journal_mode': 'DELETE',
+        'busy_timeout': 5000,
+        'synchronous': 'FULL',
+        'mmap_size': 0,
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+    },
+}
+
+# 문자열 값을 갖는 PRAGMA 의 허용 값 (PRAGMA 조회 시 반환되는 숫자 포함)
+SQLITE_PRAGMA_CHOICES = {
+    'journal_mode': ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'],
+    'synchronous': ['OFF', 'NORMAL', 'FULL', 'EXTRA'],
+    'temp_store': ['DEFAULT', 'FILE', 'MEMORY'],
+}
+
+def load_sqlite_settings():
+    """환경변수에서 SQLite 튜닝 설정을 읽어옵니다."""
+    profile = os.environ.get('SQLITE_PROFILE', 'concurrent').lower()
+    if profile not in SQLITE_PROFILES:
+        print(f'알 수 없는 SQLite 프로파일: {profile} (concurrent 사용)')
+        profile = 'concurrent'
+    
+    settings = dict(SQLITE_PROFILES[profile])
+    for key, default in settings.items():
+        value = os.environ.get(f'SQLITE_{key.upper()}')
+        if not value:
+            continue
+        
+        try:
+            if key in SQLITE_PRAGMA_CHOICES:
+                value = value.upper()
+                if value not in SQLITE_PRAGMA_CHOICES[key]:
+                    raise ValueError(value)
+                settings[key] = value
+            else:
+                settings[key] = int(value)
+        except ValueError:
+            print(f'잘못된 SQLite 설정 무시: SQLITE_{key.upper()}={value} (기본값 {default} 사용)')
+    
+    return profile, settings
+
+SQLITE_PROFILE, SQLITE_SETTINGS = load_sqlite_settings()
+
+def apply_sqlite_settings(conn):
+    """연결 단위 PRAGMA 설정을 적용합니다 (journal_mode 는 초기화 시 한 번만 설정)."""
+    for key in ('busy_timeout', 'synchronous', 'mmap_size', 'cache_size', 'temp_store'):
+        conn.execute(f'PRAGMA {key} = {SQLITE_SETTINGS[key]}')
+
+def report_sqlite_settings(conn):
+    """실제로 적용된 SQLite 설정을 확인하고 출력합니다."""
+    effective = {}
+    for key, expected in SQLITE_SETTINGS.items():
+        value = conn.execute(f'PRAGMA {key}').fetchone()[0]
+        if key in SQLITE_PRAGMA_CHOICES:
+            value = SQLITE_PRAGMA_CHOICES[key][value] if isinstance(value, int) else str(value).upper()
+        effective[key] = value
+        
+        if value != expected:
+            print(f'SQLite 설정 불일치: {key} 요청={expected}, 적용={value}')
+    
+    print(f'SQLite 설정 ({SQLITE_PROFILE}): {effective}')
+    return effective
+
+# 스키마 마이그레이션
+def renumber_duplicate_serials(conn):
+    """같은 날짜에 중복 발급된 일련번호를 그 날짜의 마지막 번호 뒤로 다시 매깁니다."""
+    duplicates = conn.execute('''
+        SELECT id, date FROM inquiries
+        WHERE id NOT IN (SELECT MIN(id) FROM inquiries GROUP BY date, serial)
+        ORDER BY date, id
+    ''').fetchall()
+    
+    for inquiry_id, date in duplicates:
+        last_serial = conn.execute(
+            'SELECT MAX(CAST(serial AS INTEGER)) FROM inquiries WHERE date = ?', (date,)
+        ).fetchone()[0] or 0
+        conn.execute('UPDATE inquiries SET serial = ? WHERE id = ?', (f'{last_serial + 1:02d}', inquiry_id))
+    
+    if duplicates:
+        print(f'중복 일련번호 {len(duplicates)}건 재발급')
+
+# 각 항목은 (설명, SQL 문 목록) 이며, 목록 순서가 곧 버전 번호(PRAGMA user_version)입니다.
+# 이미 배포된 항목은 수정하지 말고 새 항목을 뒤에 추가합니다.
+MIGRATIONS = [
+    ('기본 테이블 생성', [
+        '''
             CREATE TABLE IF NOT EXISTS inquiries (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 date TEXT NOT NULL,
@@ -60,10 +426,8 @@ def init_database():
                 answer_date TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-        ''')
-        
-        # 자료 테이블 생성
-        cursor.execute('''
+        ''',
+        '''
             CREATE TABLE IF NOT EXISTS materials (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -78,61 +442,944 @@ def init_database():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-        ''')
+        ''',
+    ]),
+    ('조회용 인덱스 추가', [
+        # 일련번호 계산(date 조건) 및 사용자 문의 목록 정렬(date, serial)
+        'CREATE INDEX IF NOT EXISTS idx_inquiries_date_serial ON inquiries (date, serial)',
+        # 관리자 문의 목록 정렬
+        'CREATE INDEX IF NOT EXISTS idx_inquiries_created_at ON inquiries (created_at)',
+        # 사용자 자료 목록 (카테고리 필터 / 전체)
+        'CREATE INDEX IF NOT EXISTS idx_materials_category_active_created ON materials (category, is_active, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_materials_active_created ON materials (is_active, created_at)',
+        # 관리자 자료 목록
+        'CREATE INDEX IF NOT EXISTS idx_materials_created_at ON materials (created_at)',
+    ]),
+    ('일자별 일련번호 카운터 및 (date, serial) 고유 제약', [
+        '''
+            CREATE TABLE IF NOT EXISTS inquiry_serials (
+                date TEXT PRIMARY KEY,
+                last_serial INTEGER NOT NULL
+            ) WITHOUT ROWID
+        ''',
+        renumber_duplicate_serials,
+        '''
+            INSERT OR REPLACE INTO inquiry_serials (date, last_serial)
+            SELECT date, MAX(CAST(serial AS INTEGER)) FROM inquiries GROUP BY date
+        ''',
+        'DROP INDEX IF EXISTS idx_inquiries_date_serial',
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_inquiries_date_serial_unique ON inquiries (date, serial)',
+    ]),
+    ('분할 업로드 세션', [
+        '''
+            CREATE TABLE IF NOT EXISTS upload_sessions (
+                id TEXT PRIMARY KEY,
+                file_name TEXT NOT NULL,
+                file_size INTEGER NOT NULL,
+                file_type TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        ''',
+    ]),
+    ('자료 파일 내용 주소 저장 (content_hash)', [
+        'ALTER TABLE materials ADD COLUMN content_hash TEXT',
+        'CREATE INDEX IF NOT EXISTS idx_materials_content_hash ON materials (content_hash)',
+    ]),
+    ('전문 검색 (FTS5) 인덱스', [
+        # 원본 테이블을 content 로 사용하는 외부 콘텐츠 FTS 테이블 (텍스트 중복 저장 없음)
+        '''
+            CREATE VIRTUAL TABLE IF NOT EXISTS inquiries_fts USING fts5(
+                name, email, phone, message, answer,
+                content='inquiries', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_fts_insert AFTER INSERT ON inquiries BEGIN
+                INSERT INTO inquiries_fts (rowid, name, email, phone, message, answer)
+                VALUES (new.id, new.name, new.email, new.phone, new.message, new.answer);
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_fts_delete AFTER DELETE ON inquiries BEGIN
+                INSERT INTO inquiries_fts (inquiries_fts, rowid, name, email, phone, message, answer)
+                VALUES ('delete', old.id, old.name, old.email, old.phone, old.message, old.answer);
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_fts_update AFTER UPDATE OF name, email, phone, message, answer ON inquiries BEGIN
+                INSERT INTO inquiries_fts (inquiries_fts, rowid, name, email, phone, message, answer)
+                VALUES ('delete', old.id, old.name, old.email, old.phone, old.message, old.answer);
+                INSERT INTO inquiries_fts (rowid, name, email, phone, message, answer)
+                VALUES (new.id, new.name, new.email, new.phone, new.message, new.answer);
+            END
+        ''',
+        "INSERT INTO inquiries_fts (inquiries_fts) VALUES ('rebuild')",
+        '''
+            CREATE VIRTUAL TABLE IF NOT EXISTS materials_fts USING fts5(
+                title, description, file_name,
+                content='materials', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_fts_insert AFTER INSERT ON materials BEGIN
+                INSERT INTO materials_fts (rowid, title, description, file_name)
+                VALUES (new.id, new.title, new.description, new.file_name);
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_fts_delete AFTER DELETE ON materials BEGIN
+                INSERT INTO materials_fts (materials_fts, rowid, title, description, file_name)
+                VALUES ('delete', old.id, old.title, old.description, old.file_name);
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_fts_update AFTER UPDATE OF title, description, file_name ON materials BEGIN
+                INSERT INTO materials_fts (materials_fts, rowid, title, description, file_name)
+                VALUES ('delete', old.id, old.title, old.description, old.file_name);
+                INSERT INTO materials_fts (rowid, title, description, file_name)
+                VALUES (new.id, new.title, new.description, new.file_name);
+            END
+        ''',
+        "INSERT INTO materials_fts (materials_fts) VALUES ('rebuild')",
+    ]),
+    ('워커 간 캐시 무효화용 세대 번호', [
+        '''
+            CREATE TABLE IF NOT EXISTS cache_generations (
+                name TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        ''',
+        "INSERT OR IGNORE INTO cache_generations (name, generation) VALUES ('materials', 0)",
+        # 자료가 추가/수정/삭제되면 모든 워커의 목록 캐시가 무효화됨
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_generation_insert AFTER INSERT ON materials BEGIN
+                UPDATE cache_generations SET generation = generation + 1 WHERE name = 'materials';
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_generation_update AFTER UPDATE ON materials BEGIN
+                UPDATE cache_generations SET generation = generation + 1 WHERE name = 'materials';
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_generation_delete AFTER DELETE ON materials BEGIN
+                UPDATE cache_generations SET generation = generation + 1 WHERE name = 'materials';
+            END
+        ''',
+    ]),
+    ('목록 개수 카운터 (COUNT(*) 대체)', [
+        # 문의: (inquiries, '', answered|unanswered), 자료: (materials, 분류, active|inactive)
+        # 트리거가 같은 트랜잭션에서 갱신하므로 항상 실제 행 수와 일치합니다.
+        '''
+            CREATE TABLE IF NOT EXISTS row_counts (
+                table_name TEXT NOT NULL,
+                category TEXT NOT NULL,
+                state TEXT NOT NULL,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (table_name, category, state)
+            ) WITHOUT ROWID
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_count_insert AFTER INSERT ON inquiries BEGIN
+                INSERT INTO row_counts (table_name, category, state, row_count)
+                VALUES ('inquiries', '', CASE WHEN COALESCE(new.answer, '') != '' THEN 'answered' ELSE 'unanswered' END, 1)
+                ON CONFLICT (table_name, category, state) DO UPDATE SET row_count = row_count + 1;
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_count_delete AFTER DELETE ON inquiries BEGIN
+                UPDATE row_counts SET row_count = row_count - 1
+                WHERE table_name = 'inquiries' AND category = ''
+                  AND state = CASE WHEN COALESCE(old.answer, '') != '' THEN 'answered' ELSE 'unanswered' END;
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_count_update AFTER UPDATE OF answer ON inquiries
+            WHEN (COALESCE(old.answer, '') != '') != (COALESCE(new.answer, '') != '') BEGIN
+                UPDATE row_counts SET row_count = row_count - 1
+                WHERE table_name = 'inquiries' AND category = ''
+                  AND state = CASE WHEN COALESCE(old.answer, '') != '' THEN 'answered' ELSE 'unanswered' END;
+                INSERT INTO row_counts (table_name, category, state, row_count)
+                VALUES ('inquiries', '', CASE WHEN COALESCE(new.answer, '') != '' THEN 'answered' ELSE 'unanswered' END, 1)
+                ON CONFLICT (table_name, category, state) DO UPDATE SET row_count = row_count + 1;
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_count_insert AFTER INSERT ON materials BEGIN
+                INSERT INTO row_counts (table_name, category, state, row_count)
+                VALUES ('materials', new.category, CASE WHEN new.is_active THEN 'active' ELSE 'inactive' END, 1)
+                ON CONFLICT (table_name, category, state) DO UPDATE SET row_count = row_count + 1;
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_count_delete AFTER DELETE ON materials BEGIN
+                UPDATE row_counts SET row_count = row_count - 1
+                WHERE table_name = 'materials' AND category = old.category
+                  AND state = CASE WHEN old.is_active THEN 'active' ELSE 'inactive' END;
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_count_update AFTER UPDATE OF category, is_active ON materials
+            WHEN old.category != new.category
+              OR (CASE WHEN old.is_active THEN 1 ELSE 0 END) != (CASE WHEN new.is_active THEN 1 ELSE 0 END) BEGIN
+                UPDATE row_counts SET row_count = row_count - 1
+                WHERE table_name = 'materials' AND category = old.category
+                  AND state = CASE WHEN old.is_active THEN 'active' ELSE 'inactive' END;
+                INSERT INTO row_counts (table_name, category, state, row_count)
+                VALUES ('materials', new.category, CASE WHEN new.is_active THEN 'active' ELSE 'inactive' END, 1)
+                ON CONFLICT (table_name, category, state) DO UPDATE SET row_count = row_count + 1;
+            END
+        ''',
+        # 기존 데이터로 초기값 채우기
+        '''
+            INSERT INTO row_counts (table_name, category, state, row_count)
+            SELECT 'inquiries', '', CASE WHEN COALESCE(answer, '') != '' THEN 'answered' ELSE 'unanswered' END, COUNT(*)
+            FROM inquiries GROUP BY 3
+        ''',
+        '''
+            INSERT INTO row_counts (table_name, category, state, row_count)
+            SELECT 'materials', category, CASE WHEN is_active THEN 'active' ELSE 'inactive' END, COUNT(*)
+            FROM materials GROUP BY 2, 3
+        ''',
+    ]),
+    ('관리자 실시간 알림용 변경 로그', [
+        # 커밋된 변경만 보이므로 워커와 관계없이 id(rowid) 순서로 폴링하면 새 이벤트를 놓치지 않습니다.
+        # 최근 1000건만 보관합니다 (그보다 오래 끊겼던 클라이언트는 목록을 다시 불러와야 함).
+        '''
+            CREATE TABLE IF NOT EXISTS change_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event TEXT NOT NULL,
+                inquiry_id INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_change_log_insert AFTER INSERT ON inquiries BEGIN
+                INSERT INTO change_log (event, inquiry_id) VALUES ('inquiry_created', new.id);
+                DELETE FROM change_log WHERE id <= (SELECT MAX(id) FROM change_log) - 1000;
+            END
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS inquiries_change_log_answer AFTER UPDATE OF answer ON inquiries
+            WHEN COALESCE(new.answer, '') != '' AND new.answer IS NOT old.answer BEGIN
+                INSERT INTO change_log (event, inquiry_id) VALUES ('answer_posted', new.id);
+                DELETE FROM change_log WHERE id <= (SELECT MAX(id) FROM change_log) - 1000;
+            END
+        ''',
+    ]),
+    ('자료 세대 번호를 다운로드 카운트 반영에서 제외', [
+        # 다운로드 카운트 반영(flush)마다 세대 번호가 올라 모든 워커의 목록 캐시가 무효화되던 문제.
+        # 목록에 보이는 내용이 바뀌는 컬럼만 감시하고, download_count 는 캐시 만료 시간으로 따라잡습니다.
+        'DROP TRIGGER IF EXISTS materials_generation_update',
+        '''
+            CREATE TRIGGER IF NOT EXISTS materials_generation_update
+            AFTER UPDATE OF title, description, category, is_active, file_name, content_hash ON materials BEGIN
+                UPDATE cache_generations SET generation = generation + 1 WHERE name = 'materials';
+            END
+        ''',
+    ]),
+]
+
+def get_schema_version(conn):
+    """현재 데이터베이스의 스키마 버전을 반환합니다."""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def run_migrations(conn):
+    """적용되지 않은 마이그레이션을 순서대로 실행하고 최종 버전을 반환합니다."""
+    for version, (description, statements) in enumerate(MIGRATIONS, start=1):
+        if get_schema_version(conn) >= version:
+            continue
+        
+        # 쓰기 잠금을 먼저 잡고 다시 확인 (다른 워커가 이미 적용했을 수 있음)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            
+            for statement in statements:
+                # 데이터 보정이 필요한 단계는 함수로 등록
+                if callable(statement):
+                    statement(conn)
+                else:
+                    conn.execute(statement)
+            conn.execute(f'PRAGMA user_version = {version}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        print(f'데이터베이스 마이그레이션 적용: v{version} {description}')
+    
+    return get_schema_version(conn)
+
+# 데이터베이스 템플릿
+# 모든 마이그레이션을 적용한 빈 데이터베이스를 배포 전에 만들어 두면 (python app.py build-db-template),
+# COLD_START_MODE 에서 데이터베이스 파일이 없을 때 스키마를 만드는 대신 파일 복사 한 번으로 시작합니다.
+DATABASE_TEMPLATE = os.environ.get(
+    'DATABASE_TEMPLATE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'db_template.sqlite3')
+)
+
+def build_database_template(path=DATABASE_TEMPLATE):
+    """마이그레이션을 모두 적용한 템플릿 파일을 만들고 스키마 버전을 반환합니다."""
+    temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    try:
+        conn = sqlite3.connect(temp_path)
+        # 복사만으로 쓸 수 있도록 -wal 파일 없이 단일 파일로 저장
+        conn.execute('PRAGMA journal_mode = DELETE')
+        schema_version = run_migrations(conn)
+        conn.execute('VACUUM')
+        conn.close()
+        os.replace(temp_path, path)
+    finally:
+        remove_file_quietly(temp_path)
+    return schema_version
+
+def copy_database_template():
+    """데이터베이스 파일이 없으면 템플릿을 복사합니다. 복사했으면 True.
+    
+    템플릿의 스키마 버전이 현재 마이그레이션과 다르면 사용하지 않습니다 (마이그레이션으로 생성).
+    """
+    if os.path.exists(DATABASE_FILE) or not os.path.exists(DATABASE_TEMPLATE):
+        return False
+    
+    template = sqlite3.connect(f'file:{DATABASE_TEMPLATE}?mode=ro', uri=True)
+    try:
+        template_version = get_schema_version(template)
+    finally:
+        template.close()
+    if template_version != len(MIGRATIONS):
+        print(f'데이터베이스 템플릿 버전 불일치 (v{template_version}, 현재 v{len(MIGRATIONS)}): 템플릿을 사용하지 않습니다')
+        return False
+    
+    import shutil  # 템플릿 복사에서만 사용 (콜드 스타트 시 불러오지 않음)
+    
+    temp_path = f'{DATABASE_FILE}.{uuid.uuid4().hex}.tmp'
+    try:
+        shutil.copyfile(DATABASE_TEMPLATE, temp_path)
+        # 링크는 대상이 이미 있으면 실패하므로 다른 워커가 먼저 만든 데이터베이스를 덮어쓰지 않음
+        os.link(temp_path, DATABASE_FILE)
+        return True
+    except OSError:
+        return False
+    finally:
+        remove_file_quietly(temp_path)
+
+def init_database():
+    """SQLite 데이터베이스를 초기화합니다."""
+    try:
+        # Vercel에서는 /tmp 디렉토리가 존재하는지 확인
+        db_dir = os.path.dirname(DATABASE_FILE)
+        if not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+        
+        if COLD_START_MODE and copy_database_template():
+            print('데이터베이스 템플릿에서 생성')
         
-        conn.commit()
+        conn = sqlite3.connect(DATABASE_FILE)
+        apply_sqlite_settings(conn)
+        # 저널 모드는 데이터베이스 파일에 유지되므로 초기화 시 한 번만 설정
+        conn.execute(f"PRAGMA journal_mode = {SQLITE_SETTINGS['journal_mode']}")
+        
+        schema_version = run_migrations(conn)
+        
+        report_sqlite_settings(conn)
         conn.close()
-        print('SQLite 데이터베이스 초기화 완료')
+        print(f'SQLite 데이터베이스 초기화 완료 (스키마 v{schema_version})')
+        return True
         
     except Exception as e:
         print(f'데이터베이스 초기화 실패: {e}')
+        return False
+
+# 주요 조회 쿼리의 실행 계획 점검
+# 새 조회 쿼리를 추가하면 여기에 등록하여 인덱스를 타는지 확인합니다.
+HOT_QUERIES = {
+    'inquiry_serial_counter': (
+        'SELECT last_serial FROM inquiry_serials WHERE date = ?',
+        ('2024-01-01',)
+    ),
+    'inquiry_list_first_page': (
+        'SELECT * FROM inquiries ORDER BY date DESC, serial DESC, id DESC LIMIT ?',
+        (16,)
+    ),
+    'inquiry_list_cursor': (
+        'SELECT * FROM inquiries WHERE (date, serial, id) < (?, ?, ?) '
+        'ORDER BY date DESC, serial DESC, id DESC LIMIT ?',
+        ('2024-01-01', '01', 1, 16)
+    ),
+    'admin_inquiry_list_cursor': (
+        'SELECT * FROM inquiries WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?',
+        ('2024-01-01 00:00:00', 1, 16)
+    ),
+    'materials_by_category': (
+        'SELECT * FROM materials WHERE category = ? AND is_active = 1 ORDER BY created_at DESC',
+        ('기타',)
+    ),
+    'materials_active': (
+        'SELECT * FROM materials WHERE is_active = 1 ORDER BY created_at DESC',
+        ()
+    ),
+    'admin_materials': (
+        'SELECT * FROM materials ORDER BY created_at DESC',
+        ()
+    ),
+    'materials_active_cursor': (
+        'SELECT * FROM materials WHERE is_active = 1 AND (created_at, id) < (?, ?) '
+        'ORDER BY created_at DESC, id DESC LIMIT ?',
+        ('2024-01-01 00:00:00', 1, 51)
+    ),
+    'materials_by_category_cursor': (
+        'SELECT * FROM materials WHERE category = ? AND is_active = 1 AND (created_at, id) < (?, ?) '
+        'ORDER BY created_at DESC, id DESC LIMIT ?',
+        ('기타', '2024-01-01 00:00:00', 1, 51)
+    ),
+    'admin_materials_cursor': (
+        'SELECT * FROM materials WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?',
+        ('2024-01-01 00:00:00', 1, 51)
+    ),
+    'row_counts': (
+        'SELECT category, state, row_count FROM row_counts WHERE table_name = ? AND row_count > 0',
+        ('materials',)
+    ),
+    'material_blob_refs': (
+        'SELECT COUNT(*) FROM materials WHERE content_hash = ?',
+        ('0' * 64,)
+    ),
+    'inquiry_events': (
+        'SELECT c.id, c.event, i.* FROM change_log c JOIN inquiries i ON i.id = c.inquiry_id '
+        'WHERE c.id > ? ORDER BY c.id LIMIT ?',
+        (0, 100)
+    ),
+    'materials_generation': (
+        "SELECT generation FROM cache_generations WHERE name = 'materials'",
+        ()
+    ),
+    'material_by_id': (
+        'SELECT file_path, file_name FROM materials WHERE id = ? AND is_active = 1',
+        (1,)
+    ),
+}
+
+def check_query_plans(conn):
+    """등록된 조회 쿼리 중 전체 테이블 스캔을 하는 쿼리 목록을 반환합니다."""
+    failures = []
+    for name, (sql, params) in HOT_QUERIES.items():
+        plan = [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+        # 'SCAN 테이블' 은 전체 스캔, 'SCAN 테이블 USING ... INDEX' 는 인덱스 순서 스캔
+        full_scans = [detail for detail in plan if detail.startswith('SCAN ') and 'INDEX' not in detail]
+        status = '실패' if full_scans else '통과'
+        print(f'[{status}] {name}: {" / ".join(plan)}')
+        if full_scans:
+            failures.append(name)
+    return failures
+
+# 데이터베이스 연결 관리
+# 스키마 초기화는 프로세스당 한 번만 수행하고, 연결은 스레드별로 재사용합니다.
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get('DB_STATEMENT_CACHE_SIZE', '256'))
+
+_db_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_initialized = False
+
+def ensure_database_schema():
+    """스키마 초기화를 프로세스당 한 번만 수행합니다."""
+    global _schema_initialized
+    if _schema_initialized:
+        return
+    with _schema_lock:
+        if not _schema_initialized:
+            started = time.perf_counter()
+            _schema_initialized = init_database()
+            mark_startup('database_init', time.perf_counter() - started)
+
+def _get_thread_connection():
+    """현재 스레드에 할당된 연결을 반환합니다 (없으면 새로 연결)."""
+    conn = getattr(_db_local, 'conn', None)
+    # fork 이후에는 부모 프로세스의 연결을 재사용하지 않음
+    if conn is not None and getattr(_db_local, 'pid', None) == os.getpid():
+        return conn
+    
+    ensure_database_schema()
+    _ensure_backup_scheduler()
+    conn = sqlite3.connect(DATABASE_FILE, cached_statements=DB_STATEMENT_CACHE_SIZE, factory=InstrumentedConnection)
+    apply_sqlite_settings(conn)
+    _db_local.conn = conn
+    _db_local.pid = os.getpid()
+    return conn
+
+def close_thread_connection():
+    """현재 스레드의 연결을 닫습니다."""
+    conn = getattr(_db_local, 'conn', None)
+    _db_local.conn = None
+    if conn is not None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
 
-# 데이터베이스 연결 함수 (매번 초기화)
 def get_db_connection():
-    """데이터베이스 연결을 반환합니다."""
-    init_database()  # 매번 테이블 존재 확인
-    return sqlite3.connect(DATABASE_FILE)
+    """데이터베이스 연결을 반환합니다 (앱 컨텍스트 동안 재사용)."""
+    if not has_app_context():
+        return _get_thread_connection()
+    
+    if 'db' not in g:
+        g.db = _get_thread_connection()
+    return g.db
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """요청 종료 시 연결을 스레드 풀로 반환합니다."""
+    conn = g.pop('db', None)
+    if conn is None:
+        return
+    
+    # 커밋되지 않은 트랜잭션은 되돌린 뒤 연결을 재사용
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error as e:
+        print(f'데이터베이스 연결 정리 실패: {e}')
+        close_thread_connection()
+
+# 단일 쓰기 스레드 (그룹 커밋)
+# 요청 스레드마다 쓰기 트랜잭션을 열면 SQLite 쓰기 잠금을 두고 경쟁하므로,
+# 쓰기 작업은 프로세스당 하나인 쓰기 스레드의 큐로 보내고 결과는 Future 로 돌려받습니다.
+# 쓰기 스레드는 큐에 쌓인 작업을 WRITE_BATCH_MAX_SIZE 개까지 한 트랜잭션으로 묶어 커밋하며,
+# 작업마다 SAVEPOINT 를 두어 한 작업의 실패가 같은 묶음의 다른 작업에 영향을 주지 않습니다.
+# 큐가 가득 차거나 WRITE_TIMEOUT 안에 처리되지 않으면 WriteUnavailable 이 발생합니다 (HTTP 503).
+# 파일 이동/삭제처럼 트랜잭션으로 되돌릴 수 없는 작업은 on_write_commit / on_write_rollback 으로 등록합니다.
+WRITE_QUEUE_MAX_SIZE = int(os.environ.get('WRITE_QUEUE_MAX_SIZE', 1000))
+WRITE_BATCH_MAX_SIZE = int(os.environ.get('WRITE_BATCH_MAX_SIZE', 64))
+WRITE_TIMEOUT = float(os.environ.get('WRITE_TIMEOUT', 10))
+WRITE_RETRY_AFTER = int(os.environ.get('WRITE_RETRY_AFTER', 2))  # 503 응답의 Retry-After (초)
+
+_writer_lock = threading.Lock()
+_writer_pid = None
+_write_queue = None
+_writer_stats = {'batches': 0, 'writes': 0, 'failed': 0, 'rejected': 0, 'timeouts': 0}
+_write_hooks = threading.local()
+
+class WriteUnavailable(Exception):
+    """쓰기 큐가 가득 찼거나 제한 시간 안에 처리되지 않음"""
+
+def _ensure_writer():
+    """현재 프로세스의 쓰기 스레드와 큐를 반환합니다 (gunicorn fork 이후 워커마다 새로 시작)."""
+    global _writer_pid, _write_queue
+    if _writer_pid == os.getpid():
+        return _write_queue
+    with _writer_lock:
+        if _writer_pid != os.getpid():
+            _write_queue = queue.Queue(maxsize=WRITE_QUEUE_MAX_SIZE)
+            threading.Thread(target=_writer_loop, args=(_write_queue,), name='sqlite-writer', daemon=True).start()
+            _writer_pid = os.getpid()
+    return _write_queue
+
+def _writer_loop(write_queue):
+    """큐의 쓰기 작업을 묶어서 한 트랜잭션으로 커밋합니다."""
+    while True:
+        batch = [write_queue.get()]
+        while len(batch) < WRITE_BATCH_MAX_SIZE:
+            try:
+                batch.append(write_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # 호출자가 기다리다 취소한 작업은 실행하지 않음
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if batch:
+            _commit_write_batch(batch)
+
+def on_write_commit(callback):
+    """현재 쓰기 작업이 포함된 트랜잭션이 커밋된 뒤 callback() 을 실행합니다 (쓰기 작업 안에서만 호출)."""
+    _current_write_hooks()[0].append(callback)
+
+def on_write_rollback(callback):
+    """현재 쓰기 작업이 되돌려지면 callback() 을 실행합니다 (등록 역순, 쓰기 잠금을 잡은 상태에서 실행)."""
+    _current_write_hooks()[1].append(callback)
+
+def _current_write_hooks():
+    hooks = getattr(_write_hooks, 'current', None)
+    if hooks is None:
+        raise RuntimeError('쓰기 스레드의 작업 안에서만 사용할 수 있습니다.')
+    return hooks
+
+def _run_write_hooks(callbacks):
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            print(f'쓰기 후처리 실패: {e}')
+
+def _commit_write_batch(batch):
+    results = []
+    committed_hooks = []  # 성공한 작업의 (커밋 후 실행, 되돌릴 때 실행) 목록
+    try:
+        conn = _get_thread_connection()
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            for func, args, future in batch:
+                hooks = _write_hooks.current = ([], [])
+                cursor.execute('SAVEPOINT write_item')
+                try:
+                    result = func(cursor, *args)
+                    cursor.execute('RELEASE write_item')
+                except Exception as e:
+                    _run_write_hooks(reversed(hooks[1]))
+                    cursor.execute('ROLLBACK TO write_item')
+                    cursor.execute('RELEASE write_item')
+                    results.append((future, None, e))
+                    continue
+                results.append((future, result, None))
+                committed_hooks.append(hooks)
+            conn.commit()
+        except Exception:
+            # 파일 변경은 쓰기 잠금이 풀리기 전에 되돌림
+            for _, rollback_hooks in reversed(committed_hooks):
+                _run_write_hooks(reversed(rollback_hooks))
+            conn.rollback()
+            raise
+        finally:
+            _write_hooks.current = None
+    except Exception as e:
+        print(f'쓰기 트랜잭션 실패: {e}')
+        with _writer_lock:
+            _writer_stats['failed'] += len(batch)
+        for _, _, future in batch:
+            future.set_exception(e)
+        return
+    
+    for commit_hooks, _ in committed_hooks:
+        _run_write_hooks(commit_hooks)
+    
+    failed = sum(1 for _, _, error in results if error is not None)
+    with _writer_lock:
+        _writer_stats['batches'] += 1
+        _writer_stats['writes'] += len(results) - failed
+        _writer_stats['failed'] += failed
+    for future, result, error in results:
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+def run_write(func, *args, timeout=None):
+    """func(cursor, *args) 를 쓰기 스레드의 트랜잭션 안에서 실행하고 결과를 반환합니다.
+    
+    func 가 발생시킨 예외는 호출자에게 그대로 전달됩니다 (해당 작업만 되돌림).
+    """
+    future = Future()
+    try:
+        _ensure_writer().put_nowait((func, args, future))
+    except queue.Full:
+        with _writer_lock:
+            _writer_stats['rejected'] += 1
+        raise WriteUnavailable('쓰기 요청이 많아 처리할 수 없습니다.')
+    
+    timeout = WRITE_TIMEOUT if timeout is None else timeout
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        # 아직 시작하지 않았으면 취소, 이미 실행 중이면 같은 시간만큼 더 기다림
+        if not future.cancel():
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                pass
+        with _writer_lock:
+            _writer_stats['timeouts'] += 1
+        raise WriteUnavailable('쓰기 요청이 제한 시간 안에 처리되지 않았습니다.')
+
+def write_unavailable_response(error):
+    """WriteUnavailable 에 대한 503 응답 (Retry-After 포함)"""
+    response = jsonify({'success': False, 'error': f'{error} 잠시 후 다시 시도해주세요.'})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(WRITE_RETRY_AFTER)
+    return response
+
+def get_writer_stats():
+    with _writer_lock:
+        stats = dict(_writer_stats)
+    stats['queue_depth'] = _write_queue.qsize() if _writer_pid == os.getpid() else 0
+    return stats
+
+# 파일 잠금 (백업, 분할 업로드의 프로세스 간 동시 실행 방지)
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경
+    fcntl = None
+
+# 데이터베이스 백업 설정
+# SQLite 온라인 백업 API 로 일정 페이지씩 나눠 복사하므로 백업 중에도 쓰기가 막히지 않습니다.
+# gunicorn 워커마다 주기 백업 스레드가 돌기 때문에, BACKUP_FOLDER 의 잠금 파일로 한 번에 하나만 실행하고
+# 주기 백업은 가장 최근 백업이 주기보다 오래됐을 때만 실행합니다 (워커 수와 관계없이 주기당 1회).
+BACKUP_FOLDER = os.environ.get('BACKUP_FOLDER', os.path.join(os.path.dirname(DATABASE_FILE) or '.', 'backups'))
+BACKUP_PAGES_PER_STEP = int(os.environ.get('BACKUP_PAGES_PER_STEP', 256))
+BACKUP_STEP_SLEEP = float(os.environ.get('BACKUP_STEP_SLEEP', 0.01))
+BACKUP_KEEP_DAILY = int(os.environ.get('BACKUP_KEEP_DAILY', 7))
+BACKUP_KEEP_WEEKLY = int(os.environ.get('BACKUP_KEEP_WEEKLY', 4))
+BACKUP_INTERVAL_HOURS = float(os.environ.get('BACKUP_INTERVAL_HOURS', 0))  # 0 이면 주기 백업 안 함
+BACKUP_FILE_PREFIX = 'inquiries_backup_'
+BACKUP_FILE_SUFFIX = '.db.gz'
+BACKUP_LOCK_FILE = '.backup.lock'
+# 워커마다 타이머가 조금씩 어긋나므로 주기의 90% 가 지났으면 주기가 돌아온 것으로 봄
+BACKUP_INTERVAL_SLACK = 0.9
+
+_backup_lock = threading.Lock()
+_backup_schedule_event = threading.Event()
+_backup_scheduler_pid = None
+_backup_status = {
+    'running': False,
+    'started_at': None,
+    'finished_at': None,
+    'pages_total': 0,
+    'pages_remaining': 0,
+    'last_backup': None,
+    'last_error': None
+}
+
+def _update_backup_status(**changes):
+    with _backup_lock:
+        _backup_status.update(changes)
+
+def list_backups():
+    """백업 파일 목록을 최신순으로 반환합니다: [(생성 시각, 파일 이름), ...]"""
+    if not os.path.isdir(BACKUP_FOLDER):
+        return []
+    
+    backups = []
+    for file_name in os.listdir(BACKUP_FOLDER):
+        if not (file_name.startswith(BACKUP_FILE_PREFIX) and file_name.endswith(BACKUP_FILE_SUFFIX)):
+            continue
+        timestamp = file_name[len(BACKUP_FILE_PREFIX):-len(BACKUP_FILE_SUFFIX)]
+        try:
+            backups.append((datetime.strptime(timestamp, '%Y%m%d_%H%M%S'), file_name))
+        except ValueError:
+            continue
+    backups.sort(reverse=True)
+    return backups
+
+def rotate_backups():
+    """최근 N 일은 하루 1개, 최근 M 주는 주 1개씩 남기고 나머지 백업을 삭제합니다."""
+    keep = set()
+    kept_days = set()
+    kept_weeks = set()
+    
+    for created_at, file_name in list_backups():
+        day = created_at.date()
+        week = created_at.isocalendar()[:2]
+        if day not in kept_days and len(kept_days) < BACKUP_KEEP_DAILY:
+            kept_days.add(day)
+            keep.add(file_name)
+        if week not in kept_weeks and len(kept_weeks) < BACKUP_KEEP_WEEKLY:
+            kept_weeks.add(week)
+            keep.add(file_name)
+        if file_name not in keep:
+            remove_file_quietly(os.path.join(BACKUP_FOLDER, file_name))
+            remove_file_quietly(os.path.join(BACKUP_FOLDER, file_name + '.sha256'))
+            print(f'오래된 백업 삭제: {file_name}')
+
+class _HashingWriter:
+    """쓰는 바이트를 해시에 함께 반영하는 파일 래퍼"""
+    def __init__(self, fileobj, hasher):
+        self.fileobj = fileobj
+        self.hasher = hasher
+    
+    def write(self, data):
+        self.hasher.update(data)
+        return self.fileobj.write(data)
+    
+    def flush(self):
+        self.fileobj.flush()
 
 def backup_database():
-    """데이터베이스를 백업합니다."""
+    """온라인 백업 API 로 데이터베이스를 백업하고 gzip 압축 + SHA-256 체크섬을 남깁니다.
+    
+    반환값: 백업 정보 dict (실패 시 None)
+    """
+    os.makedirs(BACKUP_FOLDER, exist_ok=True)
+    
+    started_at = datetime.now()
+    file_name = f'{BACKUP_FILE_PREFIX}{started_at.strftime("%Y%m%d_%H%M%S")}{BACKUP_FILE_SUFFIX}'
+    backup_path = os.path.join(BACKUP_FOLDER, file_name)
+    # 작업 파일은 프로세스마다 다른 이름 사용
+    work_suffix = f'.{os.getpid()}.{uuid.uuid4().hex[:8]}'
+    snapshot_path = backup_path + work_suffix + '.snapshot'
+    compressed_path = backup_path + work_suffix + '.tmp'
+    
+    _update_backup_status(running=True, started_at=started_at.isoformat(timespec='seconds'),
+                          finished_at=None, pages_total=0, pages_remaining=0, last_error=None)
+    
+    def progress(status, remaining, total):
+        _update_backup_status(pages_total=total, pages_remaining=remaining)
+    
+    source = None
+    snapshot = None
     try:
-        import shutil
-        from datetime import datetime
-        
-        backup_dir = 'backups'
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+        # 1) 온라인 백업: 페이지 단위로 나눠 복사하고 단계 사이에 쓰기 락을 놓아줌
+        source = sqlite3.connect(DATABASE_FILE, timeout=SQLITE_SETTINGS['busy_timeout'] / 1000)
+        snapshot = sqlite3.connect(snapshot_path)
+        source.backup(snapshot, pages=BACKUP_PAGES_PER_STEP, progress=progress, sleep=BACKUP_STEP_SLEEP)
+        
+        integrity = snapshot.execute('PRAGMA quick_check').fetchone()[0]
+        if integrity != 'ok':
+            raise sqlite3.DatabaseError(f'백업본 무결성 검사 실패: {integrity}')
+        snapshot.close()
+        snapshot = None
+        
+        # 2) 압축 + 체크섬 (압축 파일 기준)
+        hasher = hashlib.sha256()
+        with open(snapshot_path, 'rb') as src, open(compressed_path, 'wb') as raw:
+            with gzip.GzipFile(filename=file_name[:-3], mode='wb', fileobj=_HashingWriter(raw, hasher)) as dst:
+                while True:
+                    block = src.read(UPLOAD_STREAM_BLOCK_SIZE)
+                    if not block:
+                        break
+                    dst.write(block)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(compressed_path, backup_path)
+        
+        checksum = hasher.hexdigest()
+        with open(backup_path + '.sha256', 'w') as checksum_file:
+            checksum_file.write(f'{checksum}  {file_name}\n')
+        
+        backup_info = {
+            'file_name': file_name,
+            'size': os.path.getsize(backup_path),
+            'sha256': checksum,
+            'created_at': started_at.isoformat(timespec='seconds')
+        }
+        print(f'데이터베이스 백업 완료: {backup_path} ({format_file_size(backup_info["size"])})')
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_file = f'{backup_dir}/inquiries_backup_{timestamp}.db'
+        # 3) 보존 정책에 따라 정리
+        rotate_backups()
         
-        shutil.copy2(DATABASE_FILE, backup_file)
-        print(f'데이터베이스 백업 완료: {backup_file}')
-        return True
+        _update_backup_status(last_backup=backup_info)
+        return backup_info
         
     except Exception as e:
         print(f'데이터베이스 백업 실패: {e}')
-        return False
+        _update_backup_status(last_error=str(e))
+        remove_file_quietly(compressed_path)
+        return None
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+        if source is not None:
+            source.close()
+        remove_file_quietly(snapshot_path)
+        _update_backup_status(running=False, finished_at=datetime.now().isoformat(timespec='seconds'))
+
+def acquire_backup_file_lock():
+    """다른 프로세스와 백업이 겹치지 않도록 잠금 파일을 잡습니다. 이미 다른 곳에서 백업 중이면 None.
+    
+    반환된 파일을 닫으면 잠금이 풀립니다.
+    """
+    os.makedirs(BACKUP_FOLDER, exist_ok=True)
+    lock_file = open(os.path.join(BACKUP_FOLDER, BACKUP_LOCK_FILE), 'a')
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+    return lock_file
+
+def backup_is_due():
+    """가장 최근 백업이 주기 백업 간격보다 오래됐으면 True (다른 워커가 이미 백업했으면 False)."""
+    backups = list_backups()
+    if not backups:
+        return True
+    elapsed = (datetime.now() - backups[0][0]).total_seconds()
+    return elapsed >= BACKUP_INTERVAL_HOURS * 3600 * BACKUP_INTERVAL_SLACK
+
+def _run_backup(lock_file):
+    try:
+        backup_database()
+    finally:
+        lock_file.close()
+
+def start_backup(scheduled=False):
+    """백그라운드 스레드에서 백업을 시작합니다. 이미 진행 중이면 (다른 프로세스 포함) False.
+    
+    scheduled=True 이면 가장 최근 백업이 아직 주기 안에 있을 때도 False (건너뜀).
+    """
+    with _backup_lock:
+        if _backup_status['running']:
+            return False
+        lock_file = acquire_backup_file_lock()
+        if lock_file is None:
+            return False
+        # 잠금을 잡은 뒤에 확인해야 다른 워커가 방금 끝낸 백업을 볼 수 있음
+        if scheduled and not backup_is_due():
+            lock_file.close()
+            return False
+        _backup_status['running'] = True
+    threading.Thread(target=_run_backup, args=(lock_file,), name='database-backup', daemon=True).start()
+    return True
+
+def _backup_schedule_loop():
+    """BACKUP_INTERVAL_HOURS 마다 백업합니다 (다른 워커가 이미 백업했으면 건너뜀)."""
+    while True:
+        _backup_schedule_event.wait(BACKUP_INTERVAL_HOURS * 3600)
+        try:
+            start_backup(scheduled=True)
+        except Exception as e:
+            print(f'주기 백업 시작 실패: {e}')
+
+def _ensure_backup_scheduler():
+    """현재 프로세스의 주기 백업 스레드를 시작합니다."""
+    global _backup_scheduler_pid
+    if BACKUP_INTERVAL_HOURS <= 0 or _backup_scheduler_pid == os.getpid():
+        return
+    with _backup_lock:
+        if _backup_scheduler_pid == os.getpid():
+            return
+        _backup_scheduler_pid = os.getpid()
+        threading.Thread(target=_backup_schedule_loop, name='database-backup-scheduler', daemon=True).start()
 
 @app.route('/api/backup-database', methods=['POST'])
 def api_backup_database():
-    """데이터베이스 백업 API"""
+    """데이터베이스 백업 API (백그라운드에서 실행하고 바로 응답)"""
     try:
-        success = backup_database()
-        if success:
-            return jsonify({'success': True, 'message': '데이터베이스 백업이 완료되었습니다.'})
-        else:
-            return jsonify({'success': False, 'error': '데이터베이스 백업에 실패했습니다.'}), 500
+        if not start_backup():
+            return jsonify({'success': False, 'error': '이미 백업이 진행 중입니다.'}), 409
+        return jsonify({'success': True, 'message': '데이터베이스 백업을 시작했습니다.', 'status_url': '/api/backup-status'}), 202
             
     except Exception as e:
         print(f'백업 API 오류: {e}')
         return jsonify({'success': False, 'error': '백업 처리 중 오류가 발생했습니다.'}), 500
 
+@app.route('/api/backup-status', methods=['GET'])
+def api_backup_status():
+    """백업 진행 상태와 보관 중인 백업 목록"""
+    if not verify_metrics_access():
+        return jsonify({'success': False, 'error': '인증에 실패했습니다.'}), 401
+    
+    try:
+        with _backup_lock:
+            status = dict(_backup_status)
+        
+        status['backups'] = [
+            {'file_name': file_name, 'created_at': created_at.isoformat(timespec='seconds'),
+             'size': os.path.getsize(os.path.join(BACKUP_FOLDER, file_name))}
+            for created_at, file_name in list_backups()
+        ]
+        return jsonify({'success': True, 'status': status})
+        
+    except Exception as e:
+        print(f'백업 상태 조회 오류: {e}')
+        return jsonify({'success': False, 'error': '백업 상태 조회 중 오류가 발생했습니다.'}), 500
+
 # 구글 API 관련 함수들은 더 이상 사용하지 않음 (정적 데이터로 대체됨)
 
 def get_company_intro_from_sheets():
     """정적 회사소개 데이터를 반환합니다 (구글시트에서 가져온 데이터 기반)."""
-    print('정적 회사소개 데이터 사용 (구글시트 연결 없음)')
+    log_event('debug', 'static_data', name='company_intro')
     return """㈜한스타는 1994년 8월 열정 가득한 젊은이들이 모여'
 해상운송 및 국제무역 시장을 선도하는 기업'
 '혁신과 자유경쟁을 통한 복합 해양 서비스' 라는
@@ -148,7 +1395,7 @@ def get_company_intro_from_sheets():
 
 def get_company_history_from_sheets():
     """정적 회사연혁 데이터를 반환합니다 (구글시트에서 가져온 데이터 기반)."""
-    print('정적 회사연혁 데이터 사용 (구글시트 연결 없음)')
+    log_event('debug', 'static_data', name='company_history')
     return [
         "1995년07월 : 무역협회(KITA) 가입",
         "1997년10월 : 외항해운대리점면허취득및대리점협회(KOSMA)가입",
@@ -164,7 +1411,7 @@ def get_company_history_from_sheets():
 
 def get_static_menu_data():
     """정적 메뉴 데이터를 반환합니다 (구글시트에서 가져온 데이터 기반)."""
-    print('정적 메뉴 데이터 사용')
+    log_event('debug', 'static_data', name='menu')
     return [
         {
             'main': '한스타소개',
@@ -194,12 +1441,11 @@ def get_static_menu_data():
 
 def get_menu_data_from_sheets():
     """정적 메뉴 데이터를 반환합니다 (구글시트 연결 없음)."""
-    print('정적 메뉴 데이터 사용 (구글시트 연결 없음)')
     return get_static_menu_data()
 
 def get_contact_data_from_sheets():
     """정적 연락처 데이터를 반환합니다 (구글시트에서 가져온 데이터 기반)."""
-    print('정적 연락처 데이터 사용 (구글시트 연결 없음)')
+    log_event('debug', 'static_data', name='contact')
     return [
         "회사명           :   ㈜한스타   /    대표이사       :   정용봉",
         "설립일          :  1994년8월",
@@ -212,7 +1458,7 @@ def get_contact_data_from_sheets():
 
 def get_program_files_from_drive():
     """정적 프로그램 파일 목록을 반환합니다 (구글 드라이브 연결 없음)."""
-    print('정적 프로그램 파일 목록 사용 (구글 드라이브 연결 없음)')
+    log_event('debug', 'static_data', name='program_files')
     return [
         {
             'id': 'sample_file_1',
@@ -240,104 +1486,312 @@ def get_program_files_from_drive():
         }
     ]
 
+# JSON 직렬화
+# orjson 이 설치되어 있으면 사용하고 (선택적 의존성, pip install orjson), 없으면 표준 json 으로 같은 형식을 만듭니다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_json(payload):
+    """payload 를 UTF-8 JSON 바이트로 직렬화합니다."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def json_response(payload, status=200):
+    """dumps_json 으로 직렬화한 JSON 응답"""
+    return app.response_class(dumps_json(payload), status=status, mimetype='application/json')
+
+def iter_json_array(batches):
+    """dict 묶음(리스트)을 차례로 받아 하나의 JSON 배열을 조각 단위로 만듭니다 (전체 배열을 메모리에 만들지 않음)."""
+    yield b'['
+    separator = b''
+    for batch in batches:
+        if batch:
+            yield separator + b','.join(dumps_json(item) for item in batch)
+            separator = b','
+    yield b']'
+
+class RowMapping:
+    """응답 필드와 SELECT 식의 선언적 매핑
+    
+    columns 는 (응답 필드, SELECT 식[, 변환 함수]) 목록입니다. NULL → '' 같은 값 변환은 가능하면
+    SELECT 식에서 처리하므로 대부분의 행은 dict(zip(필드, 행)) 한 번으로 응답 객체가 됩니다.
+    끝에 덧붙은 값(키셋 페이지네이션의 정렬 키 등)은 무시됩니다.
+    """
+    def __init__(self, *columns):
+        self.columns = columns
+        self.fields = tuple(column[0] for column in columns)
+        self.select = ', '.join(expr if expr == field else f'{expr} AS {field}' for field, expr, *_ in columns)
+        self.converters = tuple((column[0], column[2]) for column in columns if len(column) > 2)
+    
+    def to_dict(self, row):
+        record = dict(zip(self.fields, row))
+        for field, convert in self.converters:
+            record[field] = convert(record[field])
+        return record
+    
+    def to_dicts(self, rows):
+        if not self.converters:
+            fields = self.fields
+            return [dict(zip(fields, row)) for row in rows]
+        return [self.to_dict(row) for row in rows]
+    
+    def row_factory(self, cursor, row):
+        """cursor.row_factory 로 지정하면 fetch 결과가 바로 응답 dict 가 됩니다."""
+        return self.to_dict(row)
+
+# 정적 콘텐츠 응답 캐시
+# 메뉴/연락처/회사소개/회사연혁은 배포 시에만 바뀌므로 import 시 한 번만 직렬화(및 gzip 압축)합니다.
+# COLD_START_MODE 에서는 처음 요청된 항목만 그때 직렬화합니다. 어느 쪽이든 SQLite 에는 접근하지 않습니다.
+STATIC_CONTENT_MAX_AGE = int(os.environ.get('STATIC_CONTENT_MAX_AGE', '300'))
+
+def build_static_content(payload):
+    """정적 데이터를 JSON 바이트, gzip 바이트, ETag 로 직렬화합니다."""
+    body = dumps_json(payload)
+    gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+    etag = hashlib.sha256(body).hexdigest()[:32]
+    # 압축 이득이 없으면 원본만 제공
+    return body, (gzip_body if len(gzip_body) < len(body) else None), etag
+
+mark_startup('app_setup')
+
+_static_data = {
+    'menu': get_menu_data_from_sheets(),
+    'contact': get_contact_data_from_sheets(),
+    'company_intro': get_company_intro_from_sheets(),
+    'company_history': get_company_history_from_sheets(),
+}
+
+def get_static_content(name):
+    """직렬화된 정적 콘텐츠 (bootstrap 은 페이지 로딩 시 필요한 네 가지 데이터를 한 번에 제공)"""
+    content = STATIC_CONTENT.get(name)
+    if content is None:
+        content = STATIC_CONTENT[name] = build_static_content(_static_data if name == 'bootstrap' else {name: _static_data[name]})
+    return content
+
+STATIC_CONTENT = {}
+if not COLD_START_MODE:
+    for _name in list(_static_data) + ['bootstrap']:
+        get_static_content(_name)
+
+mark_startup('static_content')
+
+def static_content_response(name):
+    """미리 직렬화된 정적 콘텐츠를 ETag/Cache-Control 과 함께 반환합니다 (If-None-Match 일치 시 304)."""
+    body, gzip_body, etag = get_static_content(name)
+    
+    if gzip_body is not None and request.accept_encodings['gzip']:
+        response = app.response_class(gzip_body, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        # 표현(인코딩)별로 다른 강한 ETag 사용
+        response.set_etag(f'{etag}-gz')
+    else:
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+    
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_CONTENT_MAX_AGE}'
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
+
+def send_file_response(directory, relative_path, accel_prefix, **kwargs):
+    """파일 응답을 생성합니다.
+    
+    Range(206), ETag/Last-Modified 조건부 요청(304)은 send_from_directory(conditional=True)가 처리하고,
+    gunicorn 에서는 wsgi.file_wrapper(sendfile)로 전송됩니다.
+    FILE_OFFLOAD=x-accel-redirect 이면 본문 없이 헤더만 보내고 전송과 Range 처리는 nginx 에 맡깁니다.
+    """
+    response = send_from_directory(directory, relative_path, conditional=True, **kwargs)
+    response.headers.setdefault('Accept-Ranges', 'bytes')
+    
+    if FILE_OFFLOAD == 'x-accel-redirect' and response.status_code in (200, 206):
+        response.close()
+        response.direct_passthrough = False
+        response.status_code = 200
+        response.set_data(b'')
+        for header in ('Content-Length', 'Content-Range'):
+            response.headers.pop(header, None)
+        response.headers['X-Accel-Redirect'] = quote(accel_prefix + relative_path)
+    
+    return response
+
+# 빌드된 정적 파일 (python build_static.py 로 static/dist/ 에 생성)
+# 내용 해시가 붙은 파일(과 ?v=<내용 해시> 로 참조한 이미지/영상)은 1년간 immutable 로 캐시하고,
+# .br/.gz 사전 압축본이 있으면 Accept-Encoding 에 따라 골라서 보냅니다.
+# manifest 가 없으면 (빌드하지 않은 경우) 원본 파일을 그대로 제공합니다.
+# 사전 압축본과 이미지 변형은 저장소에 커밋하지 않으므로, 디스크에 있는 것만 사용합니다.
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+STATIC_ENCODING_SUFFIXES = (('br', '.br'), ('gzip', '.gz'))  # 선호 순서
+
+def load_static_manifest():
+    """static/dist/manifest.json 을 읽습니다 (없거나 원본과 맞지 않으면 빈 dict)."""
+    manifest_path = os.path.join(app.root_path, 'static', 'dist', 'manifest.json')
+    try:
+        with open(manifest_path, encoding='utf-8') as manifest_file:
+            files = json.load(manifest_file).get('files', {})
+        # 빌드 결과는 저장소에 커밋해 배포하므로, JS/CSS/HTML 원본만 고치고 다시 빌드하지 않았으면 원본을 제공
+        for name, entry in files.items():
+            if not name.endswith(('.js', '.css', '.html')) or 'source_hash' not in entry:
+                continue
+            with open(os.path.join(app.root_path, 'static', name), 'rb') as source_file:
+                source_hash = hashlib.sha256(source_file.read()).hexdigest()
+            if not source_hash.startswith(entry['source_hash']):
+                print(f'정적 파일 빌드가 원본과 다릅니다 ({name}). python build_static.py 로 다시 빌드하세요. 원본 파일을 제공합니다.')
+                return {}
+        return files
+    except (OSError, ValueError):
+        return {}
+
+def static_file_exists(path):
+    return os.path.isfile(os.path.join(app.root_path, 'static', path))
+
+def existing_static_variants(variants):
+    """manifest 의 {mimetype: {폭: 경로}} 에서 디스크에 있는 변형만 남깁니다."""
+    existing = {}
+    for mimetype, by_width in variants.items():
+        by_width = {int(width): path for width, path in by_width.items() if static_file_exists(path)}
+        if by_width:
+            existing[mimetype] = by_width
+    return existing
+
+STATIC_MANIFEST = load_static_manifest()
+# 빌드된 경로 -> 사전 압축 인코딩 목록 / 해시가 붙은 경로 집합 / ?v= 로 참조하는 경로 -> 내용 해시
+STATIC_PRECOMPRESSED = {
+    entry['path']: {encoding for encoding, suffix in STATIC_ENCODING_SUFFIXES
+                    if encoding in entry.get('encodings', ()) and static_file_exists(entry['path'] + suffix)}
+    for entry in STATIC_MANIFEST.values()
+}
+STATIC_FINGERPRINTED = {entry['path'] for entry in STATIC_MANIFEST.values() if entry.get('fingerprinted')}
+STATIC_VERSIONS = {entry['path']: entry['version'] for entry in STATIC_MANIFEST.values() if entry.get('version')}
+# 이미지 경로 -> {mimetype: {폭: WebP/AVIF 변형 경로}}
+STATIC_IMAGE_VARIANTS = {
+    entry['path']: existing_static_variants(entry['variants'])
+    for entry in STATIC_MANIFEST.values() if entry.get('variants')
+}
+
+mark_startup('static_manifest')
+
+def send_static_asset(filename):
+    """정적 파일을 제공합니다. 사전 압축본/이미지 변형이 있으면 클라이언트가 받을 수 있는 것을 골라 보냅니다."""
+    encodings = STATIC_PRECOMPRESSED.get(filename)
+    image_variants = STATIC_IMAGE_VARIANTS.get(filename)
+    response = None
+    
+    if image_variants:
+        # 이미지: Accept 에 따라 AVIF/WebP, ?w= 로 축소본 선택
+        variant, mimetype = choose_image_variant(image_variants, request.accept_mimetypes, request.args.get('w', 0, type=int))
+        if variant:
+            response = send_file_response('static', variant, X_ACCEL_STATIC_PREFIX, mimetype=mimetype,
+                                          download_name=os.path.basename(filename) + os.path.splitext(variant)[1])
+    elif encodings:
+        for encoding, suffix in STATIC_ENCODING_SUFFIXES:
+            if encoding in encodings and request.accept_encodings[encoding]:
+                mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                # 저장 시 .gz/.br 이 아닌 원래 이름을 쓰도록
+                response = send_file_response('static', filename + suffix, X_ACCEL_STATIC_PREFIX, mimetype=mimetype,
+                                              download_name=os.path.basename(filename))
+                response.headers['Content-Encoding'] = encoding
+                break
+    
+    if response is None:
+        response = send_file_response('static', filename, X_ACCEL_STATIC_PREFIX)
+    
+    if encodings:
+        response.vary.add('Accept-Encoding')
+    if image_variants:
+        response.vary.add('Accept')
+    if filename in STATIC_FINGERPRINTED or \
+            (filename in STATIC_VERSIONS and request.args.get('v') == STATIC_VERSIONS[filename]):
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_IMMUTABLE_MAX_AGE}, immutable'
+    return response
+
 @app.route('/')
 def index():
-    """메인 페이지를 반환합니다."""
-    return send_from_directory('static', 'index.html')
+    """메인 페이지를 반환합니다 (빌드된 index.html 이 있으면 그것을 사용)."""
+    built_index = STATIC_MANIFEST.get('index.html')
+    if built_index is None:
+        return send_from_directory('static', 'index.html')
+    
+    # 참조하는 파일 이름이 배포마다 바뀌므로 매번 재검증
+    response = send_static_asset(built_index['path'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/static/<path:filename>')
 def static_files(filename):
-    """정적 파일을 제공합니다."""
-    return send_from_directory('static', filename)
+    """정적 파일을 제공합니다 (Range/조건부 요청, 사전 압축본 협상 지원)."""
+    return send_static_asset(filename)
 
 @app.route('/api/menu')
 def get_menu():
     """메뉴 데이터를 JSON으로 반환합니다."""
-    try:
-        menu_data = get_menu_data_from_sheets()
-        return jsonify({'menu': menu_data})
-        
-    except Exception as e:
-        print(f'메뉴 API 오류: {e}')
-        # 오류 발생 시에도 정적 데이터 사용
-        menu_data = get_static_menu_data()
-        return jsonify({'menu': menu_data})
+    return static_content_response('menu')
 
 @app.route('/api/contact')
 def get_contact():
     """연락처 데이터를 JSON으로 반환합니다."""
-    try:
-        contact_data = get_contact_data_from_sheets()
-        return jsonify({'contact': contact_data})
-        
-    except Exception as e:
-        print(f'연락처 API 오류: {e}')
-        return jsonify({'error': '연락처 데이터를 가져올 수 없습니다.'}), 500
+    return static_content_response('contact')
 
 @app.route('/api/company-intro')
 def get_company_intro():
     """회사소개 데이터를 JSON으로 반환합니다."""
-    try:
-        company_intro = get_company_intro_from_sheets()
-        return jsonify({'company_intro': company_intro})
-        
-    except Exception as e:
-        print(f'회사소개 API 오류: {e}')
-        return jsonify({'error': '회사소개 데이터를 가져올 수 없습니다.'}), 500
+    return static_content_response('company_intro')
 
 @app.route('/api/company-history')
 def get_company_history():
     """회사연혁 데이터를 JSON으로 반환합니다."""
-    try:
-        company_history = get_company_history_from_sheets()
-        return jsonify({'company_history': company_history})
-        
-    except Exception as e:
-        print(f'회사연혁 API 오류: {e}')
-        return jsonify({'error': '회사연혁 데이터를 가져올 수 없습니다.'}), 500
+    return static_content_response('company_history')
+
+@app.route('/api/bootstrap')
+def get_bootstrap():
+    """페이지 로딩에 필요한 메뉴/회사소개/회사연혁/연락처 데이터를 한 번에 반환합니다."""
+    return static_content_response('bootstrap')
+
+def insert_inquiry(cursor, inquiry_data, current_date):
+    """일련번호를 발급하고 문의를 저장합니다 (쓰기 스레드의 트랜잭션 안에서 실행)."""
+    # 오늘 날짜의 카운터 증가 (문의 건수와 무관하게 일정한 비용)
+    cursor.execute('''
+        INSERT INTO inquiry_serials (date, last_serial) VALUES (?, 1)
+        ON CONFLICT(date) DO UPDATE SET last_serial = last_serial + 1
+    ''', (current_date,))
+    cursor.execute('SELECT last_serial FROM inquiry_serials WHERE date = ?', (current_date,))
+    today_serial = cursor.fetchone()[0]
+    
+    # 일련번호를 2자리로 포맷팅
+    serial_number = f"{today_serial:02d}"
+    
+    # 데이터베이스에 저장
+    cursor.execute('''
+        INSERT INTO inquiries (date, serial, name, phone, email, message, password)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        current_date,
+        serial_number,
+        inquiry_data['name'],
+        inquiry_data['phone'],
+        inquiry_data['email'],
+        inquiry_data['message'],
+        inquiry_data['password']
+    ))
+    return serial_number
 
 def save_inquiry_to_database(inquiry_data):
-    """문의 데이터를 SQLite 데이터베이스에 저장합니다."""
+    """문의 데이터를 SQLite 데이터베이스에 저장합니다.
+    
+    일련번호 발급과 저장은 쓰기 스레드에서 하나의 트랜잭션으로 처리됩니다 (동시 제출 시 중복 방지).
+    쓰기 큐가 가득 차면 WriteUnavailable 을 그대로 전달합니다.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # 현재 날짜
         current_date = datetime.now().strftime('%Y-%m-%d')
+        serial_number = run_write(insert_inquiry, inquiry_data, current_date)
         
-        # 오늘 날짜의 마지막 일련번호 찾기
-        cursor.execute('''
-            SELECT MAX(CAST(serial AS INTEGER)) 
-            FROM inquiries 
-            WHERE date = ?
-        ''', (current_date,))
-        
-        result = cursor.fetchone()
-        today_serial = 1 if result[0] is None else result[0] + 1
-        
-        # 일련번호를 2자리로 포맷팅
-        serial_number = f"{today_serial:02d}"
-        
-        # 데이터베이스에 저장
-        cursor.execute('''
-            INSERT INTO inquiries (date, serial, name, phone, email, message, password)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            current_date,
-            serial_number,
-            inquiry_data['name'],
-            inquiry_data['phone'],
-            inquiry_data['email'],
-            inquiry_data['message'],
-            inquiry_data['password']
-        ))
-        
-        conn.commit()
-        conn.close()
-        
-        print(f'문의 데이터 저장 성공: {serial_number}')
+        log_event('debug', 'inquiry_saved', serial=serial_number)
         return True, '문의가 성공적으로 등록되었습니다.'
         
+    except WriteUnavailable:
+        raise
     except Exception as e:
         print(f'문의 데이터 저장 실패: {e}')
         return False, f'문의 데이터 저장 실패: {str(e)}'
@@ -362,34 +1816,189 @@ def submit_inquiry():
         else:
             return jsonify({'success': False, 'error': message}), 500
             
+    except WriteUnavailable as e:
+        return write_unavailable_response(e)
     except Exception as e:
         print(f'문의 제출 처리 실패: {e}')
         return jsonify({'success': False, 'error': '문의 제출 처리 중 오류가 발생했습니다.'}), 500
 
+# 키셋(커서) 페이지네이션
+# OFFSET 은 건너뛴 행을 모두 읽으므로, 마지막 행의 정렬 키를 커서로 넘겨 다음 페이지를 바로 찾습니다.
+def encode_cursor(key_values, direction='next', page=None):
+    """정렬 키 값(과 표시용 페이지 번호)을 불투명한 커서 문자열로 인코딩합니다."""
+    payload = {'k': list(key_values), 'd': direction}
+    if page is not None:
+        payload['p'] = page
+    payload = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def load_cursor_payload(token):
+    """커서 문자열의 내용(dict)을 반환합니다. 잘못된 커서는 ValueError."""
+    if not isinstance(token, str):
+        raise ValueError('잘못된 커서입니다.')
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError('잘못된 커서입니다.')
+    if not isinstance(payload, dict):
+        raise ValueError('잘못된 커서입니다.')
+    return payload
+
+def decode_cursor(token, key_count):
+    """커서 문자열을 (방향, 정렬 키 값) 으로 디코딩합니다. 잘못된 커서는 ValueError."""
+    payload = load_cursor_payload(token)
+    direction = payload.get('d')
+    key_values = payload.get('k')
+    if direction not in ('next', 'prev') or not isinstance(key_values, list) or len(key_values) != key_count \
+            or not all(isinstance(value, (str, int, float)) for value in key_values):
+        raise ValueError('잘못된 커서입니다.')
+    return direction, key_values
+
+def cursor_page_number(token):
+    """커서에 담긴 표시용 페이지 번호를 반환합니다 (없으면 None). 잘못된 커서는 ValueError.
+    
+    페이지 번호는 화면 표시에만 쓰이므로, 커서 앞쪽 행을 세지 않고 (O(깊이)) 커서에 실어 보냅니다.
+    """
+    page = load_cursor_payload(token).get('p')
+    if page is None:
+        return None
+    if not isinstance(page, int) or isinstance(page, bool) or page < 1:
+        raise ValueError('잘못된 커서입니다.')
+    return page
+
+def query_keyset_page(cursor, table, columns, key_columns, per_page, page_cursor=None, offset=0,
+                      where=None, where_params=(), page=None):
+    """키셋 방식으로 한 페이지를 조회합니다.
+    
+    key_columns 는 내림차순 정렬 키이며 마지막 키는 고유해야 합니다.
+    where 로 추가 조건을 줄 수 있습니다 (where_params 는 해당 바인딩 값).
+    page 를 주면 다음/이전 커서에 page ± 1 을 표시용 페이지 번호로 담습니다.
+    반환되는 각 행의 끝에는 정렬 키 값이 덧붙여집니다.
+    반환값: (rows, next_cursor, prev_cursor)
+    """
+    key_list = ', '.join(key_columns)
+    conditions = [where] if where else []
+    params = list(where_params)
+    direction = 'next'
+    
+    if page_cursor:
+        direction, key_values = decode_cursor(page_cursor, len(key_columns))
+        operator = '<' if direction == 'next' else '>'
+        placeholders = ', '.join('?' * len(key_columns))
+        conditions.append(f'({key_list}) {operator} ({placeholders})')
+        params.extend(key_values)
+    
+    where_sql = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+    
+    # 이전 페이지는 반대 방향으로 읽은 뒤 뒤집음
+    order = 'DESC' if direction == 'next' else 'ASC'
+    order_sql = ', '.join(f'{column} {order}' for column in key_columns)
+    
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    sql = f'SELECT {columns}, {key_list} FROM {table} {where_sql} ORDER BY {order_sql} LIMIT ?'
+    params.append(per_page + 1)
+    if not page_cursor and offset > 0:
+        sql += ' OFFSET ?'
+        params.append(offset)
+    
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    
+    if direction == 'next':
+        has_next = has_more
+        has_prev = bool(page_cursor) or offset > 0
+    else:
+        rows.reverse()
+        has_next = True
+        has_prev = has_more
+    
+    key_count = len(key_columns)
+    next_page = page + 1 if page is not None else None
+    prev_page = max(page - 1, 1) if page is not None else None
+    next_cursor = encode_cursor(rows[-1][-key_count:], 'next', next_page) if rows and has_next else None
+    prev_cursor = encode_cursor(rows[0][-key_count:], 'prev', prev_page) if rows and has_prev else None
+    return rows, next_cursor, prev_cursor
+
+# 목록 개수 (row_counts 테이블, 트리거가 유지)
+def get_row_counts(cursor, table_name):
+    """{(분류, 상태): 행 수} 를 반환합니다 (분류 순서)."""
+    cursor.execute(
+        'SELECT category, state, row_count FROM row_counts WHERE table_name = ? AND row_count > 0',
+        (table_name,)
+    )
+    return {(category, state): count for category, state, count in cursor.fetchall()}
+
+def get_inquiry_counts(cursor):
+    """문의 전체/답변완료/대기중 개수"""
+    counts = get_row_counts(cursor, 'inquiries')
+    answered = counts.get(('', 'answered'), 0)
+    unanswered = counts.get(('', 'unanswered'), 0)
+    return {'total': answered + unanswered, 'answered': answered, 'unanswered': unanswered}
+
+def get_material_category_counts(cursor, active_only):
+    """분류별 자료 개수 (active_only 면 활성 자료만)"""
+    categories = {}
+    for (category, state), count in get_row_counts(cursor, 'materials').items():
+        if active_only and state != 'active':
+            continue
+        categories[category] = categories.get(category, 0) + count
+    return categories
+
+# 목록 응답 필드 매핑
+INQUIRY_LIST_MAPPING = RowMapping(
+    ('row_id', 'id'),
+    ('date', 'date'),
+    ('serial', 'serial'),
+    ('name', 'name'),
+    ('phone', 'phone'),
+    ('email', 'email'),
+    ('question', 'message'),
+    ('password', 'password'),
+    ('answer', "COALESCE(answer, '')"),
+    ('answer_date', "COALESCE(answer_date, '')"),
+)
+
+ADMIN_INQUIRY_MAPPING = RowMapping(
+    ('id', 'i.id'),
+    ('date', 'i.date'),
+    ('serial', 'i.serial'),
+    ('name', 'i.name'),
+    ('phone', 'i.phone'),
+    ('email', 'i.email'),
+    ('question', 'i.message'),
+    ('answer', "COALESCE(i.answer, '')"),
+    ('answer_date', "COALESCE(i.answer_date, '')"),
+    ('status', "CASE WHEN COALESCE(i.answer, '') != '' THEN '답변완료' ELSE '대기중' END"),
+)
+
 @app.route('/api/inquiry-list')
 def get_inquiry_list():
-    """문의 목록을 가져옵니다 (페이지네이션 지원)."""
+    """문의 목록을 가져옵니다 (페이지 번호 또는 커서 기반 페이지네이션 지원)."""
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # 페이지 파라미터 가져오기
+        # 페이지 파라미터 가져오기 (cursor 가 있으면 page 대신 커서에 담긴 페이지 번호 사용)
         page = request.args.get('page', 1, type=int)
+        page_cursor = request.args.get('cursor', '')
         per_page = 15  # 페이지당 15개 항목
         
         # 전체 문의 수 가져오기
-        cursor.execute('SELECT COUNT(*) FROM inquiries')
-        total_items = cursor.fetchone()[0]
+        total_items = get_inquiry_counts(cursor)['total']
         
         if total_items == 0:
-            conn.close()
             return jsonify({
                 'inquiries': [],
                 'pagination': {
                     'current_page': 1,
                     'total_pages': 0,
                     'total_items': 0,
-                    'per_page': per_page
+                    'per_page': per_page,
+                    'next_cursor': None,
+                    'prev_cursor': None
                 }
             })
         
@@ -399,44 +2008,36 @@ def get_inquiry_list():
         # 페이지 범위 검증
         if page < 1:
             page = 1
-        elif page > total_pages and total_pages > 0:
+        elif page > total_pages and total_pages > 0 and not page_cursor:
             page = total_pages
         
         # 현재 페이지 데이터 가져오기
         offset = (page - 1) * per_page
-        cursor.execute('''
-            SELECT id, date, serial, name, phone, email, message, password, answer, answer_date
-            FROM inquiries 
-            ORDER BY date DESC, serial DESC
-            LIMIT ? OFFSET ?
-        ''', (per_page, offset))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        # 데이터 포맷팅
-        inquiry_data = []
-        for row in rows:
-            inquiry_data.append({
-                'row_id': row[0],  # id
-                'date': row[1],
-                'serial': row[2],
-                'name': row[3],
-                'phone': row[4],
-                'email': row[5],
-                'question': row[6],
-                'password': row[7],
-                'answer': row[8] if row[8] else '',
-                'answer_date': row[9] if row[9] else ''
-            })
+        try:
+            if page_cursor:
+                page = cursor_page_number(page_cursor) or page
+            rows, next_cursor, prev_cursor = query_keyset_page(
+                cursor,
+                'inquiries',
+                INQUIRY_LIST_MAPPING.select,
+                ('date', 'serial', 'id'),
+                per_page,
+                page_cursor=page_cursor,
+                offset=offset,
+                page=page
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        return jsonify({
-            'inquiries': inquiry_data,
+        return json_response({
+            'inquiries': INQUIRY_LIST_MAPPING.to_dicts(rows),
             'pagination': {
                 'current_page': page,
                 'total_pages': total_pages,
                 'total_items': total_items,
-                'per_page': per_page
+                'per_page': per_page,
+                'next_cursor': next_cursor,
+                'prev_cursor': prev_cursor
             }
         })
         
@@ -466,7 +2067,6 @@ def verify_inquiry():
         ''', (inquiry_id,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if not row:
             return jsonify({'success': False, 'error': '해당 문의를 찾을 수 없습니다.'}), 404
@@ -508,9 +2108,11 @@ def get_program_files():
         return jsonify({'error': '파일 목록을 가져오는 중 오류가 발생했습니다.'}), 500
 
 # 관리자 인증 함수
+ADMIN_PASSWORD = "hanstar"
+
 def verify_admin_password(password):
     """관리자 비밀번호를 확인합니다."""
-    return password == "hanstar"
+    return password == ADMIN_PASSWORD
 
 @app.route('/api/admin/inquiry-list', methods=['POST'])
 def admin_get_inquiry_list():
@@ -518,56 +2120,58 @@ def admin_get_inquiry_list():
     try:
         data = request.get_json()
         admin_password = data.get('admin_password')
-        page = int(data.get('page', 1))
+        page_cursor = data.get('cursor') or ''
         per_page = 15
         
         if not verify_admin_password(admin_password):
             return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
         
+        try:
+            page = int(data.get('page', 1))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': '잘못된 페이지 번호입니다.'}), 400
+        if not isinstance(page_cursor, str):
+            return jsonify({'success': False, 'error': '잘못된 커서입니다.'}), 400
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # 전체 문의 수 계산
-        cursor.execute('SELECT COUNT(*) FROM inquiries')
-        total_items = cursor.fetchone()[0]
+        # 전체/답변 상태별 문의 수
+        counts = get_inquiry_counts(cursor)
+        total_items = counts['total']
         total_pages = (total_items + per_page - 1) // per_page
         
-        # 페이지네이션된 문의 목록 가져오기
+        # 페이지네이션된 문의 목록 가져오기 (cursor 가 있으면 키셋 방식, 페이지 번호는 커서에 담긴 값)
+        page = max(page, 1)
         offset = (page - 1) * per_page
-        cursor.execute('''
-            SELECT id, date, serial, name, phone, email, message, answer, answer_date
-            FROM inquiries 
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-        ''', (per_page, offset))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        # 데이터 포맷팅
-        inquiry_data = []
-        for row in rows:
-            inquiry_data.append({
-                'id': row[0],
-                'date': row[1],
-                'serial': row[2],
-                'name': row[3],
-                'phone': row[4],
-                'email': row[5],
-                'question': row[6],
-                'answer': row[7] if row[7] else '',
-                'answer_date': row[8] if row[8] else '',
-                'status': '답변완료' if row[7] else '대기중'
-            })
+        try:
+            if page_cursor:
+                page = cursor_page_number(page_cursor) or page
+            rows, next_cursor, prev_cursor = query_keyset_page(
+                cursor,
+                'inquiries i',
+                ADMIN_INQUIRY_MAPPING.select,
+                ('created_at', 'id'),
+                per_page,
+                page_cursor=page_cursor,
+                offset=offset,
+                page=page
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        return jsonify({
+        return json_response({
             'success': True,
-            'inquiries': inquiry_data,
+            'inquiries': ADMIN_INQUIRY_MAPPING.to_dicts(rows),
             'pagination': {
                 'current_page': page,
                 'total_pages': total_pages,
                 'total_items': total_items,
-                'per_page': per_page
+                'answered_items': counts['answered'],
+                'unanswered_items': counts['unanswered'],
+                'per_page': per_page,
+                'next_cursor': next_cursor,
+                'prev_cursor': prev_cursor
             }
         })
         
@@ -575,6 +2179,15 @@ def admin_get_inquiry_list():
         print(f'관리자 문의 목록 가져오기 실패: {e}')
         return jsonify({'success': False, 'error': '문의 목록을 가져올 수 없습니다.'}), 500
 
+def update_inquiry_answer(cursor, inquiry_id, answer_content, answer_date):
+    """문의에 답변을 저장합니다. 해당 문의가 없으면 False."""
+    cursor.execute('''
+        UPDATE inquiries 
+        SET answer = ?, answer_date = ?
+        WHERE id = ?
+    ''', (answer_content, answer_date, inquiry_id))
+    return cursor.rowcount > 0
+
 @app.route('/api/admin/add-answer', methods=['POST'])
 def admin_add_answer():
     """관리자가 문의에 답변을 등록합니다."""
@@ -590,70 +2203,692 @@ def admin_add_answer():
         if not inquiry_id or not answer_content:
             return jsonify({'success': False, 'error': '문의 ID와 답변 내용이 필요합니다.'}), 400
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # 답변 업데이트
         answer_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute('''
-            UPDATE inquiries 
-            SET answer = ?, answer_date = ?
-            WHERE id = ?
-        ''', (answer_content, answer_date, inquiry_id))
-        
-        if cursor.rowcount == 0:
-            conn.close()
+        if not run_write(update_inquiry_answer, inquiry_id, answer_content, answer_date):
             return jsonify({'success': False, 'error': '해당 문의를 찾을 수 없습니다.'}), 404
         
-        conn.commit()
-        conn.close()
-        
         return jsonify({
             'success': True, 
             'message': '답변이 성공적으로 등록되었습니다.',
             'answer_date': answer_date
         })
         
+    except WriteUnavailable as e:
+        return write_unavailable_response(e)
     except Exception as e:
         print(f'답변 등록 실패: {e}')
         return jsonify({'success': False, 'error': '답변 등록 중 오류가 발생했습니다.'}), 500
 
+# 관리자 실시간 알림 (Server-Sent Events)
+# 새 문의 등록(inquiry_created)과 답변 등록(answer_posted)은 트리거가 change_log 에 기록하고,
+# 각 SSE 연결은 마지막으로 보낸 id 이후의 행을 폴링해 보냅니다. 커밋된 행만 보이므로 어느 워커에서
+# 저장했든 같은 순서로 전달되며, 재연결 시 EventSource 가 보내는 Last-Event-ID 부터 이어서 보냅니다.
+# EventSource 는 헤더를 지정할 수 없으므로 관리자 비밀번호 대신 서명된 단기 토큰을 쿼리로 받습니다.
+# 연결 하나가 워커 전체를 차지하는 동기 워커와 실행 시간 제한이 있는 서버리스 환경에서는 스트림 대신
+# 클라이언트가 같은 엔드포인트를 format=json 으로 주기적으로 조회합니다 (INQUIRY_EVENTS_MODE=auto).
+INQUIRY_EVENTS_MODE = os.environ.get('INQUIRY_EVENTS_MODE', 'auto').lower()  # auto, stream, poll
+INQUIRY_EVENTS_POLL_INTERVAL = float(os.environ.get('INQUIRY_EVENTS_POLL_INTERVAL', 1.0))
+INQUIRY_EVENTS_MAX_SECONDS = float(os.environ.get('INQUIRY_EVENTS_MAX_SECONDS', 60))  # 이후 클라이언트가 재연결
+INQUIRY_EVENTS_CLIENT_POLL_SECONDS = int(os.environ.get('INQUIRY_EVENTS_CLIENT_POLL_SECONDS', 15))
+INQUIRY_EVENTS_KEEPALIVE_SECONDS = 15
+INQUIRY_EVENTS_RETRY_MS = 3000
+INQUIRY_EVENTS_BATCH_SIZE = 100
+INQUIRY_EVENTS_TOKEN_TTL = int(os.environ.get('INQUIRY_EVENTS_TOKEN_TTL', 8 * 3600))
+
+# 토큰 서명 키: SECRET_KEY 환경변수, 없으면 데이터베이스 옆 파일에 한 번 만들어 워커끼리 공유
+SECRET_KEY_FILE = os.environ.get('SECRET_KEY_FILE', os.path.join(os.path.dirname(DATABASE_FILE) or '.', '.secret_key'))
+_secret_key = os.environ.get('SECRET_KEY', '').encode('utf-8') or None
+
+INQUIRY_EVENT_MAPPING = RowMapping(
+    ('event_id', 'c.id'),
+    ('event', 'c.event'),
+    *ADMIN_INQUIRY_MAPPING.columns,
+)
+
+def get_secret_key():
+    """서명용 비밀 키를 반환합니다."""
+    global _secret_key
+    if _secret_key is None:
+        try:
+            with open(SECRET_KEY_FILE, 'rb') as f:
+                _secret_key = f.read()
+        except FileNotFoundError:
+            # 임시 파일에 쓴 뒤 link 로 만들어, 동시에 시작한 워커도 같은 키를 읽음
+            temp_path = f'{SECRET_KEY_FILE}.{uuid.uuid4().hex}.tmp'
+            with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'wb') as f:
+                f.write(base64.urlsafe_b64encode(os.urandom(32)))
+            try:
+                os.link(temp_path, SECRET_KEY_FILE)
+            except FileExistsError:
+                pass
+            finally:
+                os.remove(temp_path)
+            with open(SECRET_KEY_FILE, 'rb') as f:
+                _secret_key = f.read()
+    return _secret_key
+
+def _event_token_signature(expires):
+    key = hmac.new(get_secret_key(), b'inquiry-events', 'sha256').digest()
+    return hmac.new(key, str(expires).encode('ascii'), 'sha256').hexdigest()
+
+def create_event_token():
+    """알림 연결용 토큰 (만료 시각.서명)"""
+    expires = int(time.time()) + INQUIRY_EVENTS_TOKEN_TTL
+    return f'{expires}.{_event_token_signature(expires)}'
+
+def verify_event_token(token):
+    expires, _, signature = (token or '').partition('.')
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _event_token_signature(int(expires)))
+
+def inquiry_events_streamable():
+    """이 서버에서 SSE 연결을 오래 유지해도 되는지 확인합니다.
+    
+    gunicorn sync 워커처럼 요청 하나가 프로세스 전체를 차지하는 서버(wsgi.multithread 가 False)와
+    Vercel 같은 서버리스 함수에서는 False 이며, 클라이언트는 폴링으로 전환합니다.
+    """
+    if INQUIRY_EVENTS_MODE in ('stream', 'poll'):
+        return INQUIRY_EVENTS_MODE == 'stream'
+    return bool(request.environ.get('wsgi.multithread')) and not os.environ.get('VERCEL')
+
+def format_sse(event_id, event, payload):
+    return f'id: {event_id}\nevent: {event}\ndata: '.encode('utf-8') + dumps_json(payload) + b'\n\n'
+
+def get_latest_inquiry_event_id(conn):
+    return conn.execute('SELECT COALESCE(MAX(id), 0) FROM change_log').fetchone()[0]
+
+def fetch_inquiry_events(conn, last_event_id):
+    """last_event_id 이후의 이벤트를 [(이벤트 id, 이벤트 이름, 문의), ...] 로 반환합니다 (최대 INQUIRY_EVENTS_BATCH_SIZE 개)."""
+    rows = conn.execute(f'''
+        SELECT {INQUIRY_EVENT_MAPPING.select}
+        FROM change_log c
+        JOIN inquiries i ON i.id = c.inquiry_id
+        WHERE c.id > ?
+        ORDER BY c.id
+        LIMIT ?
+    ''', (last_event_id, INQUIRY_EVENTS_BATCH_SIZE)).fetchall()
+    return [(record.pop('event_id'), record.pop('event'), record) for record in INQUIRY_EVENT_MAPPING.to_dicts(rows)]
+
+def iter_inquiry_events(last_event_id):
+    """change_log 를 폴링해 SSE 메시지를 만듭니다 (요청 스레드 연결과 별개인 전용 연결 사용)."""
+    conn = sqlite3.connect(DATABASE_FILE)
+    apply_sqlite_settings(conn)
+    try:
+        if last_event_id is None:
+            # 처음 연결하면 지금 이후의 이벤트만 보냄
+            last_event_id = get_latest_inquiry_event_id(conn)
+        yield f'retry: {INQUIRY_EVENTS_RETRY_MS}\n\n'.encode('ascii')
+        
+        started = last_sent = time.monotonic()
+        data_version = None
+        while time.monotonic() - started < INQUIRY_EVENTS_MAX_SECONDS:
+            # data_version 은 다른 연결(다른 워커 포함)이 커밋했을 때만 바뀌므로 변경이 없으면 조회 생략
+            current_version = conn.execute('PRAGMA data_version').fetchone()[0]
+            if current_version != data_version:
+                data_version = current_version
+                events = fetch_inquiry_events(conn, last_event_id)
+                if events:
+                    yield b''.join(
+                        format_sse(event_id, event, {'inquiry': inquiry}) for event_id, event, inquiry in events
+                    )
+                    last_event_id = events[-1][0]
+                    last_sent = time.monotonic()
+                    if len(events) == INQUIRY_EVENTS_BATCH_SIZE:
+                        # 남은 이벤트가 있을 수 있으므로 바로 다시 조회
+                        data_version = None
+                        continue
+            
+            if time.monotonic() - last_sent >= INQUIRY_EVENTS_KEEPALIVE_SECONDS:
+                yield b': keepalive\n\n'
+                last_sent = time.monotonic()
+            time.sleep(INQUIRY_EVENTS_POLL_INTERVAL)
+    finally:
+        conn.close()
+
+@app.route('/api/admin/inquiry-events/token', methods=['POST'])
+def admin_inquiry_events_token():
+    """관리자 알림(SSE) 연결용 토큰을 발급합니다."""
+    data = request.get_json(silent=True) or {}
+    if not verify_admin_password(data.get('admin_password')):
+        return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+    return jsonify({
+        'success': True,
+        'token': create_event_token(),
+        'expires_in': INQUIRY_EVENTS_TOKEN_TTL,
+        # False 이면 EventSource 대신 format=json 으로 poll_interval 초마다 조회
+        'stream': inquiry_events_streamable(),
+        'poll_interval': INQUIRY_EVENTS_CLIENT_POLL_SECONDS
+    })
+
+@app.route('/api/admin/inquiry-events', methods=['GET'])
+def admin_inquiry_events():
+    """새 문의/답변 등록 알림 (text/event-stream, format=json 이면 한 번 조회)
+    
+    쿼리 파라미터: token (필수), last_event_id (Last-Event-ID 헤더가 없을 때 이어받을 위치), format
+    스트림을 유지할 수 없는 서버에서는 204 를 반환합니다 (EventSource 는 재연결하지 않음).
+    """
+    if not verify_event_token(request.args.get('token')):
+        return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    last_event_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    
+    if request.args.get('format') == 'json':
+        conn = get_db_connection()
+        if last_event_id is None:
+            return jsonify({'success': True, 'events': [], 'last_event_id': get_latest_inquiry_event_id(conn)})
+        events = fetch_inquiry_events(conn, last_event_id)
+        return json_response({
+            'success': True,
+            'events': [{'id': event_id, 'event': event, 'inquiry': inquiry} for event_id, event, inquiry in events],
+            'last_event_id': events[-1][0] if events else last_event_id
+        })
+    
+    if not inquiry_events_streamable():
+        return Response(status=204)
+    
+    ensure_database_schema()
+    response = Response(iter_inquiry_events(last_event_id), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # nginx 등 프록시가 응답을 모아서 보내지 않도록
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+# 전문 검색 (FTS5)
+# highlight()/snippet() 표시 문자로 사용자 입력에 나올 일이 없는 사설 영역 문자를 쓰고,
+# HTML 이스케이프 후 <mark> 태그로 바꿉니다.
+SEARCH_PER_PAGE = 15
+SEARCH_MARK_OPEN = '\ue000'
+SEARCH_MARK_CLOSE = '\ue001'
+
+def build_fts_query(text):
+    """검색어를 FTS5 검색식으로 변환합니다 (단어별 접두어 검색, 모든 단어 포함)."""
+    terms = [term.replace('"', '') for term in (text or '').split()]
+    return ' '.join(f'"{term}"*' for term in terms if term)
+
+def render_highlight(text):
+    """highlight()/snippet() 결과를 안전한 HTML(<mark>) 로 변환합니다."""
+    if not text:
+        return ''
+    return html.escape(text).replace(SEARCH_MARK_OPEN, '<mark>').replace(SEARCH_MARK_CLOSE, '</mark>')
+
+def search_pagination(page, total_items):
+    """검색 결과 페이지네이션 정보를 계산합니다."""
+    total_pages = (total_items + SEARCH_PER_PAGE - 1) // SEARCH_PER_PAGE
+    return {
+        'current_page': page,
+        'total_pages': total_pages,
+        'total_items': total_items,
+        'per_page': SEARCH_PER_PAGE
+    }
+
+# 검색 결과: 관리자 문의 목록과 같은 필드 + 하이라이트 (highlight_* 는 nest_highlights 로 묶음)
+INQUIRY_SEARCH_MAPPING = RowMapping(
+    *ADMIN_INQUIRY_MAPPING.columns,
+    ('highlight_name', 'highlight(inquiries_fts, 0, char(57344), char(57345))', render_highlight),
+    ('highlight_email', 'highlight(inquiries_fts, 1, char(57344), char(57345))', render_highlight),
+    ('highlight_phone', 'highlight(inquiries_fts, 2, char(57344), char(57345))', render_highlight),
+    ('highlight_question', "snippet(inquiries_fts, 3, char(57344), char(57345), '…', 24)", render_highlight),
+    ('highlight_answer', "snippet(inquiries_fts, 4, char(57344), char(57345), '…', 24)", render_highlight),
+)
+
+def nest_highlights(records):
+    """highlight_* 필드를 highlight 객체로 묶습니다."""
+    for record in records:
+        record['highlight'] = {
+            field[len('highlight_'):]: record.pop(field)
+            for field in [field for field in record if field.startswith('highlight_')]
+        }
+    return records
+
+@app.route('/api/admin/inquiry-search', methods=['POST'])
+def admin_search_inquiries():
+    """관리자용 문의 전문 검색 (이름/이메일/전화번호/문의내용/답변, 관련도순)"""
+    try:
+        data = request.get_json()
+        admin_password = data.get('admin_password')
+        fts_query = build_fts_query(data.get('q'))
+        page = max(int(data.get('page', 1)), 1)
+        
+        if not verify_admin_password(admin_password):
+            return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+        
+        if not fts_query:
+            return jsonify({'success': False, 'error': '검색어가 필요합니다.'}), 400
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT COUNT(*) FROM inquiries_fts WHERE inquiries_fts MATCH ?', (fts_query,))
+        total_items = cursor.fetchone()[0]
+        
+        # 이름/이메일/전화번호 일치에 가중치를 더 줌
+        cursor.row_factory = INQUIRY_SEARCH_MAPPING.row_factory
+        cursor.execute(f'''
+            SELECT {INQUIRY_SEARCH_MAPPING.select}
+            FROM inquiries_fts
+            JOIN inquiries i ON i.id = inquiries_fts.rowid
+            WHERE inquiries_fts MATCH ?
+            ORDER BY bm25(inquiries_fts, 5.0, 5.0, 5.0, 1.0, 1.0)
+            LIMIT ? OFFSET ?
+        ''', (fts_query, SEARCH_PER_PAGE, (page - 1) * SEARCH_PER_PAGE))
+        
+        return json_response({
+            'success': True,
+            'inquiries': nest_highlights(cursor.fetchall()),
+            'pagination': search_pagination(page, total_items)
+        })
+        
+    except Exception as e:
+        print(f'문의 검색 실패: {e}')
+        return jsonify({'success': False, 'error': '문의 검색 중 오류가 발생했습니다.'}), 500
+
 # 자료 관리 API
+def format_file_size(file_size):
+    """파일 크기를 표시용 문자열로 변환합니다."""
+    return f"{file_size / (1024*1024):.1f} MB" if file_size > 1024*1024 else f"{file_size / 1024:.1f} KB"
+
+def blob_path(content_hash):
+    """내용 해시에 해당하는 저장 경로를 반환합니다 (blobs/ab/abcd...)."""
+    return os.path.join(BLOB_FOLDER, content_hash[:2], content_hash)
+
+def save_stream_to_temp(stream):
+    """업로드 스트림을 임시 파일에 기록하면서 SHA-256 을 계산합니다. (임시 경로, 해시, 크기) 반환"""
+    os.makedirs(PARTIAL_UPLOAD_FOLDER, exist_ok=True)
+    temp_path = os.path.join(PARTIAL_UPLOAD_FOLDER, f'{uuid.uuid4().hex}.tmp')
+    digest = hashlib.sha256()
+    file_size = 0
+    
+    with open(temp_path, 'wb') as temp_file:
+        for block in iter(lambda: stream.read(UPLOAD_STREAM_BLOCK_SIZE), b''):
+            digest.update(block)
+            temp_file.write(block)
+            file_size += len(block)
+    
+    return temp_path, digest.hexdigest(), file_size
+
+def remove_file_quietly(file_path):
+    """파일이 있으면 삭제합니다."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+def store_blob(temp_path, content_hash):
+    """임시 파일을 내용 주소 저장소로 옮깁니다. 같은 내용이 이미 있으면 커밋 후 임시 파일만 삭제합니다.
+    
+    쓰기 스레드의 작업 안에서 호출해야 합니다 (쓰기 잠금이 있어야 collect_blob 과 겹치지 않음).
+    작업이 되돌려지면 옮긴 파일을 임시 경로로 되돌립니다.
+    반환값: 새로 저장했으면 True, 기존 파일을 공유하면 False
+    """
+    path = blob_path(content_hash)
+    if os.path.exists(path):
+        on_write_commit(lambda: remove_file_quietly(temp_path))
+        return False
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(temp_path, path)
+    on_write_rollback(lambda: os.replace(path, temp_path))
+    return True
+
+def release_blob(content_hash):
+    """커밋 후 해당 내용을 참조하는 자료가 더 없으면 파일을 삭제합니다 (쓰기 작업 안에서 호출)."""
+    if content_hash:
+        on_write_commit(lambda: collect_blob(content_hash))
+
+def remove_blob_files(content_hash):
+    """내용 파일과 이미지 변형을 삭제합니다."""
+    remove_file_quietly(blob_path(content_hash))
+    remove_image_variants(blob_path(content_hash), MATERIAL_IMAGE_WIDTHS)
+
+def collect_blob(content_hash):
+    """참조하는 자료가 없으면 파일을 삭제합니다 (쓰기 스레드에서 커밋 후 실행).
+    
+    새 쓰기 잠금(BEGIN IMMEDIATE)을 잡고 확인하므로, 그 사이 다른 프로세스가 같은 파일을
+    다시 참조했다면 남겨둡니다.
+    """
+    conn = _get_thread_connection()
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        cursor.execute('SELECT 1 FROM materials WHERE content_hash = ? LIMIT 1', (content_hash,))
+        if cursor.fetchone() is None:
+            remove_blob_files(content_hash)
+    finally:
+        conn.rollback()
+
+# 고아 파일 정리
+# 디렉터리 탐색은 쓰기 잠금 밖에서 하고, 쓰기 스레드에서는 후보의 참조 여부만 확인해 삭제하므로
+# 저장된 파일 수와 관계없이 쓰기 잠금은 짧게 잡힙니다. 분할 업로드를 시작하면 백그라운드에서
+# ORPHAN_SWEEP_INTERVAL_HOURS 에 한 번씩 실행되고, python app.py sweep-files 로 직접 실행할 수도 있습니다.
+ORPHAN_SWEEP_INTERVAL_HOURS = float(os.environ.get('ORPHAN_SWEEP_INTERVAL_HOURS', '6'))
+ORPHAN_SWEEP_QUERY_BATCH = 500  # IN (...) 한 번에 확인할 후보 수
+
+_orphan_sweep_lock = threading.Lock()
+_orphan_sweep_last = 0.0
+
+def find_orphan_file_candidates():
+    """정리 후보를 찾습니다 (쓰기 잠금 없이 디렉터리만 탐색).
+    
+    반환값: ({내용 해시: [경로, ...]}, {업로드 ID: .part 경로}, [보관 기간이 지난 .tmp 경로])
+    """
+    blobs = {}
+    if os.path.isdir(BLOB_FOLDER):
+        for prefix in os.listdir(BLOB_FOLDER):
+            prefix_folder = os.path.join(BLOB_FOLDER, prefix)
+            if not os.path.isdir(prefix_folder):
+                continue
+            # 변형(<해시>.webp ...)과 변형 생성 임시 파일도 해시로 시작
+            for name in os.listdir(prefix_folder):
+                blobs.setdefault(name.split('.', 1)[0], []).append(os.path.join(prefix_folder, name))
+    
+    parts = {}
+    stale_temp_files = []
+    if os.path.isdir(PARTIAL_UPLOAD_FOLDER):
+        stale_before = time.time() - UPLOAD_SESSION_TTL_HOURS * 3600
+        for name in os.listdir(PARTIAL_UPLOAD_FOLDER):
+            path = os.path.join(PARTIAL_UPLOAD_FOLDER, name)
+            upload_id, extension = os.path.splitext(name)
+            if extension == '.part':
+                parts[upload_id] = path
+            # .tmp 는 진행 중인 일반 업로드일 수 있으므로 보관 기간이 지난 것만 삭제
+            elif extension == '.tmp':
+                try:
+                    if os.path.getmtime(path) < stale_before:
+                        stale_temp_files.append(path)
+                except FileNotFoundError:
+                    pass
+    
+    return blobs, parts, stale_temp_files
+
+def _existing_keys(cursor, sql, keys):
+    """sql 의 IN (...) 자리에 keys 를 나눠 넣어, 데이터베이스에 있는 키 집합을 반환합니다."""
+    keys = list(keys)
+    found = set()
+    for start in range(0, len(keys), ORPHAN_SWEEP_QUERY_BATCH):
+        batch = keys[start:start + ORPHAN_SWEEP_QUERY_BATCH]
+        cursor.execute(sql.format(placeholders=', '.join('?' * len(batch))), batch)
+        found.update(row[0] for row in cursor.fetchall())
+    return found
+
+def remove_orphan_files(cursor, candidates):
+    """후보 중 참조가 없는 파일을 삭제합니다 (쓰기 스레드에서 실행). 삭제한 파일 수 반환
+    
+    쓰기 잠금을 잡은 상태에서 참조를 확인하므로, 후보를 찾은 뒤 등록된 자료/세션의 파일은 남습니다.
+    """
+    blobs, parts, stale_temp_files = candidates
+    referenced = _existing_keys(cursor, 'SELECT content_hash FROM materials WHERE content_hash IN ({placeholders})', blobs)
+    sessions = _existing_keys(cursor, 'SELECT id FROM upload_sessions WHERE id IN ({placeholders})', parts)
+    
+    orphan_paths = [path for content_hash, paths in blobs.items() if content_hash not in referenced for path in paths]
+    orphan_paths += [path for upload_id, path in parts.items() if upload_id not in sessions]
+    orphan_paths += stale_temp_files
+    for path in orphan_paths:
+        remove_file_quietly(path)
+    return len(orphan_paths)
+
+def sweep_orphan_files():
+    """어떤 자료도 참조하지 않는 내용 파일과 세션이 없는 분할 업로드 임시 파일을 삭제합니다. 삭제한 파일 수 반환"""
+    return run_write(remove_orphan_files, find_orphan_file_candidates())
+
+def schedule_orphan_sweep():
+    """마지막 정리 후 ORPHAN_SWEEP_INTERVAL_HOURS 가 지났으면 백그라운드에서 고아 파일을 정리합니다."""
+    global _orphan_sweep_last
+    if ORPHAN_SWEEP_INTERVAL_HOURS <= 0:
+        return False
+    with _orphan_sweep_lock:
+        now = time.monotonic()
+        if _orphan_sweep_last and now - _orphan_sweep_last < ORPHAN_SWEEP_INTERVAL_HOURS * 3600:
+            return False
+        _orphan_sweep_last = now
+    
+    def sweep():
+        try:
+            removed = sweep_orphan_files()
+            if removed:
+                print(f'고아 파일 {removed}개 삭제')
+        except Exception as e:
+            print(f'고아 파일 정리 실패: {e}')
+    
+    threading.Thread(target=sweep, name='orphan-file-sweep', daemon=True).start()
+    return True
+
+# 이미지 자료 변형 (WebP/AVIF, 축소본)
+# 업로드 직후 백그라운드에서 원본 옆(blobs/ab/<해시>.webp, <해시>.w320.webp ...)에 만들고,
+# /api/materials/<id>/image 에서 Accept 와 ?w= 에 맞춰 제공합니다. Pillow 가 없으면 원본을 제공합니다.
+# 요청 처리 중에는 인코딩하지 않으며, 변형이 아직 없으면 백그라운드 작업을 걸고 원본을 제공합니다.
+MATERIAL_IMAGE_WIDTHS = (320, 960)
+MATERIAL_THUMBNAIL_WIDTH = 320
+MATERIAL_IMAGE_MAX_AGE = 3600
+
+_image_variant_jobs = set()
+_image_variant_jobs_lock = threading.Lock()
+
+def create_material_image_variants(content_hash):
+    """이미지 자료의 변형을 만듭니다 (실패해도 원본 제공에는 영향 없음).
+    
+    만들 변형이 없거나 이미지를 읽을 수 없으면 표시 파일을 남겨 다시 시도하지 않습니다.
+    """
+    path = blob_path(content_hash)
+    try:
+        variants = generate_image_variants(path, path, MATERIAL_IMAGE_WIDTHS)
+    except Exception as e:
+        print(f'이미지 변형 생성 실패: {content_hash} ({e})')
+        variants = {}
+    finally:
+        with _image_variant_jobs_lock:
+            _image_variant_jobs.discard(content_hash)
+    
+    if not variants and os.path.exists(path):
+        try:
+            mark_no_variants(path)
+        except OSError as e:
+            print(f'이미지 변형 표시 파일 생성 실패: {content_hash} ({e})')
+    return variants
+
+def schedule_material_image_variants(content_hash, file_name):
+    """이미지 자료라면 백그라운드에서 변형을 만듭니다 (같은 파일의 작업이 진행 중이면 무시). 작업을 걸었으면 True"""
+    if not (image_variants_available() and is_image_file(file_name)):
+        return False
+    with _image_variant_jobs_lock:
+        if content_hash in _image_variant_jobs:
+            return True
+        _image_variant_jobs.add(content_hash)
+    threading.Thread(target=create_material_image_variants, args=(content_hash,),
+                     name='image-variants', daemon=True).start()
+    return True
+
+def insert_material(cursor, title, description, file_name, content_hash, file_size_str, file_type, category):
+    """자료 정보를 materials 테이블에 저장합니다 (커밋은 호출자가 수행)."""
+    cursor.execute('''
+        INSERT INTO materials (title, description, file_name, file_path, file_size, file_type, category, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        title,
+        description,
+        file_name,
+        f'/tmp/uploads/blobs/{content_hash[:2]}/{content_hash}',
+        file_size_str,
+        file_type,
+        category,
+        content_hash
+    ))
+    return cursor.lastrowid
+
+def register_material(cursor, temp_path, content_hash, title, description, file_name, file_size_str, file_type, category,
+                      upload_id=None):
+    """파일을 내용 주소 저장소로 옮기고 자료를 등록합니다 (쓰기 스레드의 트랜잭션 안에서 실행).
+    
+    등록이 실패하거나 커밋되지 않으면 파일은 temp_path 로 되돌아갑니다.
+    반환값: 새로 저장한 파일이면 True, 같은 내용의 기존 파일을 공유하면 False
+    """
+    is_new_blob = store_blob(temp_path, content_hash)
+    insert_material(cursor, title, description, file_name, content_hash, file_size_str, file_type, category)
+    if upload_id:
+        delete_upload_session(cursor, upload_id)
+    return is_new_blob
+
+def update_material(cursor, material_id, title, description, category, is_active):
+    """자료 정보를 수정합니다. 해당 자료가 없으면 False."""
+    cursor.execute('''
+        UPDATE materials 
+        SET title = ?, description = ?, category = ?, is_active = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    ''', (title, description, category, is_active, material_id))
+    return cursor.rowcount > 0
+
+def delete_material(cursor, material_id):
+    """자료를 삭제하고 마지막 참조였다면 커밋 후 파일도 삭제합니다. 해당 자료가 없으면 False."""
+    cursor.execute('SELECT content_hash FROM materials WHERE id = ?', (material_id,))
+    row = cursor.fetchone()
+    if not row:
+        return False
+    
+    cursor.execute('DELETE FROM materials WHERE id = ?', (material_id,))
+    release_blob(row[0])
+    return True
+
+# 자료 목록 캐시
+# 직렬화된 목록을 프로세스 메모리에 두고, cache_generations 의 세대 번호(자료 테이블 트리거가 증가)가
+# 바뀌면 다시 만듭니다. 세대 번호는 SQLite 에 있으므로 다른 워커의 변경도 바로 반영됩니다.
+# download_count 변경은 세대 번호를 올리지 않으므로, 캐시된 목록은 MATERIALS_CACHE_MAX_AGE 초가 지나면 다시 만듭니다.
+MATERIALS_CACHE_MAX_ENTRIES = 64
+MATERIALS_CACHE_MAX_AGE = float(os.environ.get('MATERIALS_CACHE_MAX_AGE', '30'))
+
+_materials_cache = {}
+_materials_cache_lock = threading.Lock()
+materials_cache_stats = {'hits': 0, 'misses': 0}
+
+def get_materials_generation(cursor):
+    """자료 목록의 현재 세대 번호를 반환합니다."""
+    cursor.execute("SELECT generation FROM cache_generations WHERE name = 'materials'")
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+def cached_materials_response(cursor, cache_key, build_payload):
+    """세대 번호가 같으면 캐시된 목록을, 다르면 build_payload() 결과를 직렬화해 반환합니다."""
+    # 세대 번호를 먼저 읽으므로, 그 사이 변경이 생겨도 더 새로운 데이터가 이전 번호로 저장될 뿐 (다음 요청에서 갱신)
+    generation = get_materials_generation(cursor)
+    
+    with _materials_cache_lock:
+        entry = _materials_cache.get(cache_key)
+        if entry is not None and entry[0] == generation and time.monotonic() - entry[2] < MATERIALS_CACHE_MAX_AGE:
+            materials_cache_stats['hits'] += 1
+            return app.response_class(entry[1], mimetype='application/json')
+        materials_cache_stats['misses'] += 1
+    
+    body = dumps_json(build_payload())
+    
+    with _materials_cache_lock:
+        if len(_materials_cache) >= MATERIALS_CACHE_MAX_ENTRIES:
+            _materials_cache.clear()
+        _materials_cache[cache_key] = (generation, body, time.monotonic())
+    
+    return app.response_class(body, mimetype='application/json')
+
+# 자료 목록 페이지네이션 / 필드 선택
+# limit 과 cursor((created_at, id) 키셋)로 나누어 조회하고, fields= 로 필요한 필드만 받을 수 있습니다.
+MATERIALS_PAGE_DEFAULT_LIMIT = 50
+MATERIALS_PAGE_MAX_LIMIT = 200
+PUBLIC_MATERIAL_FIELDS = ('id', 'title', 'description', 'file_name', 'file_size', 'file_type',
+                          'category', 'download_count', 'created_at')
+ADMIN_MATERIAL_FIELDS = PUBLIC_MATERIAL_FIELDS + ('is_active',)
+MATERIAL_COLUMNS = {field: (field, field) for field in ADMIN_MATERIAL_FIELDS}
+MATERIAL_COLUMNS['is_active'] = ('is_active', 'is_active', bool)
+
+def parse_materials_list_args(allowed_fields):
+    """limit/cursor/fields 파라미터를 검증해 (limit, cursor, fields) 로 반환합니다. 잘못된 값은 ValueError."""
+    limit = request.args.get('limit', MATERIALS_PAGE_DEFAULT_LIMIT, type=int)
+    limit = min(max(limit, 1), MATERIALS_PAGE_MAX_LIMIT)
+    
+    page_cursor = request.args.get('cursor', '')
+    if page_cursor:
+        decode_cursor(page_cursor, 2)
+    
+    fields_param = request.args.get('fields', '')
+    if not fields_param:
+        return limit, page_cursor, allowed_fields
+    
+    fields = [field.strip() for field in fields_param.split(',') if field.strip()]
+    unknown_fields = [field for field in fields if field not in allowed_fields]
+    if unknown_fields:
+        raise ValueError(f'알 수 없는 필드입니다: {", ".join(unknown_fields)}')
+    
+    # id 는 항상 포함 (다운로드/수정 등에 필요)
+    if 'id' not in fields:
+        fields.insert(0, 'id')
+    return limit, page_cursor, tuple(fields)
+
+def query_materials_page(cursor, fields, limit, page_cursor, where, where_params, active_only):
+    """자료 목록 한 페이지와 카테고리별 개수 요약을 조회해 응답 payload 로 반환합니다."""
+    mapping = RowMapping(*(MATERIAL_COLUMNS[field] for field in fields))
+    rows, next_cursor, prev_cursor = query_keyset_page(
+        cursor,
+        'materials',
+        mapping.select,
+        ('created_at', 'id'),
+        limit,
+        page_cursor=page_cursor,
+        where=where,
+        where_params=where_params
+    )
+    
+    materials = mapping.to_dicts(rows)
+    if 'file_name' in fields:
+        for material in materials:
+            if is_image_file(material['file_name']):
+                material['thumbnail_url'] = f'/api/materials/{material["id"]}/image?w={MATERIAL_THUMBNAIL_WIDTH}'
+    
+    # 카테고리별 개수 (row_counts 카운터)
+    categories = get_material_category_counts(cursor, active_only)
+    
+    return {
+        'success': True,
+        'materials': materials,
+        'categories': categories,
+        'pagination': {
+            'limit': limit,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        }
+    }
+
+@app.route('/api/admin/cache-stats', methods=['GET'])
+def admin_cache_stats():
+    """자료 목록 캐시 적중/실패 통계 (현재 워커 기준)"""
+    if not verify_admin_password(request.headers.get('X-Admin-Password')):
+        return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+    
+    with _materials_cache_lock:
+        stats = dict(materials_cache_stats)
+        stats['entries'] = len(_materials_cache)
+    stats['generation'] = get_materials_generation(get_db_connection().cursor())
+    stats['pid'] = os.getpid()
+    
+    return jsonify({'success': True, 'materials': stats})
+
 @app.route('/api/admin/materials', methods=['GET', 'POST'])
 def admin_materials():
     """관리자용 자료 목록 조회 및 등록"""
     try:
         if request.method == 'GET':
-            # 자료 목록 조회
+            # 자료 목록 조회 (limit/cursor 페이지네이션, fields 필드 선택)
+            try:
+                limit, page_cursor, fields = parse_materials_list_args(ADMIN_MATERIAL_FIELDS)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            
             conn = get_db_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT id, title, description, file_name, file_size, file_type, category, 
-                       download_count, is_active, created_at
-                FROM materials 
-                ORDER BY created_at DESC
-            ''')
-            
-            rows = cursor.fetchall()
-            conn.close()
+            def build_payload():
+                payload = query_materials_page(cursor, fields, limit, page_cursor, None, (), False)
+                payload['pagination']['total_items'] = sum(payload['categories'].values())
+                return payload
             
-            materials = []
-            for row in rows:
-                materials.append({
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'file_name': row[3],
-                    'file_size': row[4],
-                    'file_type': row[5],
-                    'category': row[6],
-                    'download_count': row[7],
-                    'is_active': bool(row[8]),
-                    'created_at': row[9]
-                })
-            
-            return jsonify({'success': True, 'materials': materials})
+            return cached_materials_response(cursor, ('admin', limit, page_cursor, fields), build_payload)
             
         elif request.method == 'POST':
             # 새 자료 등록 (파일 업로드 포함)
@@ -679,52 +2914,42 @@ def admin_materials():
                     return jsonify({'success': False, 'error': '파일이 선택되지 않았습니다.'}), 400
                 
                 if file and allowed_file(file.filename):
-                    filename = secure_filename(file.filename)
-                    
-                    # 파일명 중복 방지
-                    base_name = filename.rsplit('.', 1)[0]
-                    extension = filename.rsplit('.', 1)[1]
-                    counter = 1
-                    original_filename = filename
-                    
-                    while os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], filename)):
-                        filename = f"{base_name}_{counter}.{extension}"
-                        counter += 1
+                    original_filename = secure_filename(file.filename)
                     
-                    # 파일 저장
-                    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                    file.save(file_path)
+                    # 파일 저장 (해시 계산과 동시에 임시 파일로 기록)
+                    temp_path, content_hash, file_size = save_stream_to_temp(file.stream)
                     
                     # 파일 정보 추출
-                    file_size = os.path.getsize(file_path)
-                    file_size_str = f"{file_size / (1024*1024):.1f} MB" if file_size > 1024*1024 else f"{file_size / 1024:.1f} KB"
+                    file_size_str = format_file_size(file_size)
                     file_type = file.content_type or 'application/octet-stream'
                     
-                    # 데이터베이스에 저장
-                    conn = get_db_connection()
-                    cursor = conn.cursor()
+                    # 데이터베이스에 저장 (같은 내용의 파일이 있으면 공유)
+                    try:
+                        is_new_blob = run_write(register_material, temp_path, content_hash, title, description,
+                                                original_filename, file_size_str, file_type, category)
+                    except Exception:
+                        remove_file_quietly(temp_path)
+                        raise
                     
-                    cursor.execute('''
-                        INSERT INTO materials (title, description, file_name, file_path, file_size, file_type, category)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (title, description, original_filename, f'/tmp/uploads/{filename}', file_size_str, file_type, category))
-                    
-                    conn.commit()
-                    conn.close()
+                    if is_new_blob:
+                        schedule_material_image_variants(content_hash, original_filename)
                     
                     return jsonify({
                         'success': True, 
                         'message': '자료가 성공적으로 등록되었습니다.',
                         'file_info': {
                             'original_name': original_filename,
-                            'saved_name': filename,
+                            'saved_name': content_hash,
                             'size': file_size_str,
-                            'type': file_type
+                            'type': file_type,
+                            'deduplicated': not is_new_blob
                         }
                     })
                 else:
                     return jsonify({'success': False, 'error': '허용되지 않는 파일 형식입니다.'}), 400
                     
+            except WriteUnavailable as e:
+                return write_unavailable_response(e)
             except Exception as e:
                 print(f'파일 업로드 오류: {e}')
                 return jsonify({'success': False, 'error': '파일 업로드 중 오류가 발생했습니다.'}), 500
@@ -733,63 +2958,446 @@ def admin_materials():
         print(f'자료 관리 API 오류: {e}')
         return jsonify({'success': False, 'error': '자료 관리 중 오류가 발생했습니다.'}), 500
 
+# 분할(청크) 업로드 API
+# init → 청크 전송(PUT, offset 지정) 반복 → commit 순서로 진행합니다.
+# 청크는 받는 즉시 디스크에 기록되므로 파일 전체를 메모리에 올리지 않으며,
+# 연결이 끊기면 GET 으로 서버에 저장된 위치(offset)를 확인하고 이어서 전송할 수 있습니다.
+
+def partial_upload_path(upload_id):
+    """업로드 세션의 임시 파일 경로를 반환합니다."""
+    return os.path.join(PARTIAL_UPLOAD_FOLDER, f'{upload_id}.part')
+
+def get_upload_session(cursor, upload_id):
+    """업로드 세션 정보를 (file_name, file_size, file_type) 로 반환합니다 (없으면 None)."""
+    cursor.execute('SELECT file_name, file_size, file_type FROM upload_sessions WHERE id = ?', (upload_id,))
+    return cursor.fetchone()
+
+def delete_upload_session(cursor, upload_id):
+    """업로드 세션을 삭제하고 커밋 후 임시 파일도 삭제합니다 (쓰기 스레드에서 실행)."""
+    cursor.execute('DELETE FROM upload_sessions WHERE id = ?', (upload_id,))
+    part_path = partial_upload_path(upload_id)
+    on_write_commit(lambda: remove_file_quietly(part_path))
+
+def create_upload_session(cursor, file_name, file_size, file_type):
+    """오래된 세션을 정리하고 새 업로드 세션과 빈 임시 파일을 만듭니다. 세션 ID 반환"""
+    cleanup_stale_upload_sessions(cursor)
+    
+    upload_id = uuid.uuid4().hex
+    os.makedirs(PARTIAL_UPLOAD_FOLDER, exist_ok=True)
+    open(partial_upload_path(upload_id), 'wb').close()
+    
+    cursor.execute('''
+        INSERT INTO upload_sessions (id, file_name, file_size, file_type)
+        VALUES (?, ?, ?, ?)
+    ''', (upload_id, file_name, file_size, file_type))
+    return upload_id
+
+def cleanup_stale_upload_sessions(cursor):
+    """보관 기간이 지난 미완료 업로드 세션을 정리합니다."""
+    cursor.execute('''
+        SELECT id FROM upload_sessions
+        WHERE created_at < datetime('now', ?)
+    ''', (f'-{UPLOAD_SESSION_TTL_HOURS} hours',))
+    for (upload_id,) in cursor.fetchall():
+        delete_upload_session(cursor, upload_id)
+
+def is_sha256_hex(value):
+    """16진수 SHA-256 문자열인지 확인합니다."""
+    return len(value) == 64 and all(char in '0123456789abcdef' for char in value)
+
+def file_sha256(file_path):
+    """파일의 SHA-256 을 블록 단위로 계산합니다."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+@app.route('/api/admin/uploads', methods=['POST'])
+def admin_init_upload():
+    """분할 업로드 세션을 생성합니다."""
+    try:
+        data = request.get_json()
+        admin_password = data.get('admin_password')
+        
+        if not verify_admin_password(admin_password):
+            return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+        
+        file_name = secure_filename(data.get('file_name') or '')
+        try:
+            file_size = int(data.get('file_size', 0))
+        except (TypeError, ValueError):
+            file_size = 0
+        
+        if not file_name or not allowed_file(file_name):
+            return jsonify({'success': False, 'error': '허용되지 않는 파일 형식입니다.'}), 400
+        
+        if file_size <= 0:
+            return jsonify({'success': False, 'error': '파일 크기가 올바르지 않습니다.'}), 400
+        
+        if file_size > CHUNKED_UPLOAD_MAX_SIZE:
+            return jsonify({'success': False, 'error': '허용된 최대 파일 크기를 초과했습니다.'}), 413
+        
+        upload_id = run_write(create_upload_session, file_name, file_size,
+                              data.get('file_type') or 'application/octet-stream')
+        # 중단된 업로드 등으로 남은 파일 정리 (주기 제한, 백그라운드)
+        schedule_orphan_sweep()
+        
+        return jsonify({
+            'success': True,
+            'upload_id': upload_id,
+            'chunk_size': UPLOAD_CHUNK_SIZE,
+            'offset': 0
+        })
+        
+    except WriteUnavailable as e:
+        return write_unavailable_response(e)
+    except Exception as e:
+        print(f'분할 업로드 생성 오류: {e}')
+        return jsonify({'success': False, 'error': '업로드 준비 중 오류가 발생했습니다.'}), 500
+
+@app.route('/api/admin/uploads/<upload_id>', methods=['GET', 'PUT', 'DELETE'])
+def admin_upload_chunk(upload_id):
+    """분할 업로드 상태 조회(GET), 청크 추가(PUT), 취소(DELETE)"""
+    try:
+        if not verify_admin_password(request.headers.get('X-Admin-Password')):
+            return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        session = get_upload_session(cursor, upload_id)
+        part_path = partial_upload_path(upload_id)
+        if not session or not os.path.exists(part_path):
+            return jsonify({'success': False, 'error': '업로드 세션을 찾을 수 없습니다.'}), 404
+        
+        file_name, file_size, file_type = session
+        
+        if request.method == 'GET':
+            return jsonify({
+                'success': True,
+                'upload_id': upload_id,
+                'file_name': file_name,
+                'file_size': file_size,
+                'offset': os.path.getsize(part_path)
+            })
+        
+        if request.method == 'DELETE':
+            run_write(delete_upload_session, upload_id)
+            return jsonify({'success': True, 'message': '업로드가 취소되었습니다.'})
+        
+        # PUT: 요청 본문을 지정된 위치에 그대로 이어 씀 (X-Chunk-Sha256 으로 청크 단위 검증)
+        offset = request.args.get('offset', -1, type=int)
+        expected_chunk_sha256 = (request.headers.get('X-Chunk-Sha256') or '').lower()
+        if not is_sha256_hex(expected_chunk_sha256):
+            return jsonify({'success': False, 'error': '청크 체크섬(X-Chunk-Sha256)이 필요합니다.'}), 400
+        
+        with open(part_path, 'r+b') as part_file:
+            # 같은 세션에 대한 동시 전송 방지
+            if fcntl is not None:
+                try:
+                    fcntl.flock(part_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return jsonify({'success': False, 'error': '다른 청크를 전송 중입니다.'}), 409
+            
+            current_offset = os.fstat(part_file.fileno()).st_size
+            if offset != current_offset:
+                # 클라이언트는 반환된 offset 부터 다시 전송
+                return jsonify({'success': False, 'error': '전송 위치가 일치하지 않습니다.', 'offset': current_offset}), 409
+            
+            part_file.seek(current_offset)
+            remaining = file_size - current_offset
+            written = 0
+            digest = hashlib.sha256()
+            try:
+                while True:
+                    block = request.stream.read(UPLOAD_STREAM_BLOCK_SIZE)
+                    if not block:
+                        break
+                    digest.update(block)
+                    written += len(block)
+                    if written > remaining:
+                        part_file.truncate(current_offset)
+                        return jsonify({
+                            'success': False,
+                            'error': '선언된 파일 크기를 초과했습니다.',
+                            'offset': current_offset
+                        }), 413
+                    part_file.write(block)
+            except ClientDisconnected:
+                # 일부만 받은 청크는 검증할 수 없으므로 버리고, 클라이언트가 GET 으로 위치를 확인해 청크를 다시 전송
+                part_file.truncate(current_offset)
+                print(f'분할 업로드 연결 끊김: {upload_id} ({current_offset} bytes 유지)')
+                return jsonify({'success': False, 'error': '전송이 중단되었습니다.', 'offset': current_offset}), 400
+            
+            if digest.hexdigest() != expected_chunk_sha256:
+                part_file.truncate(current_offset)
+                return jsonify({
+                    'success': False,
+                    'error': '청크 체크섬이 일치하지 않습니다.',
+                    'offset': current_offset
+                }), 422
+            
+            part_file.flush()
+        
+        return jsonify({'success': True, 'offset': current_offset + written, 'file_size': file_size})
+        
+    except WriteUnavailable as e:
+        return write_unavailable_response(e)
+    except Exception as e:
+        print(f'분할 업로드 처리 오류: {e}')
+        return jsonify({'success': False, 'error': '업로드 처리 중 오류가 발생했습니다.'}), 500
+
+@app.route('/api/admin/uploads/<upload_id>/commit', methods=['POST'])
+def admin_commit_upload(upload_id):
+    """전송이 끝난 분할 업로드를 검증하고 자료로 등록합니다."""
+    try:
+        data = request.get_json()
+        admin_password = data.get('admin_password')
+        
+        if not verify_admin_password(admin_password):
+            return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+        
+        title = data.get('title')
+        description = data.get('description', '')
+        category = data.get('category', '기타')
+        expected_sha256 = (data.get('sha256') or '').lower()
+        
+        if not title:
+            return jsonify({'success': False, 'error': '제목은 필수입니다.'}), 400
+        
+        if not is_sha256_hex(expected_sha256):
+            return jsonify({'success': False, 'error': '파일 체크섬(sha256)이 필요합니다.'}), 400
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        session = get_upload_session(cursor, upload_id)
+        part_path = partial_upload_path(upload_id)
+        if not session or not os.path.exists(part_path):
+            return jsonify({'success': False, 'error': '업로드 세션을 찾을 수 없습니다.'}), 404
+        
+        file_name, file_size, file_type = session
+        received = os.path.getsize(part_path)
+        if received != file_size:
+            return jsonify({
+                'success': False,
+                'error': '파일이 모두 전송되지 않았습니다.',
+                'offset': received
+            }), 409
+        
+        # 전체 파일 체크섬 검증 (청크 검증 후에도 순서/누락 오류를 확인)
+        actual_sha256 = file_sha256(part_path)
+        if expected_sha256 != actual_sha256:
+            run_write(delete_upload_session, upload_id)
+            return jsonify({'success': False, 'error': '파일 체크섬이 일치하지 않습니다. 다시 업로드해주세요.'}), 422
+        
+        # 임시 파일을 내용 주소 저장소로 이동 (같은 파일시스템이므로 복사 없음, 같은 내용이 있으면 공유)
+        file_size_str = format_file_size(file_size)
+        is_new_blob = run_write(register_material, part_path, actual_sha256, title, description,
+                                file_name, file_size_str, file_type, category, upload_id)
+        
+        if is_new_blob:
+            schedule_material_image_variants(actual_sha256, file_name)
+        
+        return jsonify({
+            'success': True,
+            'message': '자료가 성공적으로 등록되었습니다.',
+            'file_info': {
+                'original_name': file_name,
+                'saved_name': actual_sha256,
+                'size': file_size_str,
+                'type': file_type,
+                'sha256': actual_sha256,
+                'deduplicated': not is_new_blob
+            }
+        })
+        
+    except WriteUnavailable as e:
+        return write_unavailable_response(e)
+    except Exception as e:
+        print(f'분할 업로드 완료 처리 오류: {e}')
+        return jsonify({'success': False, 'error': '업로드 완료 처리 중 오류가 발생했습니다.'}), 500
+
 @app.route('/api/materials', methods=['GET'])
 def get_materials():
-    """사용자용 자료 목록 조회"""
+    """사용자용 자료 목록 조회 (limit/cursor 페이지네이션, fields 필드 선택, 카테고리별 개수)"""
     try:
         category = request.args.get('category', '')
         
+        try:
+            limit, page_cursor, fields = parse_materials_list_args(PUBLIC_MATERIAL_FIELDS)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        if category:
-            cursor.execute('''
-                SELECT id, title, description, file_name, file_size, file_type, category, download_count, created_at
-                FROM materials 
-                WHERE category = ? AND is_active = 1
-                ORDER BY created_at DESC
-            ''', (category,))
-        else:
-            cursor.execute('''
-                SELECT id, title, description, file_name, file_size, file_type, category, download_count, created_at
-                FROM materials 
-                WHERE is_active = 1
-                ORDER BY created_at DESC
-            ''')
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        materials = []
-        for row in rows:
-            materials.append({
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'file_name': row[3],
-                'file_size': row[4],
-                'file_type': row[5],
-                'category': row[6],
-                'download_count': row[7],
-                'created_at': row[8]
-            })
+        def build_payload():
+            if category:
+                where, where_params = 'category = ? AND is_active = 1', (category,)
+            else:
+                where, where_params = 'is_active = 1', ()
+            
+            payload = query_materials_page(cursor, fields, limit, page_cursor, where, where_params, True)
+            categories = payload['categories']
+            payload['pagination']['total_items'] = categories.get(category, 0) if category else sum(categories.values())
+            return payload
         
-        return jsonify({'success': True, 'materials': materials})
+        return cached_materials_response(cursor, ('public', category, limit, page_cursor, fields), build_payload)
         
     except Exception as e:
         print(f'자료 목록 조회 오류: {e}')
         return jsonify({'success': False, 'error': '자료 목록을 가져올 수 없습니다.'}), 500
 
+MATERIAL_SEARCH_MAPPING = RowMapping(
+    *((field, f'm.{field}') for field in PUBLIC_MATERIAL_FIELDS),
+    ('highlight_title', 'highlight(materials_fts, 0, char(57344), char(57345))', render_highlight),
+    ('highlight_description', "snippet(materials_fts, 1, char(57344), char(57345), '…', 24)", render_highlight),
+    ('highlight_file_name', 'highlight(materials_fts, 2, char(57344), char(57345))', render_highlight),
+)
+
+@app.route('/api/materials/search', methods=['GET'])
+def search_materials():
+    """사용자용 자료 전문 검색 (제목/설명/파일명, 관련도순)"""
+    try:
+        fts_query = build_fts_query(request.args.get('q', ''))
+        category = request.args.get('category', '')
+        page = max(request.args.get('page', 1, type=int), 1)
+        
+        if not fts_query:
+            return jsonify({'success': False, 'error': '검색어가 필요합니다.'}), 400
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        where_sql = 'materials_fts MATCH ? AND m.is_active = 1'
+        params = [fts_query]
+        if category:
+            where_sql += ' AND m.category = ?'
+            params.append(category)
+        
+        cursor.execute(f'''
+            SELECT COUNT(*)
+            FROM materials_fts
+            JOIN materials m ON m.id = materials_fts.rowid
+            WHERE {where_sql}
+        ''', params)
+        total_items = cursor.fetchone()[0]
+        
+        # 제목 일치에 가중치를 더 줌
+        cursor.row_factory = MATERIAL_SEARCH_MAPPING.row_factory
+        cursor.execute(f'''
+            SELECT {MATERIAL_SEARCH_MAPPING.select}
+            FROM materials_fts
+            JOIN materials m ON m.id = materials_fts.rowid
+            WHERE {where_sql}
+            ORDER BY bm25(materials_fts, 10.0, 1.0, 3.0)
+            LIMIT ? OFFSET ?
+        ''', params + [SEARCH_PER_PAGE, (page - 1) * SEARCH_PER_PAGE])
+        
+        return json_response({
+            'success': True,
+            'materials': nest_highlights(cursor.fetchall()),
+            'pagination': search_pagination(page, total_items)
+        })
+        
+    except Exception as e:
+        print(f'자료 검색 오류: {e}')
+        return jsonify({'success': False, 'error': '자료 검색 중 오류가 발생했습니다.'}), 500
+
+# 다운로드 카운트 버퍼
+# 다운로드마다 UPDATE/커밋을 하면 모든 워커가 쓰기 잠금을 두고 경쟁하므로,
+# 프로세스 안에서 증가분을 모았다가 주기(또는 임계치 도달) 마다 한 트랜잭션으로 반영합니다.
+# 목록 API 의 download_count 는 최대 DOWNLOAD_COUNT_FLUSH_INTERVAL 초 늦게 반영됩니다.
+# 0 으로 설정하면 버퍼 없이 즉시 반영합니다 (인스턴스가 예고 없이 종료될 수 있는 서버리스 환경용).
+DOWNLOAD_COUNT_FLUSH_INTERVAL = float(os.environ.get('DOWNLOAD_COUNT_FLUSH_INTERVAL', '5'))
+DOWNLOAD_COUNT_FLUSH_THRESHOLD = int(os.environ.get('DOWNLOAD_COUNT_FLUSH_THRESHOLD', '100'))
+
+_pending_download_counts = {}
+_pending_download_lock = threading.Lock()
+_download_flush_event = threading.Event()
+_download_flusher_pid = None
+
+def apply_download_counts(cursor, pending):
+    """{자료 ID: 증가분} 을 download_count 에 더합니다 (쓰기 스레드에서 실행)."""
+    cursor.executemany('''
+        UPDATE materials 
+        SET download_count = download_count + ?
+        WHERE id = ?
+    ''', [(count, material_id) for material_id, count in pending.items()])
+
+def flush_download_counts():
+    """모아둔 다운로드 카운트를 한 트랜잭션으로 반영하고 반영한 건수를 반환합니다."""
+    with _pending_download_lock:
+        if not _pending_download_counts:
+            return 0
+        pending = dict(_pending_download_counts)
+        _pending_download_counts.clear()
+    
+    try:
+        run_write(apply_download_counts, pending)
+    except Exception as e:
+        # 실패한 증가분은 버퍼로 되돌려 다음 주기에 다시 시도
+        print(f'다운로드 카운트 반영 실패: {e}')
+        with _pending_download_lock:
+            for material_id, count in pending.items():
+                _pending_download_counts[material_id] = _pending_download_counts.get(material_id, 0) + count
+        return 0
+    
+    return sum(pending.values())
+
+def _download_flush_loop():
+    """주기적으로 (또는 임계치 도달 시 즉시) 다운로드 카운트를 반영합니다."""
+    while True:
+        _download_flush_event.wait(DOWNLOAD_COUNT_FLUSH_INTERVAL)
+        _download_flush_event.clear()
+        flush_download_counts()
+
+def _ensure_download_flusher():
+    """현재 프로세스의 반영 스레드를 시작합니다 (gunicorn fork 이후 워커마다 한 번)."""
+    global _download_flusher_pid
+    if _download_flusher_pid == os.getpid():
+        return
+    with _pending_download_lock:
+        if _download_flusher_pid == os.getpid():
+            return
+        _download_flusher_pid = os.getpid()
+        threading.Thread(target=_download_flush_loop, name='download-count-flusher', daemon=True).start()
+
+def record_download(material_id):
+    """다운로드 1회를 기록합니다."""
+    if DOWNLOAD_COUNT_FLUSH_INTERVAL <= 0:
+        with _pending_download_lock:
+            _pending_download_counts[material_id] = _pending_download_counts.get(material_id, 0) + 1
+        flush_download_counts()
+        return
+    
+    _ensure_download_flusher()
+    with _pending_download_lock:
+        _pending_download_counts[material_id] = _pending_download_counts.get(material_id, 0) + 1
+        total_pending = sum(_pending_download_counts.values())
+    
+    if total_pending >= DOWNLOAD_COUNT_FLUSH_THRESHOLD:
+        _download_flush_event.set()
+
+# 프로세스 종료 시 남은 카운트 반영
+atexit.register(flush_download_counts)
+
 @app.route('/api/materials/<int:material_id>/download', methods=['GET', 'POST'])
 def download_material(material_id):
-    """자료 다운로드 (다운로드 카운트 증가)"""
+    """자료 다운로드 (POST 는 다운로드 카운트 증가)
+    
+    GET 은 Range(이어받기)와 ETag/Last-Modified 조건부 요청을 지원합니다.
+    POST 요청이 JSON 을 원하면(Accept: application/json) 카운트만 올리고 GET 다운로드 주소를 반환합니다.
+    """
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         
         # 자료 정보 가져오기
         cursor.execute('''
-            SELECT file_path, file_name
+            SELECT file_path, file_name, content_hash
             FROM materials 
             WHERE id = ? AND is_active = 1
         ''', (material_id,))
@@ -797,37 +3405,90 @@ def download_material(material_id):
         row = cursor.fetchone()
         
         if not row:
-            conn.close()
             return jsonify({'success': False, 'error': '자료를 찾을 수 없습니다.'}), 404
         
         file_path = row[0]
         file_name = row[1]
+        content_hash = row[2]
         
-        # POST 요청일 때만 다운로드 카운트 증가
+        # POST 요청일 때만 다운로드 카운트 증가 (버퍼에 모았다가 일괄 반영)
         if request.method == 'POST':
-            cursor.execute('''
-                UPDATE materials 
-                SET download_count = download_count + 1
-                WHERE id = ?
-            ''', (material_id,))
-            conn.commit()
-        
-        conn.close()
+            record_download(material_id)
+            
+            if request.accept_mimetypes.best == 'application/json':
+                return jsonify({
+                    'success': True,
+                    'download_url': f'/api/materials/{material_id}/download',
+                    'file_name': file_name
+                })
         
         # 실제 파일 경로로 변환
         if file_path.startswith('/static/uploads/'):
             actual_path = file_path.replace('/static/uploads/', '')
-            return send_from_directory(app.config['UPLOAD_FOLDER'], actual_path, as_attachment=True, download_name=file_name)
         elif file_path.startswith('/tmp/uploads/'):
             actual_path = file_path.replace('/tmp/uploads/', '')
-            return send_from_directory(app.config['UPLOAD_FOLDER'], actual_path, as_attachment=True, download_name=file_name)
         else:
             return jsonify({'success': False, 'error': '파일 경로가 올바르지 않습니다.'}), 404
         
+        # 내용 주소 저장 파일은 해시를 강한 ETag 로 사용, 캐시는 매번 재검증
+        response = send_file_response(
+            app.config['UPLOAD_FOLDER'],
+            actual_path,
+            X_ACCEL_UPLOADS_PREFIX,
+            as_attachment=True,
+            download_name=file_name,
+            etag=content_hash or True
+        )
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+        
     except Exception as e:
         print(f'자료 다운로드 오류: {e}')
         return jsonify({'success': False, 'error': '다운로드 처리 중 오류가 발생했습니다.'}), 500
 
+@app.route('/api/materials/<int:material_id>/image', methods=['GET'])
+def material_image(material_id):
+    """이미지 자료를 화면 표시용으로 제공합니다 (Accept 에 따라 AVIF/WebP, ?w= 로 축소본/썸네일).
+    
+    다운로드 카운트는 올리지 않으며, 원본 파일은 /download 로 받습니다.
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT file_name, file_type, content_hash
+            FROM materials
+            WHERE id = ? AND is_active = 1
+        ''', (material_id,))
+        row = cursor.fetchone()
+        
+        if not row or not row[2] or not is_image_file(row[0]):
+            return jsonify({'success': False, 'error': '이미지 자료를 찾을 수 없습니다.'}), 404
+        
+        file_name, file_type, content_hash = row
+        variants = existing_image_variants(blob_path(content_hash), MATERIAL_IMAGE_WIDTHS)
+        pending = False
+        if not variants and not has_no_variants(blob_path(content_hash)) and os.path.exists(blob_path(content_hash)):
+            # 변형 생성 전(업로드 직후, 이전 버전에서 올린 자료)이면 백그라운드에서 만들고 이번에는 원본 제공
+            pending = schedule_material_image_variants(content_hash, file_name)
+        
+        variant, mimetype = choose_image_variant(variants, request.accept_mimetypes, request.args.get('w', 0, type=int))
+        if variant:
+            relative_path = os.path.relpath(variant, app.config['UPLOAD_FOLDER'])
+        else:
+            relative_path = os.path.relpath(blob_path(content_hash), app.config['UPLOAD_FOLDER'])
+            mimetype = file_type if file_type and file_type.startswith('image/') else mimetypes.guess_type(file_name)[0]
+        
+        response = send_file_response(app.config['UPLOAD_FOLDER'], relative_path, X_ACCEL_UPLOADS_PREFIX, mimetype=mimetype)
+        # 변형을 만드는 중이면 원본을 오래 캐시하지 않음
+        response.headers['Cache-Control'] = 'no-cache' if pending else f'public, max-age={MATERIAL_IMAGE_MAX_AGE}'
+        response.vary.add('Accept')
+        return response
+        
+    except Exception as e:
+        print(f'이미지 자료 제공 오류: {e}')
+        return jsonify({'success': False, 'error': '이미지를 불러오는 중 오류가 발생했습니다.'}), 500
+
 @app.route('/api/admin/materials/<int:material_id>', methods=['PUT', 'DELETE'])
 def admin_material_management(material_id):
     """관리자용 자료 수정 및 삭제"""
@@ -838,9 +3499,6 @@ def admin_material_management(material_id):
         if not verify_admin_password(admin_password):
             return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         if request.method == 'PUT':
             # 자료 수정
             title = data.get('title')
@@ -851,38 +3509,228 @@ def admin_material_management(material_id):
             if not title:
                 return jsonify({'success': False, 'error': '제목은 필수입니다.'}), 400
             
-            cursor.execute('''
-                UPDATE materials 
-                SET title = ?, description = ?, category = ?, is_active = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (title, description, category, is_active, material_id))
-            
-            if cursor.rowcount == 0:
-                conn.close()
+            if not run_write(update_material, material_id, title, description, category, is_active):
                 return jsonify({'success': False, 'error': '자료를 찾을 수 없습니다.'}), 404
             
             message = '자료가 성공적으로 수정되었습니다.'
             
         elif request.method == 'DELETE':
-            # 자료 삭제
-            cursor.execute('DELETE FROM materials WHERE id = ?', (material_id,))
-            
-            if cursor.rowcount == 0:
-                conn.close()
+            # 자료 삭제 (마지막 참조였다면 파일도 삭제)
+            if not run_write(delete_material, material_id):
                 return jsonify({'success': False, 'error': '자료를 찾을 수 없습니다.'}), 404
             
             message = '자료가 성공적으로 삭제되었습니다.'
         
-        conn.commit()
-        conn.close()
-        
         return jsonify({'success': True, 'message': message})
         
+    except WriteUnavailable as e:
+        return write_unavailable_response(e)
     except Exception as e:
         print(f'자료 관리 오류: {e}')
         return jsonify({'success': False, 'error': '자료 관리 중 오류가 발생했습니다.'}), 500
 
+# 관리자 데이터 내보내기 (CSV / JSONL)
+# 서버 측 커서에서 EXPORT_FETCH_SIZE 행씩 읽어 바로 응답으로 흘려보내므로
+# 내보내는 행 수와 관계없이 메모리 사용량이 일정합니다. gzip=1 이면 압축도 스트리밍으로 처리합니다.
+EXPORT_FETCH_SIZE = int(os.environ.get('EXPORT_FETCH_SIZE', 500))
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+    'json': 'application/json'
+}
+# 문의 비밀번호(평문으로 저장됨) 등 내보내면 안 되는 컬럼은 제외
+EXPORT_COLUMNS = {
+    'inquiries': ('id', 'date', 'serial', 'name', 'phone', 'email', 'message',
+                  'answer', 'answer_date', 'created_at'),
+    'materials': ('id', 'title', 'description', 'file_name', 'file_size', 'file_type', 'category',
+                  'download_count', 'is_active', 'content_hash', 'created_at', 'updated_at')
+}
+EXPORT_MAPPINGS = {
+    kind: RowMapping(*((column, column, bool) if column == 'is_active' else (column, column) for column in columns))
+    for kind, columns in EXPORT_COLUMNS.items()
+}
+
+def parse_export_date(value, end_of_range=False):
+    """YYYY-MM-DD 를 created_at 비교용 문자열로 변환합니다. 잘못된 값은 ValueError."""
+    day = datetime.strptime(value, '%Y-%m-%d')
+    if end_of_range:
+        return day.strftime('%Y-%m-%d 23:59:59')
+    return day.strftime('%Y-%m-%d 00:00:00')
+
+def build_export_query(kind):
+    """요청 필터(date_from, date_to, answered, active)로 내보내기 쿼리를 만듭니다."""
+    conditions = []
+    params = []
+    
+    date_from = request.args.get('date_from', '')
+    date_to = request.args.get('date_to', '')
+    if date_from:
+        conditions.append('created_at >= ?')
+        params.append(parse_export_date(date_from))
+    if date_to:
+        conditions.append('created_at <= ?')
+        params.append(parse_export_date(date_to, end_of_range=True))
+    
+    if kind == 'inquiries':
+        answered = request.args.get('answered', '')
+        if answered == 'yes':
+            conditions.append("COALESCE(answer, '') != ''")
+        elif answered == 'no':
+            conditions.append("COALESCE(answer, '') = ''")
+        elif answered:
+            raise ValueError('answered 는 yes 또는 no 여야 합니다.')
+    else:
+        active = request.args.get('active', '')
+        if active == 'yes':
+            conditions.append('is_active = 1')
+        elif active == 'no':
+            conditions.append('is_active = 0')
+        elif active:
+            raise ValueError('active 는 yes 또는 no 여야 합니다.')
+    
+    where_sql = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+    query = f'SELECT {EXPORT_MAPPINGS[kind].select} FROM {kind} {where_sql} ORDER BY created_at, id'
+    return query, params
+
+# 엑셀 등이 수식으로 실행하지 않도록, 이 문자로 시작하는 CSV 셀 앞에 ' 를 붙입니다 (CSV 수식 주입 방지)
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@')
+
+def escape_csv_cell(value):
+    """수식으로 해석될 수 있는 문자열 셀 앞에 ' 를 붙여 반환합니다."""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def iter_export_rows(query, params):
+    """전용 연결에서 EXPORT_FETCH_SIZE 행씩 읽어 묶음 단위로 돌려줍니다.
+    
+    한 읽기 트랜잭션 안에서 읽으므로 내보내는 도중의 쓰기와 관계없이 같은 시점의 데이터가 나옵니다 (WAL).
+    """
+    conn = sqlite3.connect(DATABASE_FILE)
+    apply_sqlite_settings(conn)
+    try:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN')
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(EXPORT_FETCH_SIZE)
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+def iter_export_chunks(kind, export_format, query, params):
+    """행 묶음을 CSV/JSONL/JSON 배열 바이트 조각으로 변환합니다."""
+    columns = EXPORT_COLUMNS[kind]
+    
+    if export_format == 'csv':
+        import csv  # 내보내기에서만 사용 (콜드 스타트 시 불러오지 않음)
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+        buffer.write('\ufeff')
+        writer.writerow(columns)
+        for rows in iter_export_rows(query, params):
+            writer.writerows([escape_csv_cell(value) for value in row] for row in rows)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+        return
+    
+    mapping = EXPORT_MAPPINGS[kind]
+    if export_format == 'json':
+        yield from iter_json_array(mapping.to_dicts(rows) for rows in iter_export_rows(query, params))
+        return
+    
+    for rows in iter_export_rows(query, params):
+        yield b'\n'.join(dumps_json(record) for record in mapping.to_dicts(rows)) + b'\n'
+
+def gzip_stream(chunks):
+    """바이트 조각을 스트리밍 gzip 으로 압축합니다."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+@app.route('/api/admin/export/<kind>', methods=['GET'])
+def admin_export(kind):
+    """문의/자료 데이터 내보내기
+    
+    쿼리 파라미터: format=csv|jsonl|json, gzip=1, date_from/date_to=YYYY-MM-DD,
+    answered=yes|no (문의), active=yes|no (자료)
+    """
+    if not verify_admin_password(request.headers.get('X-Admin-Password')):
+        return jsonify({'success': False, 'error': '관리자 인증에 실패했습니다.'}), 401
+    
+    if kind not in EXPORT_COLUMNS:
+        return jsonify({'success': False, 'error': '내보낼 수 없는 데이터입니다.'}), 404
+    
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'error': 'format 은 csv, jsonl, json 중 하나여야 합니다.'}), 400
+    
+    try:
+        query, params = build_export_query(kind)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    use_gzip = request.args.get('gzip') in ('1', 'true', 'yes')
+    file_name = f'{kind}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{export_format}'
+    chunks = iter_export_chunks(kind, export_format, query, params)
+    
+    if use_gzip:
+        chunks = gzip_stream(chunks)
+        file_name += '.gz'
+        mimetype = 'application/gzip'
+    else:
+        mimetype = EXPORT_FORMATS[export_format]
+    
+    log_event('info', 'export_started', file_name=file_name)
+    response = Response(chunks, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{file_name}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+mark_startup('routes')
+
 if __name__ == '__main__':
+    import sys
+    
+    # python app.py check-query-plans : 주요 쿼리가 전체 스캔을 하면 실패 코드로 종료
+    if len(sys.argv) > 1 and sys.argv[1] == 'check-query-plans':
+        ensure_database_schema()
+        failed = check_query_plans(get_db_connection())
+        sys.exit(1 if failed else 0)
+    
+    # python app.py build-db-template : COLD_START_MODE 에서 복사할 데이터베이스 템플릿 생성 (배포 전 실행)
+    if len(sys.argv) > 1 and sys.argv[1] == 'build-db-template':
+        print(f'데이터베이스 템플릿 생성: {DATABASE_TEMPLATE} (스키마 v{build_database_template()})')
+        sys.exit(0)
+    
+    # python app.py sweep-files : 참조가 없는 내용 파일과 세션이 없는 업로드 임시 파일 삭제
+    if len(sys.argv) > 1 and sys.argv[1] == 'sweep-files':
+        ensure_database_schema()
+        print(f'삭제한 파일: {sweep_orphan_files()}개')
+        sys.exit(0)
+    
+    # python app.py startup-report : 이 프로세스의 import 단계별 시간과 첫 요청(정적 JSON, DB 조회) 시간 출력
+    if len(sys.argv) > 1 and sys.argv[1] == 'startup-report':
+        client = app.test_client()
+        for path in ('/api/bootstrap', '/api/inquiry-list'):
+            started = time.perf_counter()
+            client.get(path)
+            mark_startup(f'GET {path}', time.perf_counter() - started)
+        print(f'COLD_START_MODE={int(COLD_START_MODE)}')
+        for phase, seconds in _startup_phases:
+            print(f'{phase:<28} {seconds * 1000:8.2f} ms')
+        sys.exit(0)
+    
     app.run(debug=True, host='0.0.0.0', port=5000)
 
 # Vercel 배포를 위한 app 객체 export
@@ -0,0 +1,793 @@
+"""로컬 벤치마크 / 부하 테스트
+
+임시 DATABASE_PATH 에 문의/자료 데이터를 채운 뒤 app.py 의 모든 API 를
+Flask 테스트 클라이언트와 실제 gunicorn 서버에 동시 요청으로 보내고,
+엔드포인트별 p50/p95/p99 지연 시간, 처리량, 최대 RSS 를 JSON 으로 저장합니다.
+지연 시간과 처리량은 정상 응답만으로 계산하며, 오류 응답은 errors 에 따로 집계하고
+오류가 있는 엔드포인트가 있으면 종료 코드 1 로 끝납니다.
+
+사용 예:
+    python benchmark.py                                   # 기본 (문의 1만 / 자료 1천, 두 모드 모두)
+    python benchmark.py --inquiries 1000000 --materials 10000 --mode gunicorn
+    python benchmark.py --save-baseline                   # 결과를 기준선으로 저장
+    python benchmark.py --baseline benchmark-results/baseline.json   # 기준선과 비교 (회귀 시 종료 코드 1)
+"""
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import random
+import shutil
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import quote
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmark-results')
+DEFAULT_BASELINE = os.path.join(RESULTS_DIR, 'baseline.json')
+
+ADMIN_PASSWORD = 'hanstar'
+INQUIRY_PASSWORD = 'bench'
+CATEGORIES = ['무역', '운송', '정비', '기타']
+WORDS = ['scrap', 'vessel', 'container', 'kia', 'pellet', 'tashkent', 'incheon', 'invoice',
+         'shipment', 'engine', 'parts', 'freight', 'customs', 'warranty', 'schedule', 'quote']
+BLOB_VARIANTS = 64  # 자료 파일은 이 개수의 내용을 돌려 쓰며 공유 (내용 주소 저장)
+IMAGE_MATERIALS = 8  # /api/materials/<id>/image 용 PNG 자료 (텍스트 자료 뒤의 ID)
+INQUIRY_PER_PAGE = 15
+MATERIALS_PER_PAGE = 20
+
+# 기본으로 제외하는 엔드포인트 (--include 로 추가)
+DEFAULT_EXCLUDED = {'backup_database'}
+
+# ---------------------------------------------------------------------------
+# 데이터 준비
+# ---------------------------------------------------------------------------
+
+def prepare_environment(work_dir):
+    """벤치마크용 임시 경로를 환경변수로 지정합니다 (app 을 import 하기 전에 호출)."""
+    env = {
+        'DATABASE_PATH': os.path.join(work_dir, 'bench.db'),
+        'UPLOAD_PATH': os.path.join(work_dir, 'uploads'),
+        'BACKUP_FOLDER': os.path.join(work_dir, 'backups'),
+        'LOG_LEVEL': 'WARNING',
+    }
+    os.environ.update(env)
+    return env
+
+def random_text(rng, word_count):
+    return ' '.join(rng.choice(WORDS) for _ in range(word_count))
+
+def seed_database(app_module, inquiry_count, material_count, seed):
+    """스키마를 만든 뒤 문의/자료 데이터를 일괄 삽입합니다."""
+    rng = random.Random(seed)
+    app_module.ensure_database_schema()
+
+    conn = sqlite3.connect(app_module.DATABASE_FILE)
+    conn.execute('PRAGMA synchronous = OFF')
+
+    started = time.perf_counter()
+    per_day = 50
+    # 오늘 날짜는 비워 두어 실제 문의 등록 시 일련번호가 겹치지 않도록 함
+    first_day = datetime.now() - timedelta(days=1)
+
+    def inquiry_rows():
+        for index in range(inquiry_count):
+            day = first_day - timedelta(days=index // per_day)
+            answered = rng.random() < 0.5
+            yield (
+                day.strftime('%Y-%m-%d'),
+                f'{index % per_day + 1:02d}',
+                f'고객{index}',
+                f'010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}',
+                f'user{index}@example.com',
+                random_text(rng, 30),
+                INQUIRY_PASSWORD,
+                random_text(rng, 15) if answered else None,
+                day.strftime('%Y-%m-%d') if answered else None,
+                day.strftime('%Y-%m-%d %H:%M:%S')
+            )
+
+    batch = []
+    for row in inquiry_rows():
+        batch.append(row)
+        if len(batch) >= 10000:
+            insert_inquiries(conn, batch)
+            batch = []
+    if batch:
+        insert_inquiries(conn, batch)
+    conn.execute('''
+        INSERT OR REPLACE INTO inquiry_serials (date, last_serial)
+        SELECT date, MAX(CAST(serial AS INTEGER)) FROM inquiries GROUP BY date
+    ''')
+    conn.commit()
+
+    # 자료 파일은 BLOB_VARIANTS 종류만 만들고 나머지는 같은 내용을 공유
+    hashes = []
+    for variant in range(BLOB_VARIANTS):
+        content = (f'benchmark material {variant}\n' * 2000).encode('utf-8')
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = app_module.blob_path(content_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as blob_file:
+            blob_file.write(content)
+        hashes.append((content_hash, app_module.format_file_size(len(content))))
+
+    cursor = conn.cursor()
+    for index in range(material_count):
+        content_hash, file_size = hashes[index % BLOB_VARIANTS]
+        app_module.insert_material(
+            cursor,
+            f'자료 {index} {random_text(rng, 3)}',
+            random_text(rng, 12),
+            f'material_{index}.txt',
+            content_hash,
+            file_size,
+            'text/plain',
+            CATEGORIES[index % len(CATEGORIES)]
+        )
+
+    for index in range(IMAGE_MATERIALS):
+        content = make_png(64, 64, index)
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = app_module.blob_path(content_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as blob_file:
+            blob_file.write(content)
+        app_module.insert_material(
+            cursor, f'이미지 {index}', '', f'image_{index}.png', content_hash,
+            app_module.format_file_size(len(content)), 'image/png', CATEGORIES[index % len(CATEGORIES)]
+        )
+    conn.commit()
+    conn.close()
+
+    print(f'데이터 준비 완료: 문의 {inquiry_count}건, 자료 {material_count}건 ({time.perf_counter() - started:.1f}초)')
+
+def make_png(width, height, shade):
+    """Pillow 없이 작은 그라데이션 PNG(RGB) 를 만듭니다."""
+    def chunk(kind, data):
+        return (len(data).to_bytes(4, 'big') + kind + data
+                + zlib.crc32(kind + data).to_bytes(4, 'big'))
+    rows = b''.join(
+        b'\x00' + b''.join(bytes((x * 4 % 256, y * 4 % 256, shade * 32 % 256)) for x in range(width))
+        for y in range(height)
+    )
+    header = width.to_bytes(4, 'big') + height.to_bytes(4, 'big') + bytes((8, 2, 0, 0, 0))
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b'')
+
+def seed_upload_sessions(app_module, count):
+    """상태 조회/취소 시나리오에서 쓸 빈 분할 업로드 세션을 만들고 ID 목록을 반환합니다."""
+    conn = sqlite3.connect(app_module.DATABASE_FILE)
+    cursor = conn.cursor()
+    upload_ids = [app_module.create_upload_session(cursor, 'bench.zip', 64 * 1024, 'application/zip')
+                  for _ in range(count)]
+    conn.commit()
+    conn.close()
+    return upload_ids
+
+def build_page_cursors(app_module, inquiry_count, material_count):
+    """목록 중간 페이지를 가리키는 커서를 만듭니다 (깊은 페이지의 키셋 조회 측정용)."""
+    conn = sqlite3.connect(app_module.DATABASE_FILE)
+
+    def middle_cursor(sql, total, per_page):
+        page = max(total // per_page // 2, 2)
+        row = conn.execute(sql, ((page - 1) * per_page - 1,)).fetchone()
+        return app_module.encode_cursor(row, 'next', page) if row else None
+
+    cursors = {
+        'inquiry': middle_cursor('SELECT date, serial, id FROM inquiries ORDER BY date DESC, serial DESC, id DESC '
+                                 'LIMIT 1 OFFSET ?', inquiry_count, INQUIRY_PER_PAGE),
+        'admin_inquiry': middle_cursor('SELECT created_at, id FROM inquiries ORDER BY created_at DESC, id DESC '
+                                       'LIMIT 1 OFFSET ?', inquiry_count, INQUIRY_PER_PAGE),
+        'materials': middle_cursor('SELECT created_at, id FROM materials WHERE is_active = 1 '
+                                   'ORDER BY created_at DESC, id DESC LIMIT 1 OFFSET ?', material_count, MATERIALS_PER_PAGE)
+    }
+    conn.close()
+    return cursors
+
+def insert_inquiries(conn, rows):
+    conn.executemany('''
+        INSERT INTO inquiries (date, serial, name, phone, email, message, password, answer, answer_date, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+
+# ---------------------------------------------------------------------------
+# 클라이언트 (테스트 클라이언트 / HTTP)
+# ---------------------------------------------------------------------------
+
+def encode_multipart(fields, files):
+    """multipart/form-data 본문을 만듭니다. files: {이름: (파일 이름, 바이트)}"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode('utf-8'))
+    for name, (file_name, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{file_name}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'.encode('utf-8') + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode('utf-8'))
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+class TestClientAdapter:
+    """Flask 테스트 클라이언트로 요청합니다 (스레드마다 하나씩 생성)."""
+    def __init__(self, flask_app):
+        self.client = flask_app.test_client()
+
+    def request(self, method, path, json_body=None, form=None, files=None, body=None, headers=None):
+        kwargs = {'headers': dict(headers or {})}
+        if json_body is not None:
+            kwargs['json'] = json_body
+        elif form is not None or files is not None:
+            kwargs['data'], kwargs['headers']['Content-Type'] = encode_multipart(form or {}, files or {})
+        elif body is not None:
+            kwargs['data'] = body
+        response = self.client.open(path, method=method, **kwargs)
+        data = response.get_data()
+        response.close()
+        return response.status_code, data
+
+class HttpAdapter:
+    """실제 HTTP 로 요청합니다 (스레드마다 keep-alive 연결 하나)."""
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.conn = http.client.HTTPConnection(host, port, timeout=60)
+
+    def request(self, method, path, json_body=None, form=None, files=None, body=None, headers=None):
+        headers = dict(headers or {})
+        if json_body is not None:
+            body = json.dumps(json_body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        elif form is not None or files is not None:
+            body, headers['Content-Type'] = encode_multipart(form or {}, files or {})
+
+        for attempt in range(2):
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # 서버가 keep-alive 연결을 닫은 경우 한 번 다시 연결
+                self.conn.close()
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+                if attempt:
+                    raise
+
+# ---------------------------------------------------------------------------
+# 시나리오 (엔드포인트별 요청)
+# ---------------------------------------------------------------------------
+
+class ScenarioContext:
+    """시나리오 간에 공유하는 값 (데이터 규모, 삭제용 ID, 커서, 업로드 세션 등)"""
+    def __init__(self, inquiry_count, material_count, cursors=None, upload_ids=()):
+        self.inquiry_count = inquiry_count
+        self.material_count = material_count
+        self.cursors = cursors or {}
+        self._lock = threading.Lock()
+        self._next_delete_id = material_count
+        # 첫 세션은 상태 조회용으로 남기고 나머지는 취소 시나리오가 하나씩 사용
+        self.status_upload_id = upload_ids[0] if upload_ids else 'missing'
+        self._cancel_upload_ids = list(upload_ids[1:])
+        self._event_token = None
+
+    def random_inquiry_id(self):
+        return random.randint(1, max(self.inquiry_count, 1))
+
+    def random_material_id(self):
+        # 뒤쪽 절반은 삭제 시나리오가 사용하므로 앞쪽에서 선택
+        return random.randint(1, max(self.material_count // 2, 1))
+
+    def take_delete_id(self):
+        with self._lock:
+            material_id = self._next_delete_id
+            self._next_delete_id -= 1
+        return material_id if material_id > self.material_count // 2 else None
+
+    def random_image_id(self):
+        return self.material_count + random.randint(1, IMAGE_MATERIALS)
+
+    def take_upload_id(self):
+        with self._lock:
+            return self._cancel_upload_ids.pop() if self._cancel_upload_ids else None
+
+    def cursor(self, name):
+        # 데이터가 한 페이지보다 적으면 커서가 없으므로 빈 커서 (첫 페이지)
+        return self.cursors.get(name) or ''
+
+    def event_token(self, client):
+        """알림 토큰을 한 번만 발급받아 재사용합니다 (발급 자체는 별도 시나리오에서 측정)."""
+        if self._event_token is None:
+            status, body = client.request('POST', '/api/admin/inquiry-events/token',
+                                          json_body={'admin_password': ADMIN_PASSWORD})
+            if status != 200:
+                return None
+            self._event_token = json.loads(body)['token']
+        return self._event_token
+
+def admin_header():
+    return {'X-Admin-Password': ADMIN_PASSWORD}
+
+def scenario_chunked_upload(client, ctx):
+    content = os.urandom(64 * 1024)
+    status, body = client.request('POST', '/api/admin/uploads', json_body={
+        'admin_password': ADMIN_PASSWORD, 'file_name': 'bench.zip', 'file_size': len(content)
+    })
+    if status != 200:
+        return status
+    upload_id = json.loads(body)['upload_id']
+    status, _ = client.request('PUT', f'/api/admin/uploads/{upload_id}?offset=0', body=content,
+                               headers=dict(admin_header(), **{'X-Chunk-Sha256': hashlib.sha256(content).hexdigest()}))
+    if status != 200:
+        return status
+    status, _ = client.request('POST', f'/api/admin/uploads/{upload_id}/commit', json_body={
+        'admin_password': ADMIN_PASSWORD, 'title': 'bench', 'sha256': hashlib.sha256(content).hexdigest()
+    })
+    return status
+
+def scenario_material_delete(client, ctx):
+    material_id = ctx.take_delete_id()
+    if material_id is None:
+        return 200
+    status, _ = client.request('DELETE', f'/api/admin/materials/{material_id}', json_body={'admin_password': ADMIN_PASSWORD})
+    return status
+
+def scenario_upload_cancel(client, ctx):
+    upload_id = ctx.take_upload_id()
+    if upload_id is None:
+        return 200
+    status, _ = client.request('DELETE', f'/api/admin/uploads/{upload_id}', headers=admin_header())
+    return status
+
+def scenario_inquiry_events(client, ctx):
+    token = ctx.event_token(client)
+    if token is None:
+        return 'error: token'
+    # last_event_id 를 주면 그 이후의 변경 내역을 조회 (스트림 대신 한 번 조회하는 폴링 방식)
+    status, _ = client.request('GET', f'/api/admin/inquiry-events?token={quote(token)}&format=json'
+                                      f'&last_event_id={random.randint(0, ctx.inquiry_count)}')
+    return status
+
+def simple(method, path_factory, **request_kwargs):
+    """한 번의 요청으로 끝나는 시나리오를 만듭니다. path_factory 는 문자열 또는 ctx 를 받는 함수."""
+    def run(client, ctx):
+        path = path_factory(ctx) if callable(path_factory) else path_factory
+        kwargs = {key: (value(ctx) if callable(value) else value) for key, value in request_kwargs.items()}
+        status, _ = client.request(method, path, **kwargs)
+        return status
+    return run
+
+# (이름, 라우트, 실행 함수, 정상 상태 코드)
+SCENARIOS = [
+    ('index', 'GET /', simple('GET', '/'), {200}),
+    ('static_file', 'GET /static/<path>', simple('GET', '/static/script.js'), {200}),
+    ('menu', 'GET /api/menu', simple('GET', '/api/menu'), {200}),
+    ('contact', 'GET /api/contact', simple('GET', '/api/contact'), {200}),
+    ('company_intro', 'GET /api/company-intro', simple('GET', '/api/company-intro'), {200}),
+    ('company_history', 'GET /api/company-history', simple('GET', '/api/company-history'), {200}),
+    ('bootstrap', 'GET /api/bootstrap', simple('GET', '/api/bootstrap'), {200}),
+    ('program_files', 'GET /api/program-files', simple('GET', '/api/program-files'), {200}),
+    ('inquiry_submit', 'POST /api/inquiry', simple(
+        'POST', '/api/inquiry',
+        json_body=lambda ctx: {'name': '벤치', 'phone': '010-0000-0000', 'email': 'bench@example.com',
+                               'message': random_text(random, 20), 'password': INQUIRY_PASSWORD}
+    ), {200}),
+    ('inquiry_list_first_page', 'GET /api/inquiry-list', simple('GET', '/api/inquiry-list?page=1'), {200}),
+    ('inquiry_list_deep_page', 'GET /api/inquiry-list?page=N', simple(
+        'GET', lambda ctx: f'/api/inquiry-list?page={max(ctx.inquiry_count // 15 // 2, 1)}'
+    ), {200}),
+    ('inquiry_list_cursor', 'GET /api/inquiry-list?cursor=', simple(
+        'GET', lambda ctx: f'/api/inquiry-list?cursor={quote(ctx.cursor("inquiry"))}'
+    ), {200}),
+    ('inquiry_verify', 'POST /api/verify-inquiry', simple(
+        'POST', '/api/verify-inquiry',
+        json_body=lambda ctx: {'row_id': ctx.random_inquiry_id(), 'password': INQUIRY_PASSWORD}
+    ), {200}),
+    ('admin_inquiry_list', 'POST /api/admin/inquiry-list', simple(
+        'POST', '/api/admin/inquiry-list', json_body={'admin_password': ADMIN_PASSWORD, 'page': 1}
+    ), {200}),
+    ('admin_inquiry_list_cursor', 'POST /api/admin/inquiry-list (cursor)', simple(
+        'POST', '/api/admin/inquiry-list',
+        json_body=lambda ctx: {'admin_password': ADMIN_PASSWORD, 'cursor': ctx.cursor('admin_inquiry')}
+    ), {200}),
+    ('admin_add_answer', 'POST /api/admin/add-answer', simple(
+        'POST', '/api/admin/add-answer',
+        json_body=lambda ctx: {'admin_password': ADMIN_PASSWORD, 'inquiry_id': ctx.random_inquiry_id(),
+                               'answer_content': random_text(random, 10)}
+    ), {200}),
+    ('admin_inquiry_search', 'POST /api/admin/inquiry-search', simple(
+        'POST', '/api/admin/inquiry-search',
+        json_body=lambda ctx: {'admin_password': ADMIN_PASSWORD, 'q': random.choice(WORDS), 'page': 1}
+    ), {200}),
+    ('admin_inquiry_events_token', 'POST /api/admin/inquiry-events/token', simple(
+        'POST', '/api/admin/inquiry-events/token', json_body={'admin_password': ADMIN_PASSWORD}
+    ), {200}),
+    ('admin_inquiry_events', 'GET /api/admin/inquiry-events?format=json', scenario_inquiry_events, {200}),
+    ('admin_cache_stats', 'GET /api/admin/cache-stats', simple(
+        'GET', '/api/admin/cache-stats', headers=admin_header()
+    ), {200}),
+    ('admin_materials_list', 'GET /api/admin/materials', simple('GET', '/api/admin/materials'), {200}),
+    ('admin_materials_upload', 'POST /api/admin/materials', simple(
+        'POST', '/api/admin/materials',
+        form={'admin_password': ADMIN_PASSWORD, 'title': 'bench', 'category': '기타'},
+        files=lambda ctx: {'file': ('bench.txt', os.urandom(16 * 1024))}
+    ), {200}),
+    ('admin_chunked_upload', 'POST/PUT /api/admin/uploads...', scenario_chunked_upload, {200}),
+    ('admin_upload_status', 'GET /api/admin/uploads/<id>', simple(
+        'GET', lambda ctx: f'/api/admin/uploads/{ctx.status_upload_id}', headers=admin_header()
+    ), {200}),
+    ('admin_upload_cancel', 'DELETE /api/admin/uploads/<id>', scenario_upload_cancel, {200}),
+    ('materials_list', 'GET /api/materials', simple('GET', '/api/materials'), {200}),
+    ('materials_list_category', 'GET /api/materials?category=', simple(
+        'GET', lambda ctx: f'/api/materials?category={quote(random.choice(CATEGORIES))}&limit=20'
+    ), {200}),
+    ('materials_list_cursor', 'GET /api/materials?cursor=', simple(
+        'GET', lambda ctx: f'/api/materials?cursor={quote(ctx.cursor("materials"))}&limit={MATERIALS_PER_PAGE}'
+    ), {200}),
+    ('materials_search', 'GET /api/materials/search', simple(
+        'GET', lambda ctx: f'/api/materials/search?q={random.choice(WORDS)}'
+    ), {200}),
+    ('material_download', 'GET /api/materials/<id>/download', simple(
+        'GET', lambda ctx: f'/api/materials/{ctx.random_material_id()}/download'
+    ), {200, 404}),
+    ('material_image', 'GET /api/materials/<id>/image', simple(
+        'GET', lambda ctx: f'/api/materials/{ctx.random_image_id()}/image?w=320',
+        headers={'Accept': 'image/avif,image/webp,*/*'}
+    ), {200}),
+    ('material_download_count', 'POST /api/materials/<id>/download', simple(
+        'POST', lambda ctx: f'/api/materials/{ctx.random_material_id()}/download',
+        headers={'Accept': 'application/json'}
+    ), {200, 404}),
+    ('admin_material_update', 'PUT /api/admin/materials/<id>', simple(
+        'PUT', lambda ctx: f'/api/admin/materials/{ctx.random_material_id()}',
+        json_body={'admin_password': ADMIN_PASSWORD, 'title': 'bench update', 'category': '기타', 'is_active': True}
+    ), {200, 404}),
+    ('admin_material_delete', 'DELETE /api/admin/materials/<id>', scenario_material_delete, {200, 404}),
+    ('admin_export_inquiries', 'GET /api/admin/export/<kind>', simple(
+        'GET', lambda ctx: '/api/admin/export/inquiries?date_from='
+                           + (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d'),
+        headers=admin_header()
+    ), {200}),
+    ('metrics', 'GET /metrics', simple('GET', '/metrics', headers=admin_header()), {200}),
+    ('backup_status', 'GET /api/backup-status', simple('GET', '/api/backup-status', headers=admin_header()), {200}),
+    ('backup_database', 'POST /api/backup-database', simple('POST', '/api/backup-database'), {202, 409}),
+]
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def read_rss_kb(pid):
+    """프로세스의 현재 RSS (KB). /proc 이 없으면 None."""
+    try:
+        with open(f'/proc/{pid}/status') as status_file:
+            for line in status_file:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+def child_pids(pid):
+    """pid 의 자식 프로세스 목록 (gunicorn 워커)"""
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as children_file:
+            return [int(child) for child in children_file.read().split()]
+    except OSError:
+        return []
+
+class RssSampler:
+    """측정 중 주기적으로 RSS 합계를 읽어 최댓값을 기록합니다."""
+    def __init__(self, root_pid, include_children, interval=0.05):
+        self.root_pid = root_pid
+        self.include_children = include_children
+        self.interval = interval
+        self.peak_kb = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        pids = [self.root_pid] + (child_pids(self.root_pid) if self.include_children else [])
+        values = [read_rss_kb(pid) for pid in pids]
+        values = [value for value in values if value is not None]
+        if values:
+            self.peak_kb = max(self.peak_kb or 0, sum(values))
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+def percentile(sorted_values, fraction):
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def run_scenario(make_client, scenario, ctx, request_count, concurrency, rss_pid, include_children):
+    """한 엔드포인트에 request_count 번의 요청을 concurrency 개 스레드로 보냅니다."""
+    name, route, run, ok_statuses = scenario
+    local = threading.local()
+
+    def one_request(_):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = make_client()
+        started = time.perf_counter()
+        try:
+            status = run(client, ctx)
+        except Exception as e:
+            status = f'error: {e.__class__.__name__}'
+        return time.perf_counter() - started, status
+
+    with RssSampler(rss_pid, include_children) as sampler:
+        wall_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(one_request, range(request_count)))
+        wall_time = time.perf_counter() - wall_started
+
+    # 지연 시간과 처리량은 정상 응답만으로 계산 (오류 응답이 빠른 응답으로 섞이지 않도록 따로 집계)
+    latencies = sorted(latency for latency, status in results if status in ok_statuses)
+    errors = {}
+    for _, status in results:
+        if status not in ok_statuses:
+            errors[str(status)] = errors.get(str(status), 0) + 1
+
+    def milliseconds(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        'route': route,
+        'requests': request_count,
+        'ok_requests': len(latencies),
+        'concurrency': concurrency,
+        'p50_ms': milliseconds(percentile(latencies, 0.50)),
+        'p95_ms': milliseconds(percentile(latencies, 0.95)),
+        'p99_ms': milliseconds(percentile(latencies, 0.99)),
+        'mean_ms': milliseconds(sum(latencies) / len(latencies) if latencies else None),
+        'throughput_rps': round(len(latencies) / wall_time, 1) if wall_time else None,
+        'peak_rss_mb': round(sampler.peak_kb / 1024, 1) if sampler.peak_kb else None,
+        'errors': errors
+    }
+
+def format_number(value, width, digits):
+    return f'{value:>{width}.{digits}f}' if value is not None else f'{"-":>{width}}'
+
+def run_suite(mode, make_client, scenarios, ctx, args, rss_pid, include_children):
+    results = {}
+    print(f'\n[{mode}] 동시 요청 {args.concurrency}, 엔드포인트당 {args.requests}회')
+    print(f'{"endpoint":<28} {"p50":>9} {"p95":>9} {"p99":>9} {"rps":>9} {"rss MB":>8}  errors')
+    for scenario in scenarios:
+        # 워밍업 (캐시/연결 준비) 후 측정
+        warmup_client = make_client()
+        for _ in range(min(args.warmup, args.requests)):
+            try:
+                scenario[2](warmup_client, ctx)
+            except Exception:
+                break
+
+        result = run_scenario(make_client, scenario, ctx, args.requests, args.concurrency, rss_pid, include_children)
+        results[scenario[0]] = result
+        print(f'{scenario[0]:<28} {format_number(result["p50_ms"], 9, 2)} {format_number(result["p95_ms"], 9, 2)} '
+              f'{format_number(result["p99_ms"], 9, 2)} {format_number(result["throughput_rps"], 9, 1)} '
+              f'{result["peak_rss_mb"] or 0:>8.1f}  {result["errors"] or ""}')
+    return results
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_gunicorn(env, args):
+    """gunicorn 으로 app:app 을 띄우고 응답할 때까지 기다립니다."""
+    port = free_port()
+    command = [
+        sys.executable, '-m', 'gunicorn', 'app:app',
+        '--bind', f'127.0.0.1:{port}',
+        '--workers', str(args.gunicorn_workers),
+        '--threads', str(args.gunicorn_threads),
+        '--log-level', 'warning'
+    ]
+    process = subprocess.Popen(command, cwd=ROOT_DIR, env=dict(os.environ, **env))
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'gunicorn 이 종료되었습니다 (코드 {process.returncode})')
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/api/menu')
+            if conn.getresponse().status == 200:
+                conn.close()
+                return process, port
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('gunicorn 이 30초 안에 응답하지 않았습니다.')
+
+def stop_process(process):
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+# ---------------------------------------------------------------------------
+# 기준선 비교
+# ---------------------------------------------------------------------------
+
+def compare_with_baseline(result, baseline, threshold):
+    """p95 지연과 처리량이 threshold(비율) 이상 나빠졌거나 오류 응답이 생긴 엔드포인트를 찾습니다."""
+    regressions = []
+    print(f'\n기준선 비교 (허용 변화 {threshold:.0%})')
+    for mode, endpoints in result['results'].items():
+        base_endpoints = baseline.get('results', {}).get(mode, {})
+        for name, current in endpoints.items():
+            base = base_endpoints.get(name)
+            if not base:
+                continue
+            if current['errors'] or not current['ok_requests'] or base.get('p95_ms') is None:
+                if current['errors']:
+                    regressions.append((mode, name))
+                print(f'[{mode}] {name:<28} 비교 생략 (오류 응답 {current["errors"] or "없음"})'
+                      + ('  <-- 회귀' if current['errors'] else ''))
+                continue
+            p95_change = (current['p95_ms'] - base['p95_ms']) / base['p95_ms'] if base['p95_ms'] else 0
+            rps_change = ((current['throughput_rps'] - base['throughput_rps']) / base['throughput_rps']
+                          if base.get('throughput_rps') else 0)
+            mark = ''
+            if p95_change > threshold or rps_change < -threshold:
+                mark = '  <-- 회귀'
+                regressions.append((mode, name))
+            print(f'[{mode}] {name:<28} p95 {base["p95_ms"]:>8.2f} -> {current["p95_ms"]:>8.2f} ({p95_change:+.0%})  '
+                  f'rps {base["throughput_rps"]:>8.1f} -> {current["throughput_rps"]:>8.1f} ({rps_change:+.0%}){mark}')
+    return regressions
+
+def failed_endpoints(result):
+    """정상 상태 코드가 아닌 응답이 있었던 (모드, 엔드포인트, 오류) 목록"""
+    return [(mode, name, endpoint['errors'])
+            for mode, endpoints in result['results'].items()
+            for name, endpoint in endpoints.items() if endpoint['errors']]
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='HANSTAR API 벤치마크')
+    parser.add_argument('--inquiries', type=int, default=10000, help='문의 데이터 건수')
+    parser.add_argument('--materials', type=int, default=1000, help='자료 데이터 건수')
+    parser.add_argument('--requests', type=int, default=200, help='엔드포인트당 요청 수')
+    parser.add_argument('--warmup', type=int, default=10, help='엔드포인트당 워밍업 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--mode', choices=['testclient', 'gunicorn', 'both'], default='both')
+    parser.add_argument('--gunicorn-workers', type=int, default=2)
+    parser.add_argument('--gunicorn-threads', type=int, default=4)
+    parser.add_argument('--only', nargs='*', help='지정한 엔드포인트만 실행')
+    parser.add_argument('--include', nargs='*', default=[], help='기본 제외 엔드포인트 추가 (backup_database)')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', help='결과 JSON 경로 (기본값: benchmark-results/<시각>.json)')
+    parser.add_argument('--baseline', help='비교할 기준선 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help=f'결과를 {DEFAULT_BASELINE} 로도 저장')
+    parser.add_argument('--threshold', type=float, default=0.10, help='회귀로 판단할 변화 비율')
+    parser.add_argument('--keep-data', action='store_true', help='임시 데이터 디렉터리를 삭제하지 않음')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    random.seed(args.seed)
+
+    scenarios = [scenario for scenario in SCENARIOS
+                 if scenario[0] not in DEFAULT_EXCLUDED or scenario[0] in args.include]
+    if args.only:
+        unknown = set(args.only) - {scenario[0] for scenario in SCENARIOS}
+        if unknown:
+            print(f'알 수 없는 엔드포인트: {", ".join(sorted(unknown))}')
+            return 2
+        scenarios = [scenario for scenario in SCENARIOS if scenario[0] in args.only]
+
+    work_dir = tempfile.mkdtemp(prefix='hanstar-bench-')
+    env = prepare_environment(work_dir)
+    sys.path.insert(0, ROOT_DIR)
+
+    try:
+        import app as app_module
+        seed_database(app_module, args.inquiries, args.materials, args.seed)
+        # 취소 시나리오는 요청마다 세션 하나를 쓰므로 두 모드의 워밍업 + 측정 횟수만큼 준비
+        upload_ids = seed_upload_sessions(app_module, 2 * (args.requests + args.warmup) + 1)
+        cursors = build_page_cursors(app_module, args.inquiries, args.materials)
+
+        result = {
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'git_revision': git_revision(),
+                'python': sys.version.split()[0],
+                'sqlite': sqlite3.sqlite_version,
+                'inquiries': args.inquiries,
+                'materials': args.materials,
+                'requests': args.requests,
+                'concurrency': args.concurrency
+            },
+            'results': {}
+        }
+
+        # 삭제 시나리오가 같은 ID 를 두 번 지우지 않도록 두 모드가 컨텍스트를 공유
+        ctx = ScenarioContext(args.inquiries, args.materials, cursors, upload_ids)
+        if args.mode in ('testclient', 'both'):
+            result['results']['testclient'] = run_suite(
+                'testclient', lambda: TestClientAdapter(app_module.app), scenarios, ctx, args, os.getpid(), False
+            )
+            app_module.flush_download_counts()
+            app_module.close_thread_connection()
+
+        if args.mode in ('gunicorn', 'both'):
+            process, port = start_gunicorn(env, args)
+            try:
+                result['meta']['gunicorn'] = {'workers': args.gunicorn_workers, 'threads': args.gunicorn_threads}
+                result['results']['gunicorn'] = run_suite(
+                    'gunicorn', lambda: HttpAdapter('127.0.0.1', port), scenarios, ctx, args, process.pid, True
+                )
+            finally:
+                stop_process(process)
+    finally:
+        if args.keep_data:
+            print(f'데이터 디렉터리 유지: {work_dir}')
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = args.output or os.path.join(RESULTS_DIR, f'{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
+    with open(output_path, 'w', encoding='utf-8') as output_file:
+        json.dump(result, output_file, ensure_ascii=False, indent=2)
+    print(f'\n결과 저장: {output_path}')
+
+    if args.save_baseline:
+        shutil.copyfile(output_path, DEFAULT_BASELINE)
+        print(f'기준선 저장: {DEFAULT_BASELINE}')
+
+    exit_code = 0
+    failures = failed_endpoints(result)
+    if failures:
+        # 오류 응답은 지연 시간/처리량에 포함되지 않으므로 따로 실패로 보고
+        print(f'\n오류 응답이 있는 엔드포인트 {len(failures)}개:')
+        for mode, name, errors in failures:
+            print(f'  {mode}/{name}: {errors}')
+        exit_code = 1
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_with_baseline(result, baseline, args.threshold)
+        if regressions:
+            print(f'\n회귀 {len(regressions)}건: {", ".join(f"{mode}/{name}" for mode, name in regressions)}')
+            return 1
+        print('\n회귀 없음')
+
+    return exit_code
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,455 @@
+"""정적 파일 빌드
+
+static/ 의 텍스트 파일을 static/dist/ 로 복사하면서
+- JS/CSS 를 압축(minify)하고
+- 내용 해시를 파일 이름에 넣고 (script.js -> script.1a2b3c4d5e.js)
+- .gz / .br 사전 압축본을 함께 만들고
+- 이미지/영상은 복사하지 않고 원본을 ?v=<내용 해시> 로 참조하며,
+  이미지의 WebP/AVIF 및 축소본만 dist/ 에 만들고 (Pillow 필요)
+- index.html 의 참조를 빌드된 파일 이름으로 바꿔 dist/index.html 로 저장합니다.
+
+app.py 는 static/dist/manifest.json 이 있으면 빌드된 파일을 제공합니다
+(해시가 붙은 파일은 Cache-Control: immutable, Accept-Encoding 에 따라 .br/.gz 선택).
+
+manifest 에는 원본의 해시(source_hash)도 기록하므로, 빌드 결과를 저장소에 커밋해 배포할 때
+원본만 고치고 다시 빌드하지 않은 경우를 --check 로 확인할 수 있습니다.
+커밋하는 것은 텍스트 결과(JS/CSS/index.html/manifest)뿐이며, 사전 압축본과 이미지 변형은
+.gitignore 로 제외됩니다 (없으면 app.py 가 원본을 제공).
+
+사용 예:
+    python build_static.py          # 빌드
+    python build_static.py --check  # 빌드 결과가 현재 원본과 맞는지 확인 (다르면 종료 코드 1)
+    python build_static.py --clean  # 빌드 결과 삭제 (원본 파일을 그대로 제공)
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+from image_variants import generate_image_variants, image_variants_available, is_image_file
+
+# 선택적 의존성: 설치되어 있으면 사용
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT_DIR, 'static')
+DIST_NAME = 'dist'
+DIST_DIR = os.path.join(STATIC_DIR, DIST_NAME)
+MANIFEST_NAME = 'manifest.json'
+
+# 빌드 대상에서 제외 (업로드 파일, 빌드 결과)
+EXCLUDED_DIRS = {DIST_NAME, 'uploads'}
+# 사전 압축본을 만들 텍스트 형식 (이미지/영상은 이미 압축되어 있음)
+COMPRESSIBLE_EXTENSIONS = {'.js', '.css', '.html', '.svg', '.json', '.txt'}
+HASH_LENGTH = 10
+# 이미지 축소본 폭 (원본보다 작은 것만 생성)
+STATIC_IMAGE_WIDTHS = (480, 960, 1600)
+
+def minify_css(source):
+    """주석과 불필요한 공백을 제거합니다 (문자열 안은 그대로 유지)."""
+    if rcssmin is not None:
+        return rcssmin.cssmin(source)
+
+    output = []
+    index = 0
+    length = len(source)
+    pending_space = False
+    while index < length:
+        char = source[index]
+        if char in '"\'':
+            end = index + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            if pending_space and output and output[-1] not in '{};:,>(':
+                output.append(' ')
+            pending_space = False
+            output.append(source[index:end + 1])
+            index = end + 1
+        elif source.startswith('/*', index):
+            end = source.find('*/', index + 2)
+            index = length if end == -1 else end + 2
+        elif char.isspace():
+            pending_space = True
+            index += 1
+        else:
+            if char in '{};:,>)':
+                pending_space = False
+                # 마지막 선언 뒤의 세미콜론 제거
+                if char == '}' and output and output[-1] == ';':
+                    output.pop()
+            elif pending_space and output and output[-1] not in '{};:,>(':
+                output.append(' ')
+            pending_space = False
+            output.append(char)
+            index += 1
+    return ''.join(output).strip() + '\n'
+
+# 이 문자 뒤의 '/' 는 나눗셈이 아니라 정규식의 시작
+_REGEX_PRECEDING = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_PRECEDING_WORDS = ('return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw')
+
+def _is_word_char(char):
+    return char.isalnum() or char in '_$'
+
+def _starts_regex(preceding):
+    """앞선 코드로 보아 '/' 가 정규식의 시작인지 판단합니다."""
+    if not preceding or preceding[-1] in _REGEX_PRECEDING:
+        return True
+    word = re.search(r'[\w$]+$', preceding)
+    return word is not None and word.group(0) in _REGEX_PRECEDING_WORDS
+
+def minify_js(source):
+    """주석과 들여쓰기/불필요한 공백을 제거합니다.
+
+    문자열, 템플릿 리터럴, 정규식은 그대로 두고 줄바꿈은 유지하므로 (자동 세미콜론 삽입 보존)
+    코드의 의미는 바뀌지 않습니다. rjsmin 이 설치되어 있으면 그것을 사용합니다.
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(source)
+
+    output = []
+    index = 0
+    length = len(source)
+    pending = ''           # 보류 중인 공백 ('', ' ', '\n')
+    template_depth = []    # 템플릿 리터럴 안의 ${ } 중첩 추적
+
+    def last_significant():
+        for chunk in reversed(output):
+            stripped = chunk.rstrip()
+            if stripped:
+                return stripped
+        return ''
+
+    def flush_whitespace(next_char):
+        nonlocal pending
+        if pending and output:
+            previous = output[-1][-1:]
+            if pending == '\n':
+                if previous != '\n':
+                    output.append('\n')
+            elif (_is_word_char(previous) and _is_word_char(next_char)) or \
+                    (previous in '+-' and previous == next_char):
+                output.append(' ')
+        pending = ''
+
+    def read_template(start):
+        """` 부터 템플릿 끝 또는 ${ 직전까지 읽습니다."""
+        end = start
+        while end < length:
+            if source[end] == '\\':
+                end += 2
+                continue
+            if source[end] == '`':
+                return end + 1, False
+            if source.startswith('${', end):
+                return end + 2, True
+            end += 1
+        return length, False
+
+    while index < length:
+        char = source[index]
+
+        if char in '"\'':
+            flush_whitespace(char)
+            end = index + 1
+            while end < length and source[end] != char and source[end] != '\n':
+                end += 2 if source[end] == '\\' else 1
+            output.append(source[index:end + 1])
+            index = end + 1
+        elif char == '`':
+            flush_whitespace(char)
+            end, opened = read_template(index + 1)
+            output.append(source[index:end])
+            if opened:
+                template_depth.append(0)
+            index = end
+        elif char == '}' and template_depth and template_depth[-1] == 0:
+            # ${ ... } 가 끝나고 템플릿 본문이 이어짐
+            pending = ''
+            template_depth.pop()
+            end, opened = read_template(index + 1)
+            output.append(source[index:end])
+            if opened:
+                template_depth.append(0)
+            index = end
+        elif source.startswith('//', index):
+            end = source.find('\n', index)
+            index = length if end == -1 else end
+        elif source.startswith('/*', index):
+            end = source.find('*/', index + 2)
+            index = length if end == -1 else end + 2
+            pending = pending or ' '
+        elif char == '/' and _starts_regex(last_significant()):
+            flush_whitespace(char)
+            end = index + 1
+            in_class = False
+            while end < length and source[end] != '\n':
+                if source[end] == '\\':
+                    end += 2
+                    continue
+                if source[end] == '[':
+                    in_class = True
+                elif source[end] == ']':
+                    in_class = False
+                elif source[end] == '/' and not in_class:
+                    break
+                end += 1
+            end += 1
+            while end < length and _is_word_char(source[end]):
+                end += 1  # 플래그
+            output.append(source[index:end])
+            index = end
+        elif char.isspace():
+            if char == '\n':
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            index += 1
+        else:
+            if template_depth:
+                if char == '{':
+                    template_depth[-1] += 1
+                elif char == '}':
+                    template_depth[-1] -= 1
+            flush_whitespace(char)
+            output.append(char)
+            index += 1
+
+    return ''.join(output).strip() + '\n'
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+def write_precompressed(path, data):
+    """.gz / .br 사전 압축본을 만들고, 실제로 만든 인코딩 목록을 반환합니다."""
+    encodings = []
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        if len(compressed) < len(data):
+            with open(path + '.br', 'wb') as output_file:
+                output_file.write(compressed)
+            encodings.append('br')
+    # mtime=0: 같은 입력이면 같은 결과 (재빌드 시 ETag 유지)
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(compressed) < len(data):
+        with open(path + '.gz', 'wb') as output_file:
+            output_file.write(compressed)
+        encodings.append('gzip')
+    return encodings
+
+def iter_source_files():
+    """빌드할 원본 파일의 static/ 기준 상대 경로 (index.html 제외)"""
+    for directory, dir_names, file_names in os.walk(STATIC_DIR):
+        relative_dir = os.path.relpath(directory, STATIC_DIR)
+        if relative_dir == '.':
+            dir_names[:] = [name for name in dir_names if name not in EXCLUDED_DIRS]
+        for file_name in sorted(file_names):
+            relative_path = os.path.normpath(os.path.join(relative_dir, file_name)).replace(os.sep, '/')
+            if relative_path == 'index.html' or file_name.startswith('.'):
+                continue
+            yield relative_path
+
+def build_asset(relative_path):
+    """원본 하나를 빌드하고 manifest 항목을 반환합니다."""
+    source_path = os.path.join(STATIC_DIR, relative_path)
+    with open(source_path, 'rb') as source_file:
+        data = source_file.read()
+    source_hash = content_hash(data)
+
+    stem, extension = os.path.splitext(relative_path)
+    if extension.lower() not in COMPRESSIBLE_EXTENSIONS:
+        # 이미지/영상은 빌드로 내용이 바뀌지 않으므로 같은 사본을 dist/ 에 두지 않고 원본을 ?v= 로 참조
+        entry = {
+            'path': relative_path,
+            'version': source_hash,
+            'size': len(data),
+            'encodings': [],
+            'fingerprinted': False,
+            'source_hash': source_hash
+        }
+        if is_image_file(relative_path):
+            entry.update(build_image_variants(source_path, os.path.join(DIST_DIR, f'{stem}.{source_hash}{extension}')))
+        return entry
+
+    if extension == '.js':
+        data = minify_js(data.decode('utf-8')).encode('utf-8')
+    elif extension == '.css':
+        data = minify_css(data.decode('utf-8')).encode('utf-8')
+
+    built_relative = f'{stem}.{content_hash(data)}{extension}'
+    built_path = os.path.join(DIST_DIR, built_relative)
+    os.makedirs(os.path.dirname(built_path), exist_ok=True)
+    with open(built_path, 'wb') as output_file:
+        output_file.write(data)
+
+    return {
+        'path': f'{DIST_NAME}/{built_relative}',
+        'size': len(data),
+        'encodings': write_precompressed(built_path, data),
+        'fingerprinted': True,
+        'source_hash': source_hash
+    }
+
+def build_image_variants(source_path, base_path):
+    """이미지의 WebP/AVIF 및 축소본을 base_path 옆에 만들고 manifest 항목에 넣을 정보를 반환합니다."""
+    if not image_variants_available():
+        return {}
+
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+    variants = generate_image_variants(source_path, base_path, STATIC_IMAGE_WIDTHS)
+    if not variants:
+        return {}
+
+    def static_relative(path):
+        return os.path.relpath(path, STATIC_DIR).replace(os.sep, '/')
+
+    from PIL import Image
+    with Image.open(source_path) as image:
+        width = image.width
+
+    return {
+        'width': width,
+        'variants': {
+            mimetype: {str(variant_width): static_relative(path) for variant_width, path in by_width.items()}
+            for mimetype, by_width in variants.items()
+        }
+    }
+
+def build_index(files):
+    """index.html 의 static/ 참조를 빌드된 파일로 바꿔 dist/index.html 로 저장합니다."""
+    with open(os.path.join(STATIC_DIR, 'index.html'), 'rb') as index_file:
+        source = index_file.read()
+    html = source.decode('utf-8')
+
+    def replace(match):
+        entry = files.get(match.group(3))
+        if entry is None:
+            return match.group(0)
+        return f'{match.group(1)}={match.group(2)}{asset_url(entry)}{match.group(2)}'
+
+    html = re.sub(r'(src|href)=(["\'])/?static/([^"\']+)\2', replace, html)
+    html = re.sub(r'<img\b[^>]*>', lambda match: add_srcset(match.group(0), files), html)
+    data = html.encode('utf-8')
+    built_path = os.path.join(DIST_DIR, 'index.html')
+    with open(built_path, 'wb') as output_file:
+        output_file.write(data)
+
+    return {
+        'path': f'{DIST_NAME}/index.html',
+        'size': len(data),
+        'encodings': write_precompressed(built_path, data),
+        # index.html 은 이름이 바뀌지 않으므로 매번 재검증
+        'fingerprinted': False,
+        'source_hash': content_hash(source)
+    }
+
+def asset_url(entry):
+    """index.html 에서 참조할 경로 (해시가 이름에 없는 파일은 ?v=<내용 해시> 를 붙임)"""
+    url = f'static/{entry["path"]}'
+    return f'{url}?v={entry["version"]}' if entry.get('version') else url
+
+def add_srcset(tag, files):
+    """축소본이 있는 이미지 태그에 srcset 을 추가합니다 (?w= 로 폭 지정, 형식은 Accept 로 협상)."""
+    if 'srcset=' in tag:
+        return tag
+    match = re.search(r'src=(["\'])(static/[^"\']+)\1', tag)
+    if not match:
+        return tag
+    entry = next((entry for entry in files.values() if asset_url(entry) == match.group(2)), None)
+    if not entry or 'width' not in entry:
+        return tag
+
+    widths = sorted({int(width) for by_width in entry['variants'].values() for width in by_width if int(width)})
+    if not widths:
+        return tag
+    url = asset_url(entry)
+    separator = '&' if '?' in url else '?'
+    candidates = [f'{url}{separator}w={width} {width}w' for width in widths]
+    candidates.append(f'{url} {entry["width"]}w')
+    return tag.replace(match.group(0), f'{match.group(0)} srcset="{", ".join(candidates)}"', 1)
+
+def clean():
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+        print(f'빌드 결과 삭제: {DIST_DIR}')
+
+def build():
+    clean()
+    os.makedirs(DIST_DIR)
+
+    files = {}
+    for relative_path in iter_source_files():
+        entry = build_asset(relative_path)
+        files[relative_path] = entry
+        original_size = os.path.getsize(os.path.join(STATIC_DIR, relative_path))
+        print(f'{relative_path:<28} -> {entry["path"]:<40} {original_size:>9} -> {entry["size"]:>9} bytes '
+              f'{"+" + "/".join(entry["encodings"]) if entry["encodings"] else ""}'
+              f'{" +" + "/".join(sorted(entry["variants"])) if entry.get("variants") else ""}')
+
+    files['index.html'] = build_index(files)
+    print(f'{"index.html":<28} -> {files["index.html"]["path"]}')
+
+    with open(os.path.join(DIST_DIR, MANIFEST_NAME), 'w', encoding='utf-8') as manifest_file:
+        json.dump({'files': files}, manifest_file, ensure_ascii=False, indent=2)
+
+    if brotli is None:
+        print('brotli 모듈이 없어 .br 파일은 만들지 않았습니다 (pip install brotli).')
+    if not image_variants_available():
+        print('Pillow 가 없어 이미지 변형(WebP/AVIF)은 만들지 않았습니다 (pip install Pillow).')
+    print(f'정적 파일 빌드 완료: {DIST_DIR}')
+
+def check():
+    """manifest 의 source_hash 와 현재 원본을 비교합니다. 다시 빌드해야 하면 False."""
+    try:
+        with open(os.path.join(DIST_DIR, MANIFEST_NAME), encoding='utf-8') as manifest_file:
+            files = json.load(manifest_file)['files']
+    except (OSError, ValueError, KeyError):
+        print('빌드 결과가 없습니다 (python build_static.py).')
+        return False
+
+    sources = set(iter_source_files()) | {'index.html'}
+    stale = sorted(sources.symmetric_difference(files))
+    for relative_path in sorted(sources & set(files)):
+        with open(os.path.join(STATIC_DIR, relative_path), 'rb') as source_file:
+            if content_hash(source_file.read()) != files[relative_path].get('source_hash'):
+                stale.append(relative_path)
+
+    for relative_path in stale:
+        print(f'다시 빌드 필요: {relative_path}')
+    if not stale:
+        print('빌드 결과가 최신입니다.')
+    return not stale
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='정적 파일 빌드 (minify, 사전 압축, 내용 해시)')
+    parser.add_argument('--clean', action='store_true', help='빌드 결과만 삭제')
+    parser.add_argument('--check', action='store_true', help='빌드 결과가 현재 원본과 맞는지 확인')
+    args = parser.parse_args(argv)
+
+    if args.clean:
+        clean()
+    elif args.check:
+        return 0 if check() else 1
+    else:
+        build()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""이미지 변형(WebP/AVIF, 축소본) 생성과 Accept 협상
+
+build_static.py (static/ 이미지)와 app.py (업로드된 이미지 자료)가 함께 사용합니다.
+변형은 원본 옆에 같은 이름 + 접미사로 저장합니다.
+    원본:   .../abcd1234
+    변형:   .../abcd1234.avif, .../abcd1234.webp            (원본 크기)
+            .../abcd1234.w320.avif, .../abcd1234.w320.webp  (폭 320px 축소본)
+
+Pillow 는 선택적 의존성입니다. 설치되어 있지 않으면 변형을 만들지 않고 원본을 그대로 제공합니다.
+Pillow 는 처음 변형을 만들 때 불러옵니다 (이미 만든 변형을 고르는 데는 필요 없으므로 콜드 스타트 시간 절약).
+만들 변형이 없는 이미지(애니메이션 GIF, 이미 충분히 작은 이미지 등)는 <원본>.novariants 표시 파일을 남겨
+다시 시도하지 않습니다.
+"""
+import os
+import uuid
+
+_pillow = None
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif'}
+NO_VARIANTS_SUFFIX = '.novariants'
+
+# 선호 순서 (압축률이 좋은 형식부터): (mimetype, Pillow 형식, 접미사, 저장 옵션)
+VARIANT_FORMATS = (
+    ('image/avif', 'AVIF', '.avif', {'quality': 55}),
+    ('image/webp', 'WEBP', '.webp', {'quality': 80, 'method': 6}),
+)
+
+def _load_pillow():
+    """(Image, ImageOps, features) 모듈을 반환합니다. Pillow 가 없으면 빈 튜플."""
+    global _pillow
+    if _pillow is None:
+        try:
+            from PIL import Image, ImageOps, features
+            _pillow = (Image, ImageOps, features)
+        except ImportError:
+            _pillow = ()
+    return _pillow
+
+def image_variants_available():
+    return bool(_load_pillow())
+
+def supported_formats():
+    """현재 Pillow 빌드에서 저장 가능한 변형 형식"""
+    if not _load_pillow():
+        return ()
+    features = _pillow[2]
+    return tuple(entry for entry in VARIANT_FORMATS
+                 if features.check(entry[1].lower()))
+
+def is_image_file(file_name):
+    return os.path.splitext(file_name)[1].lower() in IMAGE_EXTENSIONS
+
+def variant_path(base_path, suffix, width=0):
+    """변형 파일 경로. width 가 0 이면 원본 크기."""
+    return f'{base_path}.w{width}{suffix}' if width else f'{base_path}{suffix}'
+
+def generate_image_variants(source_path, base_path, widths):
+    """원본 이미지로 원본 크기 + 지정한 폭(원본보다 작은 것만)의 변형을 만듭니다.
+
+    원본보다 커지는 원본 크기 변형은 버립니다. 애니메이션 GIF 는 건너뜁니다.
+    반환값: {mimetype: {폭(0=원본 크기): 경로}}
+    """
+    formats = supported_formats()
+    if not formats:
+        return {}
+
+    Image, ImageOps, _ = _pillow
+    variants = {}
+    with Image.open(source_path) as opened:
+        if getattr(opened, 'is_animated', False):
+            return {}
+        image = ImageOps.exif_transpose(opened)
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        original_size = os.path.getsize(source_path)
+        for width in [0] + sorted(width for width in widths if width < image.width):
+            if width:
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.LANCZOS)
+            else:
+                resized = image
+
+            for mimetype, pillow_format, suffix, options in formats:
+                path = variant_path(base_path, suffix, width)
+                # 같은 이미지를 동시에 처리해도 임시 파일이 겹치지 않도록 고유 이름 사용
+                temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+                resized.save(temp_path, pillow_format, **options)
+                if not width and os.path.getsize(temp_path) >= original_size:
+                    os.remove(temp_path)
+                    continue
+                os.replace(temp_path, path)
+                variants.setdefault(mimetype, {})[width] = path
+
+    return variants
+
+def mark_no_variants(base_path):
+    """변형을 만들 수 없는 이미지임을 기록합니다."""
+    open(base_path + NO_VARIANTS_SUFFIX, 'wb').close()
+
+def has_no_variants(base_path):
+    return os.path.exists(base_path + NO_VARIANTS_SUFFIX)
+
+def existing_image_variants(base_path, widths):
+    """디스크에 이미 만들어진 변형을 찾습니다. 반환 형식은 generate_image_variants 와 같음."""
+    variants = {}
+    for mimetype, _, suffix, _ in VARIANT_FORMATS:
+        for width in (0,) + tuple(widths):
+            path = variant_path(base_path, suffix, width)
+            if os.path.exists(path):
+                variants.setdefault(mimetype, {})[width] = path
+    return variants
+
+def remove_image_variants(base_path, widths):
+    paths = [path for mimetype_variants in existing_image_variants(base_path, widths).values()
+             for path in mimetype_variants.values()]
+    for path in paths + [base_path + NO_VARIANTS_SUFFIX]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def choose_image_variant(variants, accept_mimetypes, requested_width=0):
+    """Accept 헤더와 요청 폭에 맞는 변형 경로와 mimetype 을 고릅니다.
+
+    요청 폭 이상인 가장 작은 축소본을 사용하고, 없으면 원본 크기 변형을 사용합니다.
+    클라이언트가 받을 수 있는 변형이 없으면 (None, None) — 원본을 보내면 됩니다.
+    """
+    for mimetype, _, _, _ in VARIANT_FORMATS:
+        by_width = variants.get(mimetype)
+        if not by_width or not accept_mimetypes[mimetype]:
+            continue
+        # image/* 같은 와일드카드만으로는 새 형식을 보내지 않음 (구형 브라우저 보호)
+        if mimetype not in (entry for entry, _ in accept_mimetypes):
+            continue
+        if requested_width:
+            larger = sorted(width for width in by_width if width and width >= requested_width)
+            if larger:
+                return by_width[larger[0]], mimetype
+        if 0 in by_width:
+            return by_width[0], mimetype
+    return None, None
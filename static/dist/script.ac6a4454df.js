@@ -0,0 +1,1883 @@
+const CHUNKED_UPLOAD_THRESHOLD=4*1024*1024;
+const MAX_UPLOAD_RETRIES=5;
+const MATERIALS_PAGE_SIZE=20;
+const SHA256_K=new Uint32Array([
+0x428a2f98,0x71374491,0xb5c0fbcf,0xe9b5dba5,0x3956c25b,0x59f111f1,0x923f82a4,0xab1c5ed5,
+0xd807aa98,0x12835b01,0x243185be,0x550c7dc3,0x72be5d74,0x80deb1fe,0x9bdc06a7,0xc19bf174,
+0xe49b69c1,0xefbe4786,0x0fc19dc6,0x240ca1cc,0x2de92c6f,0x4a7484aa,0x5cb0a9dc,0x76f988da,
+0x983e5152,0xa831c66d,0xb00327c8,0xbf597fc7,0xc6e00bf3,0xd5a79147,0x06ca6351,0x14292967,
+0x27b70a85,0x2e1b2138,0x4d2c6dfc,0x53380d13,0x650a7354,0x766a0abb,0x81c2c92e,0x92722c85,
+0xa2bfe8a1,0xa81a664b,0xc24b8b70,0xc76c51a3,0xd192e819,0xd6990624,0xf40e3585,0x106aa070,
+0x19a4c116,0x1e376c08,0x2748774c,0x34b0bcb5,0x391c0cb3,0x4ed8aa4a,0x5b9cca4f,0x682e6ff3,
+0x748f82ee,0x78a5636f,0x84c87814,0x8cc70208,0x90befffa,0xa4506ceb,0xbef9a3f7,0xc67178f2
+]);
+class Sha256{
+constructor(){
+this.state=new Uint32Array([
+0x6a09e667,0xbb67ae85,0x3c6ef372,0xa54ff53a,0x510e527f,0x9b05688c,0x1f83d9ab,0x5be0cd19
+]);
+this.words=new Uint32Array(64);
+this.buffer=new Uint8Array(64);
+this.bufferLength=0;
+this.bytesHashed=0;
+}
+update(data){
+let position=0;
+this.bytesHashed+=data.length;
+if(this.bufferLength>0){
+position=Math.min(64-this.bufferLength,data.length);
+this.buffer.set(data.subarray(0,position),this.bufferLength);
+this.bufferLength+=position;
+if(this.bufferLength<64){
+return this;
+}
+this.processBlock(this.buffer,0);
+this.bufferLength=0;
+}
+for(;position+64<=data.length;position+=64){
+this.processBlock(data,position);
+}
+if(position<data.length){
+this.buffer.set(data.subarray(position));
+this.bufferLength=data.length-position;
+}
+return this;
+}
+processBlock(data,start){
+const w=this.words;
+for(let i=0;i<16;i++){
+const j=start+i*4;
+w[i]=(data[j]<<24)|(data[j+1]<<16)|(data[j+2]<<8)|data[j+3];
+}
+for(let i=16;i<64;i++){
+const x=w[i-15];
+const y=w[i-2];
+const s0=((x>>>7)|(x<<25))^((x>>>18)|(x<<14))^(x>>>3);
+const s1=((y>>>17)|(y<<15))^((y>>>19)|(y<<13))^(y>>>10);
+w[i]=w[i-16]+s0+w[i-7]+s1;
+}
+const state=this.state;
+let a=state[0],b=state[1],c=state[2],d=state[3];
+let e=state[4],f=state[5],g=state[6],h=state[7];
+for(let i=0;i<64;i++){
+const S1=((e>>>6)|(e<<26))^((e>>>11)|(e<<21))^((e>>>25)|(e<<7));
+const t1=(h+S1+((e&f)^(~e&g))+SHA256_K[i]+w[i])|0;
+const S0=((a>>>2)|(a<<30))^((a>>>13)|(a<<19))^((a>>>22)|(a<<10));
+const t2=(S0+((a&b)^(a&c)^(b&c)))|0;
+h=g;
+g=f;
+f=e;
+e=(d+t1)|0;
+d=c;
+c=b;
+b=a;
+a=(t1+t2)|0;
+}
+state[0]+=a;
+state[1]+=b;
+state[2]+=c;
+state[3]+=d;
+state[4]+=e;
+state[5]+=f;
+state[6]+=g;
+state[7]+=h;
+}
+hexDigest(){
+const bitLength=this.bytesHashed*8;
+const padding=new Uint8Array((this.bufferLength<56?64:128)-this.bufferLength);
+const view=new DataView(padding.buffer);
+padding[0]=0x80;
+view.setUint32(padding.length-8,Math.floor(bitLength/0x100000000));
+view.setUint32(padding.length-4,bitLength>>>0);
+this.update(padding);
+return Array.from(this.state,word=>word.toString(16).padStart(8,'0')).join('');
+}
+}
+class MenuManager{
+constructor(){
+this.menuData=[];
+this.bootstrapData=null;
+this.inquiryEvents=null;
+this.lastInquiryEventId=null;
+this.adminInquiryView=null;
+this.init();
+this.initMobileMenu();
+}
+initMobileMenu(){
+const mobileMenuToggle=document.getElementById('mobileMenuToggle');
+const navMenu=document.getElementById('navMenu');
+if(mobileMenuToggle&&navMenu){
+mobileMenuToggle.addEventListener('click',()=>{
+navMenu.classList.toggle('active');
+mobileMenuToggle.textContent=navMenu.classList.contains('active')?'✕':'☰';
+});
+document.addEventListener('click',(e)=>{
+if(!navMenu.contains(e.target)&&!mobileMenuToggle.contains(e.target)){
+navMenu.classList.remove('active');
+mobileMenuToggle.textContent='☰';
+}
+});
+navMenu.addEventListener('click',(e)=>{
+if(e.target.tagName==='A'&&e.target.parentElement.querySelector('.submenu')){
+e.preventDefault();
+const parentLi=e.target.parentElement;
+parentLi.classList.toggle('active');
+}
+});
+}
+}
+async init(){
+try{
+await this.loadBootstrapData();
+await this.loadMenuData();
+this.renderMenu();
+}catch(error){
+console.error('메뉴 데이터 로딩 실패:',error);
+this.loadDefaultMenu();
+}
+}
+async loadBootstrapData(){
+try{
+const response=await fetch('/api/bootstrap');
+if(!response.ok){
+throw new Error(`API 응답 오류: ${response.status}`);
+}
+this.bootstrapData=await response.json();
+}catch(error){
+console.error('부트스트랩 데이터 로딩 실패 (개별 API 사용):',error);
+this.bootstrapData=null;
+}
+}
+async fetchContent(key,url){
+if(this.bootstrapData&&this.bootstrapData[key]!==undefined){
+return this.bootstrapData[key];
+}
+const response=await fetch(url);
+if(!response.ok){
+throw new Error(`API 응답 오류: ${response.status}`);
+}
+const data=await response.json();
+return data[key]!==undefined?data[key]:data;
+}
+async loadMenuData(){
+try{
+console.log('메뉴 데이터 로딩 시작...');
+this.menuData=await this.fetchContent('menu','/api/menu');
+console.log('구글 시트에서 가져온 메뉴 데이터:',this.menuData);
+}catch(error){
+console.error('API 호출 실패:',error);
+throw error;
+}
+}
+loadDefaultMenu(){
+this.menuData=[
+{
+main:'HOME',
+sub:[]
+},
+{
+main:'ABOUT',
+sub:['회사소개','연혁','조직도']
+},
+{
+main:'SERVICES',
+sub:['서비스1','서비스2','서비스3']
+},
+{
+main:'CONTACT',
+sub:['연락처','찾아오시는길']
+},
+{
+main:'문의및답변',
+sub:['문의하기','문의답변']
+},
+{
+main:'자료배포',
+sub:['무역자료','운송자료','법규자료']
+}
+];
+}
+renderMenu(){
+const navMenu=document.getElementById('navMenu');
+if(!navMenu){
+console.error('navMenu 요소를 찾을 수 없습니다.');
+return;
+}
+console.log('메뉴 렌더링 시작...');
+navMenu.innerHTML='';
+this.menuData.forEach(menuItem=>{
+console.log(`메뉴 아이템 렌더링: ${menuItem.main} (서브메뉴: ${menuItem.sub.length}개)`);
+const li=document.createElement('li');
+const mainLink=document.createElement('a');
+mainLink.href='#';
+mainLink.textContent=menuItem.main;
+mainLink.addEventListener('click',(e)=>{
+e.preventDefault();
+this.handleMenuClick(menuItem.main);
+});
+li.appendChild(mainLink);
+if(menuItem.sub&&menuItem.sub.length>0){
+const submenu=document.createElement('ul');
+submenu.className='submenu';
+menuItem.sub.forEach(subItem=>{
+const subLi=document.createElement('li');
+const subLink=document.createElement('a');
+subLink.href='#';
+subLink.textContent=subItem;
+subLink.addEventListener('click',(e)=>{
+e.preventDefault();
+this.handleSubMenuClick(menuItem.main,subItem);
+});
+subLi.appendChild(subLink);
+submenu.appendChild(subLi);
+});
+li.appendChild(submenu);
+}
+navMenu.appendChild(li);
+});
+}
+handleMenuClick(menuName){
+console.log('메인 메뉴 클릭:',menuName);
+}
+handleSubMenuClick(mainMenu,subMenu){
+console.log('서브 메뉴 클릭:',mainMenu,'>',subMenu);
+if(mainMenu==='한스타소개'&&subMenu==='회사소개'){
+this.showCompanyIntroModal();
+}
+else if(mainMenu==='한스타소개'&&subMenu==='회사연혁'){
+this.showCompanyHistoryModal();
+}
+else if(mainMenu==='CONTACT'&&subMenu==='연락처'){
+this.showContactModal();
+}
+else if(mainMenu==='CONTACT'&&subMenu==='찾아오시는길'){
+this.showDirectionsModal();
+}
+else if(mainMenu==='문의및답변'&&subMenu==='문의하기'){
+this.showInquiryModal();
+}
+else if(mainMenu==='문의및답변'&&subMenu==='문의답변'){
+this.showInquiryListModal();
+}
+else if(mainMenu==='문의및답변'&&subMenu==='답변등록'){
+this.showAdminInquiryModal();
+}
+else if(mainMenu==='자료배포'&&subMenu==='자료받기'){
+this.showMaterialsModal();
+}
+else if(mainMenu==='자료배포'&&subMenu==='자료등록'){
+this.showAdminMaterialsModal();
+}
+}
+async showCompanyIntroModal(){
+try{
+console.log('회사소개 모달 표시 시작...');
+const companyIntro=await this.fetchContent('company_intro','/api/company-intro');
+console.log('회사소개 데이터:',companyIntro);
+this.createCompanyIntroModal(companyIntro);
+}catch(error){
+console.error('회사소개 데이터 로딩 실패:',error);
+const defaultIntro=`
+                한스타 주식회사는 국제운송과 무역의 전문기업입니다.
+                
+                우리는 1995년 설립 이후 30년간 국제물류 분야에서 축적된 노하우와 
+                글로벌 네트워크를 바탕으로 고객의 비즈니스 성공을 위한 
+                최적의 솔루션을 제공하고 있습니다.
+                
+                주요 사업영역:
+                • 해상운송: 전 세계 주요 항구 연결
+                • 항공운송: 긴급 화물 및 고가치 상품 운송
+                • 육상운송: 국내외 육상 물류 서비스
+                • 무역중개: 수출입 대행 및 무역상담
+                
+                한스타는 고객의 신뢰를 최우선으로 하며, 
+                지속적인 혁신과 서비스 개선을 통해 
+                글로벌 물류 파트너로서의 역할을 다하고 있습니다.
+            `;
+this.createCompanyIntroModal(defaultIntro);
+}
+}
+async showCompanyHistoryModal(){
+try{
+console.log('회사연혁 모달 표시 시작...');
+const companyHistory=await this.fetchContent('company_history','/api/company-history');
+console.log('회사연혁 데이터:',companyHistory);
+this.createCompanyHistoryModal(companyHistory);
+}catch(error){
+console.error('회사연혁 데이터 로딩 실패:',error);
+const defaultHistory=[
+"1995년07월 : 무역협회(KITA) 가입",
+"1997년10월 : 외항해운대리점면허취득및대리점협회(KOSMA)가입",
+"2007년02월 : '㈜한스타'로상호변경",
+"2008년06월 : 경영혁신형중소기업선정",
+"2013년01월 : 마이크로네시아 폰페이항입출항및통관선박서비스시작",
+"2015년06월 : KP&I 보험가입해난사고선박처리업무시작",
+"2021년08월 : 현대기아자원순환사업시작",
+"2023년08월 : 우즈베키스탄지사설립",
+"2023년02월 : 우즈베키스탄기아조립공장판매차량보증수리계약",
+"2023년08월 : 우즈베키스탄조립차량의특장차사업계약( 예정 )"
+];
+this.createCompanyHistoryModal(defaultHistory);
+}
+}
+async showContactModal(){
+try{
+console.log('연락처 모달 표시 시작...');
+const contact=await this.fetchContent('contact','/api/contact');
+console.log('연락처 데이터:',contact);
+this.createContactModal(contact);
+}catch(error){
+console.error('연락처 데이터 로딩 실패:',error);
+const defaultContact=[
+'한스타 주식회사',
+'대표이사: 홍길동',
+'사업자등록번호: 123-45-67890',
+'주소: 서울특별시 강남구 테헤란로 123',
+'전화: 02-1234-5678',
+'팩스: 02-1234-5679',
+'이메일: info@hanstar.co.kr',
+'홈페이지: www.hanstar.co.kr'
+];
+this.createContactModal(defaultContact);
+}
+}
+createContactModal(contactData){
+const existingModal=document.getElementById('contactModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='contactModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>연락처 정보</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="contact-info">
+                            ${contactData.map(item=>`<p class="contact-item">${item}</p>`).join('')}
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+createCompanyIntroModal(introData){
+const existingModal=document.getElementById('companyIntroModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='companyIntroModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>회사소개</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="company-intro-content">
+                            ${introData.split('\n').map(line=>
+line.trim()?`<p class="intro-line">${line}</p>`:'<br>'
+).join('')}
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+createCompanyHistoryModal(historyData){
+const existingModal=document.getElementById('companyHistoryModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='companyHistoryModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>회사연혁</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="company-history-content">
+                            ${historyData.map(item=>`<p class="history-item">${item}</p>`).join('')}
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+showDirectionsModal(){
+const address="인천광역시계양구경명대로1127 (계산동, 제5층제502호)";
+const encodedAddress=encodeURIComponent(address);
+const googleMapsUrl=`https://www.google.com/maps/search/?api=1&query=${encodedAddress}`;
+const naverMapsUrl=`https://map.naver.com/p/search/${encodedAddress}`;
+const existingModal=document.getElementById('directionsModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='directionsModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>찾아오시는 길</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="directions-info">
+                            <p class="address-info">${address}</p>
+                            <div class="map-buttons">
+                                <a href="${googleMapsUrl}" target="_blank" class="map-btn google-maps">
+                                    <span class="map-icon">🗺️</span>
+                                    <span class="map-text">Google Maps</span>
+                                </a>
+                                <a href="${naverMapsUrl}" target="_blank" class="map-btn naver-maps">
+                                    <span class="map-icon">📍</span>
+                                    <span class="map-text">Naver Maps</span>
+                                </a>
+                            </div>
+                            
+                            <div class="transportation-info">
+                                <h3 class="transportation-title">교통편 안내</h3>
+                                
+                                <div class="transport-item">
+                                    <div class="transport-icon">🚇</div>
+                                    <div class="transport-content">
+                                        <h4>지하철</h4>
+                                        <p>인천 1호선 계산역 6번 출구에서 도보 5분</p>
+                                    </div>
+                                </div>
+                                
+                                <div class="transport-item">
+                                    <div class="transport-icon">🚌</div>
+                                    <div class="transport-content">
+                                        <h4>버스</h4>
+                                        <p>계산역 정류장 하차</p>
+                                        <p>• 간선버스: 2, 15, 23, 45, 88</p>
+                                        <p>• 지선버스: 515, 520, 522, 525</p>
+                                        <p>• 마을버스: 계양01, 계양02</p>
+                                    </div>
+                                </div>
+                                
+                                <div class="transport-item">
+                                    <div class="transport-icon">🚗</div>
+                                    <div class="transport-content">
+                                        <h4>승용차</h4>
+                                        <p>경명대로를 따라 계산역 방향으로 진입</p>
+                                        <p>계산역 사거리에서 우회전 후 100m 직진</p>
+                                        <p>건물 내 지하주차장 이용 가능 (2시간 무료)</p>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+showInquiryModal(){
+const existingModal=document.getElementById('inquiryModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='inquiryModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>문의하기</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <form id="inquiryForm" class="inquiry-form">
+                            <div class="form-group">
+                                <label for="name">이름 *</label>
+                                <input type="text" id="name" name="name" required>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="phone">전화번호 *</label>
+                                <input type="tel" id="phone" name="phone" required>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="email">이메일 *</label>
+                                <input type="email" id="email" name="email" required>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="message">문의내용 *</label>
+                                <textarea id="message" name="message" rows="5" required></textarea>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="password">비밀번호 *</label>
+                                <input type="password" id="password" name="password" required>
+                                <small>문의 답변 확인 시 사용됩니다.</small>
+                            </div>
+                            
+                            <div class="form-actions">
+                                <button type="submit" class="btn btn-primary">문의하기</button>
+                                <button type="button" class="btn btn-secondary" onclick="this.closest('.contact-modal').remove()">취소</button>
+                            </div>
+                        </form>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+const form=document.getElementById('inquiryForm');
+form.addEventListener('submit',(e)=>{
+e.preventDefault();
+this.handleInquirySubmit(form);
+});
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async handleInquirySubmit(form){
+const formData=new FormData(form);
+const inquiryData={
+name:formData.get('name'),
+phone:formData.get('phone'),
+email:formData.get('email'),
+message:formData.get('message'),
+password:formData.get('password')
+};
+try{
+const response=await fetch('/api/inquiry',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify(inquiryData)
+});
+if(!response.ok){
+throw new Error(`API 응답 오류: ${response.status}`);
+}
+const result=await response.json();
+if(result.success){
+alert('문의가 성공적으로 등록되었습니다.');
+document.getElementById('inquiryModal').remove();
+}else{
+alert('문의 등록에 실패했습니다: '+result.error);
+}
+}catch(error){
+console.error('문의 제출 실패:',error);
+alert('문의 제출 중 오류가 발생했습니다. 다시 시도해주세요.');
+}
+}
+async showInquiryListModal(page=1,cursor=null){
+try{
+console.log('문의 목록 모달 표시 시작...');
+const cursorParam=cursor?`&cursor=${encodeURIComponent(cursor)}`:'';
+const response=await fetch(`/api/inquiry-list?page=${page}${cursorParam}`);
+if(!response.ok){
+throw new Error(`API 응답 오류: ${response.status}`);
+}
+const data=await response.json();
+console.log('문의 목록 데이터:',data);
+this.createInquiryListModal(data.inquiries||[],data.pagination||{});
+}catch(error){
+console.error('문의 목록 로딩 실패:',error);
+alert('문의 목록을 불러오는데 실패했습니다.');
+}
+}
+createInquiryListModal(inquiries,pagination){
+const existingModal=document.getElementById('inquiryListModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='inquiryListModal';
+modal.className='contact-modal';
+const inquiryListHtml=inquiries.length>0
+?inquiries.map(inquiry=>{
+const maskedName=inquiry.name.length>0?inquiry.name.charAt(0)+'*'.repeat(inquiry.name.length-1):'';
+const maskedPhone=inquiry.phone.length>4?inquiry.phone.substring(0,inquiry.phone.length-4)+'****':inquiry.phone;
+return`
+                         <div class="inquiry-item" data-row-id="${inquiry.row_id}">
+                             <div class="inquiry-header">
+                                 <span class="inquiry-date">${inquiry.date}</span>
+                                 <span class="inquiry-serial">${inquiry.serial}</span>
+                                 <span class="inquiry-name">${maskedName}</span>
+                                 <span class="inquiry-phone">${maskedPhone}</span>
+                                 <button class="btn btn-primary btn-sm" onclick="this.closest('.inquiry-item').querySelector('.password-form').style.display='block'">
+                                     답변보기
+                                 </button>
+                             </div>
+                             <div class="password-form" style="display: none;">
+                                 <input type="password" placeholder="비밀번호를 입력하세요" class="password-input">
+                                 <button class="btn btn-secondary btn-sm" onclick="this.closest('.inquiry-item').querySelector('.password-form').style.display='none'">
+                                     취소
+                                 </button>
+                                 <button class="btn btn-primary btn-sm" onclick="window.menuManager.verifyInquiryPassword(${inquiry.row_id}, this.previousElementSibling.previousElementSibling.value)">
+                                     확인
+                                 </button>
+                             </div>
+                         </div>
+                     `;
+}).join('')
+:'<p class="no-inquiries">등록된 문의가 없습니다.</p>';
+let paginationHtml='';
+if(pagination.total_pages>1){
+const currentPage=pagination.current_page;
+const totalPages=pagination.total_pages;
+let paginationButtons='';
+if(currentPage>1){
+const prevCursorArg=pagination.prev_cursor?`, '${pagination.prev_cursor}'`:'';
+paginationButtons+=`<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${currentPage-1}${prevCursorArg})">이전</button>`;
+}
+const startPage=Math.max(1,currentPage-2);
+const endPage=Math.min(totalPages,currentPage+2);
+for(let i=startPage;i<=endPage;i++){
+if(i===currentPage){
+paginationButtons+=`<button class="pagination-btn active">${i}</button>`;
+}else{
+paginationButtons+=`<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${i})">${i}</button>`;
+}
+}
+if(currentPage<totalPages){
+const nextCursorArg=pagination.next_cursor?`, '${pagination.next_cursor}'`:'';
+paginationButtons+=`<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${currentPage+1}${nextCursorArg})">다음</button>`;
+}
+paginationHtml=`
+                    <div class="pagination-info">
+                        <span>총 ${pagination.total_items}개 문의 중 ${((currentPage-1)*pagination.per_page)+1}-${Math.min(currentPage*pagination.per_page,pagination.total_items)}번째</span>
+                    </div>
+                    <div class="pagination-controls">
+                        ${paginationButtons}
+                    </div>
+                `;
+}
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>문의 및 답변 목록</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="inquiry-list">
+                            ${inquiryListHtml}
+                        </div>
+                        ${paginationHtml}
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async verifyInquiryPassword(rowId,password){
+if(!password){
+alert('비밀번호를 입력해주세요.');
+return;
+}
+try{
+const response=await fetch('/api/verify-inquiry',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+row_id:rowId,
+password:password
+})
+});
+if(!response.ok){
+throw new Error(`API 응답 오류: ${response.status}`);
+}
+const result=await response.json();
+if(result.success){
+this.showInquiryDetailModal(result.inquiry);
+}else{
+alert('비밀번호가 일치하지 않습니다.');
+}
+}catch(error){
+console.error('문의 확인 실패:',error);
+alert('문의 확인 중 오류가 발생했습니다. 다시 시도해주세요.');
+}
+}
+showInquiryDetailModal(inquiry){
+const existingModal=document.getElementById('inquiryDetailModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='inquiryDetailModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>문의 및 답변 상세</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="inquiry-detail">
+                            <div class="inquiry-info">
+                                <h3>문의 정보</h3>
+                                <p><strong>접수일:</strong> ${inquiry.date}</p>
+                                <p><strong>접수번호:</strong> ${inquiry.serial}</p>
+                                <p><strong>이름:</strong> ${inquiry.name}</p>
+                                <p><strong>전화번호:</strong> ${inquiry.phone}</p>
+                                <p><strong>이메일:</strong> ${inquiry.email}</p>
+                                <p><strong>문의내용:</strong></p>
+                                <div class="question-content">${inquiry.question}</div>
+                            </div>
+                            
+                            <div class="answer-info">
+                                <h3>답변 정보</h3>
+                                <p><strong>답변일:</strong> ${inquiry.answer_date||'아직 답변되지 않음'}</p>
+                                <p><strong>상태:</strong> <span class="status-${inquiry.answer_status==='답변완료'?'completed':'pending'}">${inquiry.answer_status}</span></p>
+                                <p><strong>답변내용:</strong></p>
+                                <div class="answer-content">${inquiry.answer_content}</div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async showProgramFilesModal(){
+try{
+console.log('프로그램 파일 목록 모달 표시 시작...');
+const response=await fetch('/api/program-files');
+if(!response.ok){
+throw new Error(`API 응답 오류: ${response.status}`);
+}
+const data=await response.json();
+console.log('프로그램 파일 목록 데이터:',data);
+this.createProgramFilesModal(data.files||[]);
+}catch(error){
+console.error('프로그램 파일 목록 로딩 실패:',error);
+alert('프로그램 파일 목록을 불러오는데 실패했습니다.');
+}
+}
+createProgramFilesModal(files){
+const existingModal=document.getElementById('programFilesModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='programFilesModal';
+modal.className='contact-modal';
+const filesListHtml=files.length>0
+?files.map(file=>`
+                    <div class="file-item">
+                        <div class="file-info">
+                            <div class="file-name">${file.name}</div>
+                            <div class="file-details">
+                                <span class="file-size">${file.size}</span>
+                                <span class="file-date">${file.modifiedTime}</span>
+                            </div>
+                        </div>
+                        <a href="${file.downloadUrl}" target="_blank" class="btn btn-primary btn-sm">
+                            다운로드
+                        </a>
+                    </div>
+                `).join('')
+:'<p class="no-files">등록된 파일이 없습니다.</p>';
+modal.innerHTML=`
+                <div class="contact-modal-content">
+                    <div class="contact-modal-header">
+                        <h2>프로그램 자료 다운로드</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="files-list">
+                            ${filesListHtml}
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async showAdminInquiryModal(){
+try{
+console.log('관리자 문의 모달 표시 시작...');
+this.createAdminInquiryModal();
+}catch(error){
+console.error('관리자 모달 생성 실패:',error);
+alert('관리자 모달을 생성하는데 실패했습니다.');
+}
+}
+createAdminInquiryModal(){
+this.stopInquiryEvents();
+const existingModal=document.getElementById('adminInquiryModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='adminInquiryModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content" style="max-width: 1000px; max-height: 80vh;">
+                    <div class="contact-modal-header">
+                        <h2>관리자 - 문의 답변 등록</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="admin-login-section">
+                            <div class="form-group">
+                                <label for="adminPassword">관리자 비밀번호</label>
+                                <input type="password" id="adminPassword" placeholder="관리자 비밀번호를 입력하세요" required>
+                            </div>
+                            <button class="btn btn-primary" onclick="window.menuManager.loadAdminInquiryList()">문의 목록 불러오기</button>
+                        </div>
+                        <div id="adminInquiryList" style="display: none;">
+                            <div class="form-group admin-search-bar">
+                                <input type="text" id="adminInquirySearch" placeholder="이름, 전화번호, 이메일, 문의/답변 내용 검색"
+                                       onkeydown="if (event.key === 'Enter') window.menuManager.searchAdminInquiries()">
+                                <button class="btn btn-primary btn-sm" onclick="window.menuManager.searchAdminInquiries()">검색</button>
+                            </div>
+                            <div class="admin-inquiry-list">
+                                <!-- 문의 목록이 여기에 동적으로 로드됩니다 -->
+                            </div>
+                            <div class="pagination-controls" id="adminPaginationControls">
+                                <!-- 페이지네이션 컨트롤이 여기에 동적으로 로드됩니다 -->
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async loadAdminInquiryList(page=1,cursor=null){
+try{
+const adminPassword=document.getElementById('adminPassword').value;
+if(!adminPassword){
+alert('관리자 비밀번호를 입력해주세요.');
+return;
+}
+console.log('관리자 문의 목록 로딩 시작...');
+const response=await fetch('/api/admin/inquiry-list',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword,
+page:page,
+cursor:cursor
+})
+});
+if(!response.ok){
+const errorData=await response.json();
+throw new Error(errorData.error||'관리자 인증에 실패했습니다.');
+}
+const data=await response.json();
+console.log('관리자 문의 목록 데이터:',data);
+this.displayAdminInquiryList(data.inquiries,data.pagination);
+this.startInquiryEvents(adminPassword);
+}catch(error){
+console.error('관리자 문의 목록 로딩 실패:',error);
+alert(error.message||'문의 목록을 불러오는데 실패했습니다.');
+}
+}
+async searchAdminInquiries(page=1){
+try{
+const adminPassword=document.getElementById('adminPassword').value;
+const query=document.getElementById('adminInquirySearch').value.trim();
+if(!query){
+this.loadAdminInquiryList();
+return;
+}
+console.log('관리자 문의 검색 시작...');
+const response=await fetch('/api/admin/inquiry-search',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword,
+q:query,
+page:page
+})
+});
+const data=await response.json();
+if(!response.ok||!data.success){
+throw new Error(data.error||'문의 검색에 실패했습니다.');
+}
+this.displayAdminInquiryList(data.inquiries,data.pagination,'searchAdminInquiries');
+}catch(error){
+console.error('관리자 문의 검색 실패:',error);
+alert(error.message||'문의 검색에 실패했습니다.');
+}
+}
+renderAdminInquiryItem(inquiry){
+return`
+                <div class="inquiry-item admin-inquiry-item" data-inquiry-id="${inquiry.id}">
+                    <div class="inquiry-header">
+                        <div class="inquiry-date">${inquiry.date}</div>
+                        <div class="inquiry-serial">${inquiry.serial}</div>
+                        <div class="inquiry-name">${inquiry.highlight?inquiry.highlight.name:inquiry.name}</div>
+                        <div class="inquiry-phone">${inquiry.highlight?inquiry.highlight.phone:inquiry.phone}</div>
+                        <div class="status-badge ${inquiry.status==='답변완료'?'status-completed':'status-pending'}">
+                            ${inquiry.status}
+                        </div>
+                    </div>
+                    <div class="inquiry-preview">
+                        <strong>문의내용:</strong> ${inquiry.highlight?inquiry.highlight.question:`${inquiry.question.substring(0,100)}${inquiry.question.length>100?'...':''}`}
+                    </div>
+                    ${inquiry.answer?`
+                        <div class="answer-preview">
+                            <strong>답변:</strong> ${inquiry.answer.substring(0,100)}${inquiry.answer.length>100?'...':''}
+                            <div class="answer-date">답변일: ${inquiry.answer_date}</div>
+                        </div>
+                    `:''}
+                    <div class="admin-actions">
+                        <button class="btn btn-primary btn-sm" onclick="window.menuManager.showAnswerForm(${inquiry.id})">
+                            ${inquiry.answer?'답변 수정':'답변 등록'}
+                        </button>
+                    </div>
+                </div>
+            `;
+}
+displayAdminInquiryList(inquiries,pagination,pageLoader='loadAdminInquiryList'){
+const adminInquiryList=document.getElementById('adminInquiryList');
+const inquiryListContainer=adminInquiryList.querySelector('.admin-inquiry-list');
+const paginationControls=document.getElementById('adminPaginationControls');
+this.adminInquiryView={pageLoader:pageLoader,currentPage:pagination.current_page};
+if(inquiries.length===0){
+inquiryListContainer.innerHTML='<p class="no-inquiries">등록된 문의가 없습니다.</p>';
+}else{
+inquiryListContainer.innerHTML=inquiries.map(inquiry=>this.renderAdminInquiryItem(inquiry)).join('');
+}
+if(pagination.total_pages>1){
+const prevCursorArg=pagination.prev_cursor?`, '${pagination.prev_cursor}'`:'';
+const nextCursorArg=pagination.next_cursor?`, '${pagination.next_cursor}'`:'';
+const paginationHtml=`
+                    <div class="pagination-info">
+                        총 <span id="adminInquiryTotal">${pagination.total_items}</span>개의 문의 (${pagination.current_page}/${pagination.total_pages} 페이지)
+                    </div>
+                    <div class="pagination-controls">
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(1)" ${pagination.current_page===1?'disabled':''}>
+                            처음
+                        </button>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(${pagination.current_page-1}${prevCursorArg})" ${pagination.current_page===1?'disabled':''}>
+                            이전
+                        </button>
+                        <span class="pagination-btn active">${pagination.current_page}</span>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(${pagination.current_page+1}${nextCursorArg})" ${pagination.current_page===pagination.total_pages?'disabled':''}>
+                            다음
+                        </button>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(${pagination.total_pages})" ${pagination.current_page===pagination.total_pages?'disabled':''}>
+                            마지막
+                        </button>
+                    </div>
+                `;
+paginationControls.innerHTML=paginationHtml;
+}else{
+paginationControls.innerHTML=`
+                    <div class="pagination-info">
+                        총 <span id="adminInquiryTotal">${pagination.total_items}</span>개의 문의
+                    </div>
+                `;
+}
+adminInquiryList.style.display='block';
+}
+async startInquiryEvents(adminPassword){
+if(this.inquiryEvents){
+return;
+}
+try{
+const response=await fetch('/api/admin/inquiry-events/token',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({admin_password:adminPassword})
+});
+const data=await response.json();
+if(!response.ok||!data.success){
+throw new Error(data.error||'실시간 알림 연결에 실패했습니다.');
+}
+if(!data.stream||!window.EventSource){
+this.pollInquiryEvents(adminPassword,data.token,data.poll_interval);
+return;
+}
+const params=new URLSearchParams({token:data.token});
+if(this.lastInquiryEventId){
+params.set('last_event_id',this.lastInquiryEventId);
+}
+const source=new EventSource(`/api/admin/inquiry-events?${params.toString()}`);
+this.inquiryEvents=source;
+source.addEventListener('inquiry_created',(event)=>this.handleInquiryEvent(event,true));
+source.addEventListener('answer_posted',(event)=>this.handleInquiryEvent(event,false));
+source.onopen=()=>{
+if(!document.getElementById('adminInquiryModal')){
+this.stopInquiryEvents();
+}
+};
+source.onerror=()=>{
+if(source.readyState!==EventSource.CLOSED){
+return;
+}
+this.stopInquiryEvents();
+setTimeout(()=>{
+if(document.getElementById('adminInquiryModal')){
+this.startInquiryEvents(adminPassword);
+}
+},5000);
+};
+}catch(error){
+console.error('실시간 알림 연결 실패:',error);
+}
+}
+pollInquiryEvents(adminPassword,token,intervalSeconds){
+const polling={
+timer:null,
+close(){
+clearTimeout(this.timer);
+}
+};
+this.inquiryEvents=polling;
+const poll=async()=>{
+if(!document.getElementById('adminInquiryModal')){
+this.stopInquiryEvents();
+return;
+}
+try{
+const params=new URLSearchParams({token:token,format:'json'});
+if(this.lastInquiryEventId!==null){
+params.set('last_event_id',this.lastInquiryEventId);
+}
+const response=await fetch(`/api/admin/inquiry-events?${params.toString()}`);
+if(response.status===401){
+this.stopInquiryEvents();
+this.startInquiryEvents(adminPassword);
+return;
+}
+const data=await response.json();
+if(data.success){
+data.events.forEach(item=>{
+this.applyInquiryEvent(item.inquiry,item.event==='inquiry_created');
+});
+this.lastInquiryEventId=data.last_event_id;
+}
+}catch(error){
+console.warn('실시간 알림 조회 실패:',error);
+}
+if(this.inquiryEvents===polling){
+polling.timer=setTimeout(poll,intervalSeconds*1000);
+}
+};
+poll();
+}
+stopInquiryEvents(){
+if(this.inquiryEvents){
+this.inquiryEvents.close();
+this.inquiryEvents=null;
+}
+}
+handleInquiryEvent(event,isNewInquiry){
+this.lastInquiryEventId=event.lastEventId;
+this.applyInquiryEvent(JSON.parse(event.data).inquiry,isNewInquiry);
+}
+applyInquiryEvent(inquiry,isNewInquiry){
+const listContainer=document.querySelector('#adminInquiryModal .admin-inquiry-list');
+if(!listContainer){
+this.stopInquiryEvents();
+return;
+}
+const existingItem=listContainer.querySelector(`[data-inquiry-id="${inquiry.id}"]`);
+if(existingItem){
+existingItem.outerHTML=this.renderAdminInquiryItem(inquiry);
+return;
+}
+const view=this.adminInquiryView;
+if(!isNewInquiry||!view||view.pageLoader!=='loadAdminInquiryList'||view.currentPage!==1){
+return;
+}
+const emptyMessage=listContainer.querySelector('.no-inquiries');
+if(emptyMessage){
+emptyMessage.remove();
+}
+listContainer.insertAdjacentHTML('afterbegin',this.renderAdminInquiryItem(inquiry));
+const total=document.getElementById('adminInquiryTotal');
+if(total){
+total.textContent=Number(total.textContent)+1;
+}
+}
+showAnswerForm(inquiryId){
+const existingForm=document.getElementById('answerFormModal');
+if(existingForm){
+existingForm.remove();
+}
+const modal=document.createElement('div');
+modal.id='answerFormModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content" style="max-width: 600px;">
+                    <div class="contact-modal-header">
+                        <h2>답변 등록</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <form id="answerForm" class="inquiry-form">
+                            <input type="hidden" id="inquiryId" value="${inquiryId}">
+                            <div class="form-group">
+                                <label for="answerContent">답변 내용</label>
+                                <textarea id="answerContent" rows="8" placeholder="답변 내용을 입력하세요" required></textarea>
+                            </div>
+                            <div class="form-actions">
+                                <button type="submit" class="btn btn-primary">답변 저장</button>
+                                <button type="button" class="btn btn-secondary" onclick="this.closest('.contact-modal').remove()">취소</button>
+                            </div>
+                        </form>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+const form=document.getElementById('answerForm');
+form.addEventListener('submit',(e)=>{
+e.preventDefault();
+this.submitAnswer();
+});
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async submitAnswer(){
+try{
+const inquiryId=document.getElementById('inquiryId').value;
+const answerContent=document.getElementById('answerContent').value;
+const adminPassword=document.getElementById('adminPassword').value;
+if(!answerContent.trim()){
+alert('답변 내용을 입력해주세요.');
+return;
+}
+console.log('답변 등록 시작...');
+const response=await fetch('/api/admin/add-answer',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword,
+inquiry_id:inquiryId,
+answer_content:answerContent
+})
+});
+if(!response.ok){
+const errorData=await response.json();
+throw new Error(errorData.error||'답변 등록에 실패했습니다.');
+}
+const data=await response.json();
+console.log('답변 등록 성공:',data);
+alert('답변이 성공적으로 등록되었습니다.');
+const answerFormModal=document.getElementById('answerFormModal');
+if(answerFormModal){
+answerFormModal.remove();
+}
+if(!this.inquiryEvents){
+this.loadAdminInquiryList(1);
+}
+}catch(error){
+console.error('답변 등록 실패:',error);
+alert(error.message||'답변 등록에 실패했습니다.');
+}
+}
+async fetchMaterialsPage(url,cursor=null){
+const params=new URLSearchParams({limit:MATERIALS_PAGE_SIZE});
+if(cursor){
+params.set('cursor',cursor);
+}
+const response=await fetch(`${url}?${params.toString()}`);
+if(!response.ok){
+const errorData=await response.json().catch(()=>({}));
+throw new Error(errorData.error||`API 응답 오류: ${response.status}`);
+}
+return response.json();
+}
+async showMaterialsModal(){
+try{
+console.log('자료 목록 모달 표시 시작...');
+const data=await this.fetchMaterialsPage('/api/materials');
+console.log('자료 목록 데이터:',data);
+this.createMaterialsModal(data.materials||[],data.pagination);
+}catch(error){
+console.error('자료 목록 로딩 실패:',error);
+alert('자료 목록을 불러오는데 실패했습니다.');
+}
+}
+async loadMoreMaterials(){
+if(!this.materialsNextCursor){
+return;
+}
+try{
+const data=await this.fetchMaterialsPage('/api/materials',this.materialsNextCursor);
+const materialsList=document.querySelector('#materialsModal .materials-list');
+if(!materialsList){
+return;
+}
+materialsList.insertAdjacentHTML('beforeend',this.renderMaterialItems(data.materials||[]));
+this.updateLoadMoreButton('materialsLoadMore',data.pagination,'materialsNextCursor');
+}catch(error){
+console.error('자료 목록 추가 로딩 실패:',error);
+alert('자료 목록을 불러오는데 실패했습니다.');
+}
+}
+updateLoadMoreButton(buttonId,pagination,cursorProperty){
+this[cursorProperty]=(pagination&&pagination.next_cursor)||null;
+const button=document.getElementById(buttonId);
+if(button){
+button.style.display=this[cursorProperty]?'block':'none';
+}
+}
+renderMaterialItems(materials){
+return materials.map(material=>`
+                    <div class="material-item">
+                        ${material.thumbnail_url?`<img class="material-thumbnail" src="${material.thumbnail_url}" alt="" loading="lazy">`:''}
+                        <div class="material-info">
+                            <div class="material-title">${material.title}</div>
+                            <div class="material-description">${material.description||'설명 없음'}</div>
+                            <div class="material-details">
+                                <span class="material-category">${material.category}</span>
+                                <span class="material-size">${material.file_size||'크기 정보 없음'}</span>
+                                <span class="material-date">${material.created_at}</span>
+                                <span class="material-downloads">다운로드: ${material.download_count}</span>
+                            </div>
+                        </div>
+                        <button class="btn btn-primary btn-sm" onclick="window.menuManager.downloadMaterial(${material.id})">
+                            다운로드
+                        </button>
+                    </div>
+                `).join('');
+}
+createMaterialsModal(materials,pagination){
+const existingModal=document.getElementById('materialsModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='materialsModal';
+modal.className='contact-modal';
+const materialsListHtml=materials.length>0
+?this.renderMaterialItems(materials)
+:'<p class="no-materials">등록된 자료가 없습니다.</p>';
+modal.innerHTML=`
+                <div class="contact-modal-content" style="max-width: 800px; max-height: 80vh;">
+                    <div class="contact-modal-header">
+                        <h2>자료 다운로드</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="materials-list">
+                            ${materialsListHtml}
+                        </div>
+                        <button id="materialsLoadMore" class="btn btn-secondary" style="display: none; margin: 1rem auto 0;" onclick="window.menuManager.loadMoreMaterials()">더 보기</button>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+this.updateLoadMoreButton('materialsLoadMore',pagination,'materialsNextCursor');
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async downloadMaterial(materialId){
+try{
+console.log('자료 다운로드 시작...');
+const response=await fetch(`/api/materials/${materialId}/download`,{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+'Accept':'application/json',
+}
+});
+if(!response.ok){
+const errorData=await response.json();
+throw new Error(errorData.error||'다운로드에 실패했습니다.');
+}
+const data=await response.json();
+console.log('다운로드 정보:',data);
+if(data.download_url){
+const link=document.createElement('a');
+link.href=data.download_url;
+link.download=data.file_name;
+document.body.appendChild(link);
+link.click();
+document.body.removeChild(link);
+}
+alert('다운로드가 시작되었습니다.');
+}catch(error){
+console.error('자료 다운로드 실패:',error);
+alert(error.message||'다운로드에 실패했습니다.');
+}
+}
+async showAdminMaterialsModal(){
+try{
+console.log('관리자 자료 모달 표시 시작...');
+this.createAdminMaterialsModal();
+}catch(error){
+console.error('관리자 자료 모달 생성 실패:',error);
+alert('관리자 자료 모달을 생성하는데 실패했습니다.');
+}
+}
+createAdminMaterialsModal(){
+const existingModal=document.getElementById('adminMaterialsModal');
+if(existingModal){
+existingModal.remove();
+}
+const modal=document.createElement('div');
+modal.id='adminMaterialsModal';
+modal.className='contact-modal';
+modal.innerHTML=`
+                <div class="contact-modal-content" style="max-width: 1000px; max-height: 80vh;">
+                    <div class="contact-modal-header">
+                        <h2>관리자 - 자료 관리</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <div class="admin-login-section">
+                            <div class="form-group">
+                                <label for="adminMaterialsPassword">관리자 비밀번호</label>
+                                <input type="password" id="adminMaterialsPassword" placeholder="관리자 비밀번호를 입력하세요" required>
+                            </div>
+                            <button class="btn btn-primary" onclick="window.menuManager.loadAdminMaterialsList()">자료 목록 불러오기</button>
+                            <button class="btn btn-secondary" onclick="window.menuManager.showMaterialForm()">새 자료 등록</button>
+                        </div>
+                        <div id="adminMaterialsList" style="display: none;">
+                            <div class="admin-materials-list">
+                                <!-- 자료 목록이 여기에 동적으로 로드됩니다 -->
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+}
+async loadAdminMaterialsList(cursor=null){
+try{
+const adminPassword=document.getElementById('adminMaterialsPassword').value;
+if(!adminPassword){
+alert('관리자 비밀번호를 입력해주세요.');
+return;
+}
+console.log('관리자 자료 목록 로딩 시작...');
+const data=await this.fetchMaterialsPage('/api/admin/materials',cursor);
+console.log('관리자 자료 목록 데이터:',data);
+this.displayAdminMaterialsList(data.materials||[],data.pagination,Boolean(cursor));
+}catch(error){
+console.error('관리자 자료 목록 로딩 실패:',error);
+alert(error.message||'자료 목록을 불러오는데 실패했습니다.');
+}
+}
+loadMoreAdminMaterials(){
+if(this.adminMaterialsNextCursor){
+this.loadAdminMaterialsList(this.adminMaterialsNextCursor);
+}
+}
+displayAdminMaterialsList(materials,pagination=null,append=false){
+const adminMaterialsList=document.getElementById('adminMaterialsList');
+const materialsListContainer=adminMaterialsList.querySelector('.admin-materials-list');
+let loadMoreButton=document.getElementById('adminMaterialsLoadMore');
+if(!loadMoreButton){
+loadMoreButton=document.createElement('button');
+loadMoreButton.id='adminMaterialsLoadMore';
+loadMoreButton.className='btn btn-secondary';
+loadMoreButton.style.margin='1rem auto 0';
+loadMoreButton.textContent='더 보기';
+loadMoreButton.onclick=()=>this.loadMoreAdminMaterials();
+materialsListContainer.after(loadMoreButton);
+}
+this.updateLoadMoreButton('adminMaterialsLoadMore',pagination,'adminMaterialsNextCursor');
+if(materials.length===0&&!append){
+materialsListContainer.innerHTML='<p class="no-materials">등록된 자료가 없습니다.</p>';
+}else{
+const materialsListHtml=materials.map(material=>`
+                    <div class="material-item admin-material-item">
+                        ${material.thumbnail_url?`<img class="material-thumbnail" src="${material.thumbnail_url}" alt="" loading="lazy">`:''}
+                        <div class="material-info">
+                            <div class="material-title">${material.title}</div>
+                            <div class="material-description">${material.description||'설명 없음'}</div>
+                            <div class="material-details">
+                                <span class="material-category">${material.category}</span>
+                                <span class="material-size">${material.file_size||'크기 정보 없음'}</span>
+                                <span class="material-date">${material.created_at}</span>
+                                <span class="material-downloads">다운로드: ${material.download_count}</span>
+                                <span class="status-badge ${material.is_active?'status-completed':'status-pending'}">
+                                    ${material.is_active?'활성':'비활성'}
+                                </span>
+                            </div>
+                        </div>
+                        <div class="admin-actions">
+                            <button class="btn btn-primary btn-sm" onclick="window.menuManager.editMaterial(${material.id})">
+                                수정
+                            </button>
+                            <button class="btn btn-secondary btn-sm" onclick="window.menuManager.toggleMaterialStatus(${material.id}, ${!material.is_active})">
+                                ${material.is_active?'비활성화':'활성화'}
+                            </button>
+                            <button class="btn btn-danger btn-sm" onclick="window.menuManager.deleteMaterial(${material.id})">
+                                삭제
+                            </button>
+                        </div>
+                    </div>
+                `).join('');
+if(append){
+materialsListContainer.insertAdjacentHTML('beforeend',materialsListHtml);
+}else{
+materialsListContainer.innerHTML=materialsListHtml;
+}
+}
+adminMaterialsList.style.display='block';
+}
+showMaterialForm(materialId=null){
+const existingForm=document.getElementById('materialFormModal');
+if(existingForm){
+existingForm.remove();
+}
+const modal=document.createElement('div');
+modal.id='materialFormModal';
+modal.className='contact-modal';
+const isEdit=materialId!==null;
+modal.innerHTML=`
+                <div class="contact-modal-content" style="max-width: 600px;">
+                    <div class="contact-modal-header">
+                        <h2>${isEdit?'자료 수정':'새 자료 등록'}</h2>
+                        <button class="contact-modal-close" onclick="this.closest('.contact-modal').remove()">&times;</button>
+                    </div>
+                    <div class="contact-modal-body">
+                        <form id="materialForm" class="inquiry-form" enctype="multipart/form-data">
+                            ${isEdit?`<input type="hidden" id="materialId" value="${materialId}">`:''}
+                            <div class="form-group">
+                                <label for="materialTitle">제목 *</label>
+                                <input type="text" id="materialTitle" placeholder="자료 제목을 입력하세요" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="materialDescription">설명</label>
+                                <textarea id="materialDescription" rows="3" placeholder="자료 설명을 입력하세요"></textarea>
+                            </div>
+                            <div class="form-group">
+                                <label for="materialCategory">카테고리</label>
+                                <select id="materialCategory">
+                                    <option value="무역자료">무역자료</option>
+                                    <option value="운송자료">운송자료</option>
+                                    <option value="법규자료">법규자료</option>
+                                    <option value="기타">기타</option>
+                                </select>
+                            </div>
+                            ${!isEdit?`
+                            <div class="form-group">
+                                <label for="materialFile">파일 선택 *</label>
+                                <div class="file-upload-area" id="fileUploadArea">
+                                    <div class="file-upload-icon">📁</div>
+                                    <div class="file-upload-text">파일을 클릭하거나 드래그하여 선택하세요</div>
+                                    <div class="file-upload-hint">지원 형식: PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR, JPG, PNG, GIF (최대 16MB)</div>
+                                    <input type="file" id="materialFile" accept=".pdf,.doc,.docx,.xls,.xlsx,.ppt,.pptx,.txt,.zip,.rar,.jpg,.jpeg,.png,.gif" required style="display: none;">
+                                </div>
+                                <div id="fileInfo" style="display: none; margin-top: 1rem; padding: 0.5rem; background: #e8f5e8; border-radius: 4px; border-left: 4px solid #4caf50;">
+                                    <strong>선택된 파일:</strong> <span id="selectedFileName"></span>
+                                </div>
+                            </div>
+                            `:''}
+                            <div class="form-actions">
+                                <button type="submit" class="btn btn-primary">${isEdit?'수정':'등록'}</button>
+                                <button type="button" class="btn btn-secondary" onclick="this.closest('.contact-modal').remove()">취소</button>
+                            </div>
+                        </form>
+                    </div>
+                </div>
+            `;
+document.body.appendChild(modal);
+const form=document.getElementById('materialForm');
+form.addEventListener('submit',(e)=>{
+e.preventDefault();
+this.submitMaterial(isEdit);
+});
+modal.addEventListener('click',(e)=>{
+if(e.target===modal){
+modal.remove();
+}
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.parentNode){
+modal.remove();
+}
+});
+if(!isEdit){
+const fileUploadArea=document.getElementById('fileUploadArea');
+const fileInput=document.getElementById('materialFile');
+const fileInfo=document.getElementById('fileInfo');
+const selectedFileName=document.getElementById('selectedFileName');
+fileUploadArea.addEventListener('click',()=>{
+fileInput.click();
+});
+fileInput.addEventListener('change',(e)=>{
+if(e.target.files[0]){
+const file=e.target.files[0];
+selectedFileName.textContent=`${file.name} (${(file.size/1024/1024).toFixed(2)} MB)`;
+fileInfo.style.display='block';
+fileUploadArea.style.borderColor='#4caf50';
+fileUploadArea.style.background='#f0f9f0';
+}
+});
+fileUploadArea.addEventListener('dragover',(e)=>{
+e.preventDefault();
+fileUploadArea.classList.add('dragover');
+});
+fileUploadArea.addEventListener('dragleave',(e)=>{
+e.preventDefault();
+fileUploadArea.classList.remove('dragover');
+});
+fileUploadArea.addEventListener('drop',(e)=>{
+e.preventDefault();
+fileUploadArea.classList.remove('dragover');
+const files=e.dataTransfer.files;
+if(files.length>0){
+fileInput.files=files;
+const file=files[0];
+selectedFileName.textContent=`${file.name} (${(file.size/1024/1024).toFixed(2)} MB)`;
+fileInfo.style.display='block';
+fileUploadArea.style.borderColor='#4caf50';
+fileUploadArea.style.background='#f0f9f0';
+}
+});
+}
+}
+async submitMaterial(isEdit=false){
+try{
+const adminPassword=document.getElementById('adminMaterialsPassword').value;
+const title=document.getElementById('materialTitle').value;
+const description=document.getElementById('materialDescription').value;
+const category=document.getElementById('materialCategory').value;
+if(!title){
+alert('제목은 필수입니다.');
+return;
+}
+if(!isEdit){
+const fileInput=document.getElementById('materialFile');
+if(!fileInput.files[0]){
+alert('파일을 선택해주세요.');
+return;
+}
+const file=fileInput.files[0];
+let result;
+if(file.size>CHUNKED_UPLOAD_THRESHOLD){
+console.log('분할 업로드 시작...');
+result=await this.uploadMaterialInChunks(file,adminPassword,title,description,category);
+}else{
+const formData=new FormData();
+formData.append('admin_password',adminPassword);
+formData.append('title',title);
+formData.append('description',description);
+formData.append('category',category);
+formData.append('file',file);
+console.log('자료 등록 시작...');
+const response=await fetch('/api/admin/materials',{
+method:'POST',
+body:formData
+});
+result=await response.json();
+}
+if(result.success){
+alert(result.message);
+document.getElementById('materialFormModal').remove();
+this.loadAdminMaterialsList();
+}else{
+alert(result.error||'자료 등록에 실패했습니다.');
+}
+}else{
+const materialId=document.getElementById('materialId').value;
+const materialData={
+admin_password:adminPassword,
+title:title,
+description:description,
+category:category
+};
+console.log('자료 수정 시작...');
+const response=await fetch(`/api/admin/materials/${materialId}`,{
+method:'PUT',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify(materialData)
+});
+const result=await response.json();
+if(result.success){
+alert(result.message);
+document.getElementById('materialFormModal').remove();
+this.loadAdminMaterialsList();
+}else{
+alert(result.error||'자료 수정에 실패했습니다.');
+}
+}
+}catch(error){
+console.error('자료 등록/수정 오류:',error);
+alert('자료 등록/수정 중 오류가 발생했습니다.');
+}
+}
+async uploadMaterialInChunks(file,adminPassword,title,description,category){
+const initResponse=await fetch('/api/admin/uploads',{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword,
+file_name:file.name,
+file_size:file.size,
+file_type:file.type
+})
+});
+const session=await initResponse.json();
+if(!session.success){
+return session;
+}
+const uploadUrl=`/api/admin/uploads/${session.upload_id}`;
+const headers={'X-Admin-Password':adminPassword};
+const fileHash=new Sha256();
+let hashedOffset=0;
+let offset=session.offset;
+let retries=0;
+while(offset<file.size){
+try{
+const chunk=new Uint8Array(await file.slice(offset,offset+session.chunk_size).arrayBuffer());
+if(offset<=hashedOffset&&offset+chunk.length>hashedOffset){
+fileHash.update(chunk.subarray(hashedOffset-offset));
+hashedOffset=offset+chunk.length;
+}
+const response=await fetch(`${uploadUrl}?offset=${offset}`,{
+method:'PUT',
+headers:{
+...headers,
+'Content-Type':'application/octet-stream',
+'X-Chunk-Sha256':await this.computeChunkSha256(chunk)
+},
+body:chunk
+});
+const result=await response.json();
+if((!result.success&&response.status!==409)||!Number.isInteger(result.offset)){
+throw new Error(result.error||'청크 전송 실패');
+}
+offset=result.offset;
+retries=0;
+console.log(`분할 업로드 진행: ${Math.round(offset/file.size*100)}%`);
+}catch(error){
+if(++retries>MAX_UPLOAD_RETRIES){
+throw error;
+}
+console.warn(`청크 전송 실패, 재시도 ${retries}/${MAX_UPLOAD_RETRIES}:`,error);
+await new Promise(resolve=>setTimeout(resolve,1000*retries));
+try{
+const status=await(await fetch(uploadUrl,{headers})).json();
+if(status.success&&Number.isInteger(status.offset)){
+offset=status.offset;
+}
+}catch(statusError){
+console.warn('업로드 상태 확인 실패:',statusError);
+}
+}
+}
+if(hashedOffset!==file.size){
+throw new Error('파일 체크섬을 계산하지 못했습니다.');
+}
+const sha256=fileHash.hexDigest();
+const commitResponse=await fetch(`${uploadUrl}/commit`,{
+method:'POST',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword,
+title:title,
+description:description,
+category:category,
+sha256:sha256
+})
+});
+return await commitResponse.json();
+}
+async computeChunkSha256(chunk){
+if(!window.crypto||!window.crypto.subtle){
+return new Sha256().update(chunk).hexDigest();
+}
+const digest=await window.crypto.subtle.digest('SHA-256',chunk);
+return Array.from(new Uint8Array(digest)).map(b=>b.toString(16).padStart(2,'0')).join('');
+}
+editMaterial(materialId){
+this.showMaterialForm(materialId);
+}
+async toggleMaterialStatus(materialId,isActive){
+try{
+const adminPassword=document.getElementById('adminMaterialsPassword').value;
+const response=await fetch(`/api/admin/materials/${materialId}`,{
+method:'PUT',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword,
+is_active:isActive
+})
+});
+if(!response.ok){
+const errorData=await response.json();
+throw new Error(errorData.error||'상태 변경에 실패했습니다.');
+}
+const data=await response.json();
+alert(data.message||'상태가 변경되었습니다.');
+this.loadAdminMaterialsList();
+}catch(error){
+console.error('상태 변경 실패:',error);
+alert(error.message||'상태 변경에 실패했습니다.');
+}
+}
+async deleteMaterial(materialId){
+if(!confirm('정말로 이 자료를 삭제하시겠습니까?')){
+return;
+}
+try{
+const adminPassword=document.getElementById('adminMaterialsPassword').value;
+const response=await fetch(`/api/admin/materials/${materialId}`,{
+method:'DELETE',
+headers:{
+'Content-Type':'application/json',
+},
+body:JSON.stringify({
+admin_password:adminPassword
+})
+});
+if(!response.ok){
+const errorData=await response.json();
+throw new Error(errorData.error||'자료 삭제에 실패했습니다.');
+}
+const data=await response.json();
+alert(data.message||'자료가 삭제되었습니다.');
+this.loadAdminMaterialsList();
+}catch(error){
+console.error('자료 삭제 실패:',error);
+alert(error.message||'자료 삭제에 실패했습니다.');
+}
+}
+}
+document.addEventListener('DOMContentLoaded',()=>{
+window.menuManager=new MenuManager();
+});
+window.addEventListener('scroll',()=>{
+const header=document.querySelector('.header');
+if(window.scrollY>50){
+header.style.background='rgba(255, 255, 255, 0.98)';
+header.style.boxShadow='0 2px 20px rgba(0, 0, 0, 0.15)';
+}else{
+header.style.background='rgba(255, 255, 255, 0.95)';
+header.style.boxShadow='0 2px 20px rgba(0, 0, 0, 0.1)';
+}
+});
@@ -1,7 +1,123 @@
+// 분할 업로드 설정
+const CHUNKED_UPLOAD_THRESHOLD = 4 * 1024 * 1024;  // 이보다 큰 파일은 분할 업로드
+const MAX_UPLOAD_RETRIES = 5;
+
+// 자료 목록 페이지 크기 (더 보기 버튼으로 다음 페이지를 이어 붙임)
+const MATERIALS_PAGE_SIZE = 20;
+
+// SHA-256 (분할 업로드 체크섬용)
+// SubtleCrypto 는 나눠서 계산할 수 없으므로, 큰 파일을 메모리에 모두 올리지 않고 청크 단위로 이어서 계산
+const SHA256_K = new Uint32Array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+]);
+
+class Sha256 {
+    constructor() {
+        this.state = new Uint32Array([
+            0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+        ]);
+        this.words = new Uint32Array(64);
+        this.buffer = new Uint8Array(64);
+        this.bufferLength = 0;
+        this.bytesHashed = 0;
+    }
+
+    update(data) {
+        let position = 0;
+        this.bytesHashed += data.length;
+
+        // 이전 호출에서 남은 64바이트 미만 블록을 먼저 채움
+        if (this.bufferLength > 0) {
+            position = Math.min(64 - this.bufferLength, data.length);
+            this.buffer.set(data.subarray(0, position), this.bufferLength);
+            this.bufferLength += position;
+            if (this.bufferLength < 64) {
+                return this;
+            }
+            this.processBlock(this.buffer, 0);
+            this.bufferLength = 0;
+        }
+
+        for (; position + 64 <= data.length; position += 64) {
+            this.processBlock(data, position);
+        }
+
+        if (position < data.length) {
+            this.buffer.set(data.subarray(position));
+            this.bufferLength = data.length - position;
+        }
+        return this;
+    }
+
+    processBlock(data, start) {
+        const w = this.words;
+        for (let i = 0; i < 16; i++) {
+            const j = start + i * 4;
+            w[i] = (data[j] << 24) | (data[j + 1] << 16) | (data[j + 2] << 8) | data[j + 3];
+        }
+        for (let i = 16; i < 64; i++) {
+            const x = w[i - 15];
+            const y = w[i - 2];
+            const s0 = ((x >>> 7) | (x << 25)) ^ ((x >>> 18) | (x << 14)) ^ (x >>> 3);
+            const s1 = ((y >>> 17) | (y << 15)) ^ ((y >>> 19) | (y << 13)) ^ (y >>> 10);
+            w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+        }
+
+        const state = this.state;
+        let a = state[0], b = state[1], c = state[2], d = state[3];
+        let e = state[4], f = state[5], g = state[6], h = state[7];
+        for (let i = 0; i < 64; i++) {
+            const S1 = ((e >>> 6) | (e << 26)) ^ ((e >>> 11) | (e << 21)) ^ ((e >>> 25) | (e << 7));
+            const t1 = (h + S1 + ((e & f) ^ (~e & g)) + SHA256_K[i] + w[i]) | 0;
+            const S0 = ((a >>> 2) | (a << 30)) ^ ((a >>> 13) | (a << 19)) ^ ((a >>> 22) | (a << 10));
+            const t2 = (S0 + ((a & b) ^ (a & c) ^ (b & c))) | 0;
+            h = g;
+            g = f;
+            f = e;
+            e = (d + t1) | 0;
+            d = c;
+            c = b;
+            b = a;
+            a = (t1 + t2) | 0;
+        }
+        state[0] += a;
+        state[1] += b;
+        state[2] += c;
+        state[3] += d;
+        state[4] += e;
+        state[5] += f;
+        state[6] += g;
+        state[7] += h;
+    }
+
+    hexDigest() {
+        // 0x80, 0 채움, 64비트 빅엔디언 비트 길이
+        const bitLength = this.bytesHashed * 8;
+        const padding = new Uint8Array((this.bufferLength < 56 ? 64 : 128) - this.bufferLength);
+        const view = new DataView(padding.buffer);
+        padding[0] = 0x80;
+        view.setUint32(padding.length - 8, Math.floor(bitLength / 0x100000000));
+        view.setUint32(padding.length - 4, bitLength >>> 0);
+        this.update(padding);
+        return Array.from(this.state, word => word.toString(16).padStart(8, '0')).join('');
+    }
+}
+
 // 구글 시트에서 메뉴 데이터를 가져와서 네비게이션 메뉴를 동적으로 생성
 class MenuManager {
     constructor() {
         this.menuData = [];
+        this.bootstrapData = null;
+        this.inquiryEvents = null;
+        this.lastInquiryEventId = null;
+        this.adminInquiryView = null;
         this.init();
         this.initMobileMenu();
     }
@@ -39,6 +155,7 @@ class MenuManager {
 
     async init() {
         try {
+            await this.loadBootstrapData();
             await this.loadMenuData();
             this.renderMenu();
         } catch (error) {
@@ -47,16 +164,38 @@ class MenuManager {
         }
     }
 
-    async loadMenuData() {
+    async loadBootstrapData() {
+        // 메뉴/회사소개/회사연혁/연락처를 한 번의 요청으로 가져옴
         try {
-            console.log('메뉴 데이터 로딩 시작...');
-            // Python Flask API에서 메뉴 데이터를 가져옴
-            const response = await fetch('/api/menu');
+            const response = await fetch('/api/bootstrap');
             if (!response.ok) {
                 throw new Error(`API 응답 오류: ${response.status}`);
             }
-            const data = await response.json();
-            this.menuData = data.menu || data; // API 응답 구조에 맞게 수정
+            this.bootstrapData = await response.json();
+        } catch (error) {
+            console.error('부트스트랩 데이터 로딩 실패 (개별 API 사용):', error);
+            this.bootstrapData = null;
+        }
+    }
+
+    async fetchContent(key, url) {
+        // 부트스트랩 데이터가 있으면 그대로 사용하고, 없으면 개별 API 호출
+        if (this.bootstrapData && this.bootstrapData[key] !== undefined) {
+            return this.bootstrapData[key];
+        }
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`API 응답 오류: ${response.status}`);
+        }
+        const data = await response.json();
+        return data[key] !== undefined ? data[key] : data;
+    }
+
+    async loadMenuData() {
+        try {
+            console.log('메뉴 데이터 로딩 시작...');
+            // Python Flask API에서 메뉴 데이터를 가져옴
+            this.menuData = await this.fetchContent('menu', '/api/menu');
             console.log('구글 시트에서 가져온 메뉴 데이터:', this.menuData);
         } catch (error) {
             console.error('API 호출 실패:', error);
@@ -196,14 +335,10 @@ class MenuManager {
     async showCompanyIntroModal() {
         try {
             console.log('회사소개 모달 표시 시작...');
-            const response = await fetch('/api/company-intro');
-            if (!response.ok) {
-                throw new Error(`API 응답 오류: ${response.status}`);
-            }
-            const data = await response.json();
-            console.log('회사소개 데이터:', data);
+            const companyIntro = await this.fetchContent('company_intro', '/api/company-intro');
+            console.log('회사소개 데이터:', companyIntro);
             
-            this.createCompanyIntroModal(data.company_intro);
+            this.createCompanyIntroModal(companyIntro);
         } catch (error) {
             console.error('회사소개 데이터 로딩 실패:', error);
             // 기본 회사소개 데이터로 모달 표시
@@ -231,14 +366,10 @@ class MenuManager {
     async showCompanyHistoryModal() {
         try {
             console.log('회사연혁 모달 표시 시작...');
-            const response = await fetch('/api/company-history');
-            if (!response.ok) {
-                throw new Error(`API 응답 오류: ${response.status}`);
-            }
-            const data = await response.json();
-            console.log('회사연혁 데이터:', data);
+            const companyHistory = await this.fetchContent('company_history', '/api/company-history');
+            console.log('회사연혁 데이터:', companyHistory);
             
-            this.createCompanyHistoryModal(data.company_history);
+            this.createCompanyHistoryModal(companyHistory);
         } catch (error) {
             console.error('회사연혁 데이터 로딩 실패:', error);
             // 기본 회사연혁 데이터로 모달 표시
@@ -261,14 +392,10 @@ class MenuManager {
     async showContactModal() {
         try {
             console.log('연락처 모달 표시 시작...');
-            const response = await fetch('/api/contact');
-            if (!response.ok) {
-                throw new Error(`API 응답 오류: ${response.status}`);
-            }
-            const data = await response.json();
-            console.log('연락처 데이터:', data);
+            const contact = await this.fetchContent('contact', '/api/contact');
+            console.log('연락처 데이터:', contact);
             
-            this.createContactModal(data.contact);
+            this.createContactModal(contact);
         } catch (error) {
             console.error('연락처 데이터 로딩 실패:', error);
             // 기본 연락처 데이터로 모달 표시
@@ -627,10 +754,12 @@ class MenuManager {
             }
         }
 
-        async showInquiryListModal(page = 1) {
+        async showInquiryListModal(page = 1, cursor = null) {
             try {
                 console.log('문의 목록 모달 표시 시작...');
-                const response = await fetch(`/api/inquiry-list?page=${page}`);
+                // 이전/다음 이동은 커서를 사용하고, 페이지 번호는 표시용으로 함께 전달
+                const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+                const response = await fetch(`/api/inquiry-list?page=${page}${cursorParam}`);
                 if (!response.ok) {
                     throw new Error(`API 응답 오류: ${response.status}`);
                 }
@@ -699,7 +828,8 @@ class MenuManager {
                 
                 // 이전 페이지 버튼
                 if (currentPage > 1) {
-                    paginationButtons += `<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${currentPage - 1})">이전</button>`;
+                    const prevCursorArg = pagination.prev_cursor ? `, '${pagination.prev_cursor}'` : '';
+                    paginationButtons += `<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${currentPage - 1}${prevCursorArg})">이전</button>`;
                 }
                 
                 // 페이지 번호 버튼들
@@ -716,7 +846,8 @@ class MenuManager {
                 
                 // 다음 페이지 버튼
                 if (currentPage < totalPages) {
-                    paginationButtons += `<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${currentPage + 1})">다음</button>`;
+                    const nextCursorArg = pagination.next_cursor ? `, '${pagination.next_cursor}'` : '';
+                    paginationButtons += `<button class="pagination-btn" onclick="window.menuManager.showInquiryListModal(${currentPage + 1}${nextCursorArg})">다음</button>`;
                 }
                 
                 paginationHtml = `
@@ -945,6 +1076,7 @@ class MenuManager {
 
         createAdminInquiryModal() {
             // 기존 모달이 있다면 제거
+            this.stopInquiryEvents();
             const existingModal = document.getElementById('adminInquiryModal');
             if (existingModal) {
                 existingModal.remove();
@@ -970,6 +1102,11 @@ class MenuManager {
                             <button class="btn btn-primary" onclick="window.menuManager.loadAdminInquiryList()">문의 목록 불러오기</button>
                         </div>
                         <div id="adminInquiryList" style="display: none;">
+                            <div class="form-group admin-search-bar">
+                                <input type="text" id="adminInquirySearch" placeholder="이름, 전화번호, 이메일, 문의/답변 내용 검색"
+                                       onkeydown="if (event.key === 'Enter') window.menuManager.searchAdminInquiries()">
+                                <button class="btn btn-primary btn-sm" onclick="window.menuManager.searchAdminInquiries()">검색</button>
+                            </div>
                             <div class="admin-inquiry-list">
                                 <!-- 문의 목록이 여기에 동적으로 로드됩니다 -->
                             </div>
@@ -998,7 +1135,7 @@ class MenuManager {
             });
         }
 
-        async loadAdminInquiryList(page = 1) {
+        async loadAdminInquiryList(page = 1, cursor = null) {
             try {
                 const adminPassword = document.getElementById('adminPassword').value;
                 if (!adminPassword) {
@@ -1014,7 +1151,8 @@ class MenuManager {
                     },
                     body: JSON.stringify({
                         admin_password: adminPassword,
-                        page: page
+                        page: page,
+                        cursor: cursor
                     })
                 });
 
@@ -1027,70 +1165,113 @@ class MenuManager {
                 console.log('관리자 문의 목록 데이터:', data);
                 
                 this.displayAdminInquiryList(data.inquiries, data.pagination);
+                this.startInquiryEvents(adminPassword);
             } catch (error) {
                 console.error('관리자 문의 목록 로딩 실패:', error);
                 alert(error.message || '문의 목록을 불러오는데 실패했습니다.');
             }
         }
 
-        displayAdminInquiryList(inquiries, pagination) {
+        async searchAdminInquiries(page = 1) {
+            try {
+                const adminPassword = document.getElementById('adminPassword').value;
+                const query = document.getElementById('adminInquirySearch').value.trim();
+                if (!query) {
+                    // 검색어가 없으면 전체 목록으로 돌아감
+                    this.loadAdminInquiryList();
+                    return;
+                }
+
+                console.log('관리자 문의 검색 시작...');
+                const response = await fetch('/api/admin/inquiry-search', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        admin_password: adminPassword,
+                        q: query,
+                        page: page
+                    })
+                });
+
+                const data = await response.json();
+                if (!response.ok || !data.success) {
+                    throw new Error(data.error || '문의 검색에 실패했습니다.');
+                }
+
+                this.displayAdminInquiryList(data.inquiries, data.pagination, 'searchAdminInquiries');
+            } catch (error) {
+                console.error('관리자 문의 검색 실패:', error);
+                alert(error.message || '문의 검색에 실패했습니다.');
+            }
+        }
+
+        renderAdminInquiryItem(inquiry) {
+            return `
+                <div class="inquiry-item admin-inquiry-item" data-inquiry-id="${inquiry.id}">
+                    <div class="inquiry-header">
+                        <div class="inquiry-date">${inquiry.date}</div>
+                        <div class="inquiry-serial">${inquiry.serial}</div>
+                        <div class="inquiry-name">${inquiry.highlight ? inquiry.highlight.name : inquiry.name}</div>
+                        <div class="inquiry-phone">${inquiry.highlight ? inquiry.highlight.phone : inquiry.phone}</div>
+                        <div class="status-badge ${inquiry.status === '답변완료' ? 'status-completed' : 'status-pending'}">
+                            ${inquiry.status}
+                        </div>
+                    </div>
+                    <div class="inquiry-preview">
+                        <strong>문의내용:</strong> ${inquiry.highlight ? inquiry.highlight.question : `${inquiry.question.substring(0, 100)}${inquiry.question.length > 100 ? '...' : ''}`}
+                    </div>
+                    ${inquiry.answer ? `
+                        <div class="answer-preview">
+                            <strong>답변:</strong> ${inquiry.answer.substring(0, 100)}${inquiry.answer.length > 100 ? '...' : ''}
+                            <div class="answer-date">답변일: ${inquiry.answer_date}</div>
+                        </div>
+                    ` : ''}
+                    <div class="admin-actions">
+                        <button class="btn btn-primary btn-sm" onclick="window.menuManager.showAnswerForm(${inquiry.id})">
+                            ${inquiry.answer ? '답변 수정' : '답변 등록'}
+                        </button>
+                    </div>
+                </div>
+            `;
+        }
+
+        displayAdminInquiryList(inquiries, pagination, pageLoader = 'loadAdminInquiryList') {
             const adminInquiryList = document.getElementById('adminInquiryList');
             const inquiryListContainer = adminInquiryList.querySelector('.admin-inquiry-list');
             const paginationControls = document.getElementById('adminPaginationControls');
 
+            // 실시간 알림에서 새 문의를 목록에 추가할지 판단하는 데 사용
+            this.adminInquiryView = { pageLoader: pageLoader, currentPage: pagination.current_page };
+
             // 문의 목록 표시
             if (inquiries.length === 0) {
                 inquiryListContainer.innerHTML = '<p class="no-inquiries">등록된 문의가 없습니다.</p>';
             } else {
-                const inquiryListHtml = inquiries.map(inquiry => `
-                    <div class="inquiry-item admin-inquiry-item">
-                        <div class="inquiry-header">
-                            <div class="inquiry-date">${inquiry.date}</div>
-                            <div class="inquiry-serial">${inquiry.serial}</div>
-                            <div class="inquiry-name">${inquiry.name}</div>
-                            <div class="inquiry-phone">${inquiry.phone}</div>
-                            <div class="status-badge ${inquiry.status === '답변완료' ? 'status-completed' : 'status-pending'}">
-                                ${inquiry.status}
-                            </div>
-                        </div>
-                        <div class="inquiry-preview">
-                            <strong>문의내용:</strong> ${inquiry.question.substring(0, 100)}${inquiry.question.length > 100 ? '...' : ''}
-                        </div>
-                        ${inquiry.answer ? `
-                            <div class="answer-preview">
-                                <strong>답변:</strong> ${inquiry.answer.substring(0, 100)}${inquiry.answer.length > 100 ? '...' : ''}
-                                <div class="answer-date">답변일: ${inquiry.answer_date}</div>
-                            </div>
-                        ` : ''}
-                        <div class="admin-actions">
-                            <button class="btn btn-primary btn-sm" onclick="window.menuManager.showAnswerForm(${inquiry.id})">
-                                ${inquiry.answer ? '답변 수정' : '답변 등록'}
-                            </button>
-                        </div>
-                    </div>
-                `).join('');
-                
-                inquiryListContainer.innerHTML = inquiryListHtml;
+                inquiryListContainer.innerHTML = inquiries.map(inquiry => this.renderAdminInquiryItem(inquiry)).join('');
             }
 
             // 페이지네이션 컨트롤 표시
             if (pagination.total_pages > 1) {
+                const prevCursorArg = pagination.prev_cursor ? `, '${pagination.prev_cursor}'` : '';
+                const nextCursorArg = pagination.next_cursor ? `, '${pagination.next_cursor}'` : '';
                 const paginationHtml = `
                     <div class="pagination-info">
-                        총 ${pagination.total_items}개의 문의 (${pagination.current_page}/${pagination.total_pages} 페이지)
+                        총 <span id="adminInquiryTotal">${pagination.total_items}</span>개의 문의 (${pagination.current_page}/${pagination.total_pages} 페이지)
                     </div>
                     <div class="pagination-controls">
-                        <button class="pagination-btn" onclick="window.menuManager.loadAdminInquiryList(1)" ${pagination.current_page === 1 ? 'disabled' : ''}>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(1)" ${pagination.current_page === 1 ? 'disabled' : ''}>
                             처음
                         </button>
-                        <button class="pagination-btn" onclick="window.menuManager.loadAdminInquiryList(${pagination.current_page - 1})" ${pagination.current_page === 1 ? 'disabled' : ''}>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(${pagination.current_page - 1}${prevCursorArg})" ${pagination.current_page === 1 ? 'disabled' : ''}>
                             이전
                         </button>
                         <span class="pagination-btn active">${pagination.current_page}</span>
-                        <button class="pagination-btn" onclick="window.menuManager.loadAdminInquiryList(${pagination.current_page + 1})" ${pagination.current_page === pagination.total_pages ? 'disabled' : ''}>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(${pagination.current_page + 1}${nextCursorArg})" ${pagination.current_page === pagination.total_pages ? 'disabled' : ''}>
                             다음
                         </button>
-                        <button class="pagination-btn" onclick="window.menuManager.loadAdminInquiryList(${pagination.total_pages})" ${pagination.current_page === pagination.total_pages ? 'disabled' : ''}>
+                        <button class="pagination-btn" onclick="window.menuManager.${pageLoader}(${pagination.total_pages})" ${pagination.current_page === pagination.total_pages ? 'disabled' : ''}>
                             마지막
                         </button>
                     </div>
@@ -1099,7 +1280,7 @@ class MenuManager {
             } else {
                 paginationControls.innerHTML = `
                     <div class="pagination-info">
-                        총 ${pagination.total_items}개의 문의
+                        총 <span id="adminInquiryTotal">${pagination.total_items}</span>개의 문의
                     </div>
                 `;
             }
@@ -1107,6 +1288,148 @@ class MenuManager {
             adminInquiryList.style.display = 'block';
         }
 
+        async startInquiryEvents(adminPassword) {
+            // 새 문의/답변 등록을 서버에서 받아 목록을 부분 갱신 (페이지 전체를 다시 불러오지 않음)
+            if (this.inquiryEvents) {
+                return;
+            }
+
+            try {
+                const response = await fetch('/api/admin/inquiry-events/token', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({ admin_password: adminPassword })
+                });
+                const data = await response.json();
+                if (!response.ok || !data.success) {
+                    throw new Error(data.error || '실시간 알림 연결에 실패했습니다.');
+                }
+
+                // 서버가 연결을 오래 유지할 수 없으면 (동기 워커, 서버리스) 주기적으로 조회
+                if (!data.stream || !window.EventSource) {
+                    this.pollInquiryEvents(adminPassword, data.token, data.poll_interval);
+                    return;
+                }
+
+                const params = new URLSearchParams({ token: data.token });
+                if (this.lastInquiryEventId) {
+                    params.set('last_event_id', this.lastInquiryEventId);
+                }
+                const source = new EventSource(`/api/admin/inquiry-events?${params.toString()}`);
+                this.inquiryEvents = source;
+                source.addEventListener('inquiry_created', (event) => this.handleInquiryEvent(event, true));
+                source.addEventListener('answer_posted', (event) => this.handleInquiryEvent(event, false));
+                source.onopen = () => {
+                    // 서버가 주기적으로 연결을 닫으면 자동 재연결되므로, 그 사이 모달이 닫혔으면 종료
+                    if (!document.getElementById('adminInquiryModal')) {
+                        this.stopInquiryEvents();
+                    }
+                };
+                source.onerror = () => {
+                    // 일시적인 끊김은 EventSource 가 자동 재연결, 토큰 만료 등으로 닫히면 새 토큰으로 다시 연결
+                    if (source.readyState !== EventSource.CLOSED) {
+                        return;
+                    }
+                    this.stopInquiryEvents();
+                    setTimeout(() => {
+                        if (document.getElementById('adminInquiryModal')) {
+                            this.startInquiryEvents(adminPassword);
+                        }
+                    }, 5000);
+                };
+            } catch (error) {
+                console.error('실시간 알림 연결 실패:', error);
+            }
+        }
+
+        pollInquiryEvents(adminPassword, token, intervalSeconds) {
+            const polling = {
+                timer: null,
+                close() {
+                    clearTimeout(this.timer);
+                }
+            };
+            this.inquiryEvents = polling;
+
+            const poll = async () => {
+                if (!document.getElementById('adminInquiryModal')) {
+                    this.stopInquiryEvents();
+                    return;
+                }
+                try {
+                    const params = new URLSearchParams({ token: token, format: 'json' });
+                    if (this.lastInquiryEventId !== null) {
+                        params.set('last_event_id', this.lastInquiryEventId);
+                    }
+                    const response = await fetch(`/api/admin/inquiry-events?${params.toString()}`);
+                    if (response.status === 401) {
+                        // 토큰 만료: 새 토큰으로 다시 시작
+                        this.stopInquiryEvents();
+                        this.startInquiryEvents(adminPassword);
+                        return;
+                    }
+                    const data = await response.json();
+                    if (data.success) {
+                        data.events.forEach(item => {
+                            this.applyInquiryEvent(item.inquiry, item.event === 'inquiry_created');
+                        });
+                        this.lastInquiryEventId = data.last_event_id;
+                    }
+                } catch (error) {
+                    console.warn('실시간 알림 조회 실패:', error);
+                }
+                if (this.inquiryEvents === polling) {
+                    polling.timer = setTimeout(poll, intervalSeconds * 1000);
+                }
+            };
+            poll();
+        }
+
+        stopInquiryEvents() {
+            if (this.inquiryEvents) {
+                this.inquiryEvents.close();
+                this.inquiryEvents = null;
+            }
+        }
+
+        handleInquiryEvent(event, isNewInquiry) {
+            this.lastInquiryEventId = event.lastEventId;
+            this.applyInquiryEvent(JSON.parse(event.data).inquiry, isNewInquiry);
+        }
+
+        applyInquiryEvent(inquiry, isNewInquiry) {
+            const listContainer = document.querySelector('#adminInquiryModal .admin-inquiry-list');
+            if (!listContainer) {
+                // 모달이 닫혔으면 연결 종료
+                this.stopInquiryEvents();
+                return;
+            }
+
+            const existingItem = listContainer.querySelector(`[data-inquiry-id="${inquiry.id}"]`);
+            if (existingItem) {
+                existingItem.outerHTML = this.renderAdminInquiryItem(inquiry);
+                return;
+            }
+
+            // 새 문의는 전체 목록의 첫 페이지를 보고 있을 때만 맨 위에 추가
+            const view = this.adminInquiryView;
+            if (!isNewInquiry || !view || view.pageLoader !== 'loadAdminInquiryList' || view.currentPage !== 1) {
+                return;
+            }
+            const emptyMessage = listContainer.querySelector('.no-inquiries');
+            if (emptyMessage) {
+                emptyMessage.remove();
+            }
+            listContainer.insertAdjacentHTML('afterbegin', this.renderAdminInquiryItem(inquiry));
+
+            const total = document.getElementById('adminInquiryTotal');
+            if (total) {
+                total.textContent = Number(total.textContent) + 1;
+            }
+        }
+
         showAnswerForm(inquiryId) {
             // 기존 답변 폼이 있다면 제거
             const existingForm = document.getElementById('answerFormModal');
@@ -1205,8 +1528,10 @@ class MenuManager {
                     answerFormModal.remove();
                 }
                 
-                // 문의 목록 새로고침
-                this.loadAdminInquiryList(1);
+                // 실시간 알림이 연결되어 있으면 answer_posted 이벤트로 해당 항목만 갱신
+                if (!this.inquiryEvents) {
+                    this.loadAdminInquiryList(1);
+                }
                 
             } catch (error) {
                 console.error('답변 등록 실패:', error);
@@ -1214,38 +1539,62 @@ class MenuManager {
             }
         }
 
+        async fetchMaterialsPage(url, cursor = null) {
+            const params = new URLSearchParams({ limit: MATERIALS_PAGE_SIZE });
+            if (cursor) {
+                params.set('cursor', cursor);
+            }
+            const response = await fetch(`${url}?${params.toString()}`);
+            if (!response.ok) {
+                const errorData = await response.json().catch(() => ({}));
+                throw new Error(errorData.error || `API 응답 오류: ${response.status}`);
+            }
+            return response.json();
+        }
+
         async showMaterialsModal() {
             try {
                 console.log('자료 목록 모달 표시 시작...');
-                const response = await fetch('/api/materials');
-                if (!response.ok) {
-                    throw new Error(`API 응답 오류: ${response.status}`);
-                }
-                const data = await response.json();
+                const data = await this.fetchMaterialsPage('/api/materials');
                 console.log('자료 목록 데이터:', data);
                 
-                this.createMaterialsModal(data.materials || []);
+                this.createMaterialsModal(data.materials || [], data.pagination);
             } catch (error) {
                 console.error('자료 목록 로딩 실패:', error);
                 alert('자료 목록을 불러오는데 실패했습니다.');
             }
         }
 
-        createMaterialsModal(materials) {
-            // 기존 모달이 있다면 제거
-            const existingModal = document.getElementById('materialsModal');
-            if (existingModal) {
-                existingModal.remove();
+        async loadMoreMaterials() {
+            if (!this.materialsNextCursor) {
+                return;
             }
+            try {
+                const data = await this.fetchMaterialsPage('/api/materials', this.materialsNextCursor);
+                const materialsList = document.querySelector('#materialsModal .materials-list');
+                if (!materialsList) {
+                    return;
+                }
+                materialsList.insertAdjacentHTML('beforeend', this.renderMaterialItems(data.materials || []));
+                this.updateLoadMoreButton('materialsLoadMore', data.pagination, 'materialsNextCursor');
+            } catch (error) {
+                console.error('자료 목록 추가 로딩 실패:', error);
+                alert('자료 목록을 불러오는데 실패했습니다.');
+            }
+        }
 
-            // 모달 생성
-            const modal = document.createElement('div');
-            modal.id = 'materialsModal';
-            modal.className = 'contact-modal';
-            
-            const materialsListHtml = materials.length > 0 
-                ? materials.map(material => `
+        updateLoadMoreButton(buttonId, pagination, cursorProperty) {
+            this[cursorProperty] = (pagination && pagination.next_cursor) || null;
+            const button = document.getElementById(buttonId);
+            if (button) {
+                button.style.display = this[cursorProperty] ? 'block' : 'none';
+            }
+        }
+
+        renderMaterialItems(materials) {
+            return materials.map(material => `
                     <div class="material-item">
+                        ${material.thumbnail_url ? `<img class="material-thumbnail" src="${material.thumbnail_url}" alt="" loading="lazy">` : ''}
                         <div class="material-info">
                             <div class="material-title">${material.title}</div>
                             <div class="material-description">${material.description || '설명 없음'}</div>
@@ -1260,7 +1609,23 @@ class MenuManager {
                             다운로드
                         </button>
                     </div>
-                `).join('')
+                `).join('');
+        }
+
+        createMaterialsModal(materials, pagination) {
+            // 기존 모달이 있다면 제거
+            const existingModal = document.getElementById('materialsModal');
+            if (existingModal) {
+                existingModal.remove();
+            }
+
+            // 모달 생성
+            const modal = document.createElement('div');
+            modal.id = 'materialsModal';
+            modal.className = 'contact-modal';
+            
+            const materialsListHtml = materials.length > 0 
+                ? this.renderMaterialItems(materials)
                 : '<p class="no-materials">등록된 자료가 없습니다.</p>';
 
             modal.innerHTML = `
@@ -1273,11 +1638,13 @@ class MenuManager {
                         <div class="materials-list">
                             ${materialsListHtml}
                         </div>
+                        <button id="materialsLoadMore" class="btn btn-secondary" style="display: none; margin: 1rem auto 0;" onclick="window.menuManager.loadMoreMaterials()">더 보기</button>
                     </div>
                 </div>
             `;
 
             document.body.appendChild(modal);
+            this.updateLoadMoreButton('materialsLoadMore', pagination, 'materialsNextCursor');
             
             // 모달 배경 클릭 시 닫기
             modal.addEventListener('click', (e) => {
@@ -1297,10 +1664,12 @@ class MenuManager {
         async downloadMaterial(materialId) {
             try {
                 console.log('자료 다운로드 시작...');
+                // 카운트만 올리고 다운로드 주소를 받아 브라우저 다운로드로 전달 (이어받기 지원)
                 const response = await fetch(`/api/materials/${materialId}/download`, {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
+                        'Accept': 'application/json',
                     }
                 });
 
@@ -1312,7 +1681,7 @@ class MenuManager {
                 const data = await response.json();
                 console.log('다운로드 정보:', data);
                 
-                // 실제 다운로드 링크 생성 (예시)
+                // 실제 다운로드 링크 생성
                 if (data.download_url) {
                     const link = document.createElement('a');
                     link.href = data.download_url;
@@ -1393,7 +1762,7 @@ class MenuManager {
             });
         }
 
-        async loadAdminMaterialsList() {
+        async loadAdminMaterialsList(cursor = null) {
             try {
                 const adminPassword = document.getElementById('adminMaterialsPassword').value;
                 if (!adminPassword) {
@@ -1402,38 +1771,46 @@ class MenuManager {
                 }
 
                 console.log('관리자 자료 목록 로딩 시작...');
-                const response = await fetch('/api/admin/materials', {
-                    method: 'GET',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    }
-                });
-
-                if (!response.ok) {
-                    const errorData = await response.json();
-                    throw new Error(errorData.error || '관리자 인증에 실패했습니다.');
-                }
-
-                const data = await response.json();
+                const data = await this.fetchMaterialsPage('/api/admin/materials', cursor);
                 console.log('관리자 자료 목록 데이터:', data);
                 
-                this.displayAdminMaterialsList(data.materials);
+                this.displayAdminMaterialsList(data.materials || [], data.pagination, Boolean(cursor));
             } catch (error) {
                 console.error('관리자 자료 목록 로딩 실패:', error);
                 alert(error.message || '자료 목록을 불러오는데 실패했습니다.');
             }
         }
 
-        displayAdminMaterialsList(materials) {
+        loadMoreAdminMaterials() {
+            if (this.adminMaterialsNextCursor) {
+                this.loadAdminMaterialsList(this.adminMaterialsNextCursor);
+            }
+        }
+
+        displayAdminMaterialsList(materials, pagination = null, append = false) {
             const adminMaterialsList = document.getElementById('adminMaterialsList');
             const materialsListContainer = adminMaterialsList.querySelector('.admin-materials-list');
 
+            // 더 보기 버튼 (목록 아래에 한 번만 생성)
+            let loadMoreButton = document.getElementById('adminMaterialsLoadMore');
+            if (!loadMoreButton) {
+                loadMoreButton = document.createElement('button');
+                loadMoreButton.id = 'adminMaterialsLoadMore';
+                loadMoreButton.className = 'btn btn-secondary';
+                loadMoreButton.style.margin = '1rem auto 0';
+                loadMoreButton.textContent = '더 보기';
+                loadMoreButton.onclick = () => this.loadMoreAdminMaterials();
+                materialsListContainer.after(loadMoreButton);
+            }
+            this.updateLoadMoreButton('adminMaterialsLoadMore', pagination, 'adminMaterialsNextCursor');
+
             // 자료 목록 표시
-            if (materials.length === 0) {
+            if (materials.length === 0 && !append) {
                 materialsListContainer.innerHTML = '<p class="no-materials">등록된 자료가 없습니다.</p>';
             } else {
                 const materialsListHtml = materials.map(material => `
                     <div class="material-item admin-material-item">
+                        ${material.thumbnail_url ? `<img class="material-thumbnail" src="${material.thumbnail_url}" alt="" loading="lazy">` : ''}
                         <div class="material-info">
                             <div class="material-title">${material.title}</div>
                             <div class="material-description">${material.description || '설명 없음'}</div>
@@ -1461,7 +1838,11 @@ class MenuManager {
                     </div>
                 `).join('');
                 
-                materialsListContainer.innerHTML = materialsListHtml;
+                if (append) {
+                    materialsListContainer.insertAdjacentHTML('beforeend', materialsListHtml);
+                } else {
+                    materialsListContainer.innerHTML = materialsListHtml;
+                }
             }
 
             adminMaterialsList.style.display = 'block';
@@ -1624,20 +2005,29 @@ class MenuManager {
                         return;
                     }
 
-                    const formData = new FormData();
-                    formData.append('admin_password', adminPassword);
-                    formData.append('title', title);
-                    formData.append('description', description);
-                    formData.append('category', category);
-                    formData.append('file', fileInput.files[0]);
-
-                    console.log('자료 등록 시작...');
-                    const response = await fetch('/api/admin/materials', {
-                        method: 'POST',
-                        body: formData
-                    });
+                    const file = fileInput.files[0];
+                    let result;
 
-                    const result = await response.json();
+                    if (file.size > CHUNKED_UPLOAD_THRESHOLD) {
+                        // 큰 파일은 분할 업로드 (끊겨도 이어서 전송)
+                        console.log('분할 업로드 시작...');
+                        result = await this.uploadMaterialInChunks(file, adminPassword, title, description, category);
+                    } else {
+                        const formData = new FormData();
+                        formData.append('admin_password', adminPassword);
+                        formData.append('title', title);
+                        formData.append('description', description);
+                        formData.append('category', category);
+                        formData.append('file', file);
+
+                        console.log('자료 등록 시작...');
+                        const response = await fetch('/api/admin/materials', {
+                            method: 'POST',
+                            body: formData
+                        });
+
+                        result = await response.json();
+                    }
                     
                     if (result.success) {
                         alert(result.message);
@@ -1682,6 +2072,106 @@ class MenuManager {
             }
         }
 
+        async uploadMaterialInChunks(file, adminPassword, title, description, category) {
+            // 1) 업로드 세션 생성
+            const initResponse = await fetch('/api/admin/uploads', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    admin_password: adminPassword,
+                    file_name: file.name,
+                    file_size: file.size,
+                    file_type: file.type
+                })
+            });
+            const session = await initResponse.json();
+            if (!session.success) {
+                return session;
+            }
+
+            const uploadUrl = `/api/admin/uploads/${session.upload_id}`;
+            const headers = { 'X-Admin-Password': adminPassword };
+
+            // 2) 청크 전송 (실패 시 서버에 저장된 위치를 확인하고 이어서 전송)
+            //    청크마다 X-Chunk-Sha256 으로 서버가 검증하고, 파일 전체 체크섬은 보내면서 이어서 계산
+            const fileHash = new Sha256();
+            let hashedOffset = 0;
+            let offset = session.offset;
+            let retries = 0;
+            while (offset < file.size) {
+                try {
+                    const chunk = new Uint8Array(await file.slice(offset, offset + session.chunk_size).arrayBuffer());
+                    if (offset <= hashedOffset && offset + chunk.length > hashedOffset) {
+                        fileHash.update(chunk.subarray(hashedOffset - offset));
+                        hashedOffset = offset + chunk.length;
+                    }
+                    const response = await fetch(`${uploadUrl}?offset=${offset}`, {
+                        method: 'PUT',
+                        headers: {
+                            ...headers,
+                            'Content-Type': 'application/octet-stream',
+                            'X-Chunk-Sha256': await this.computeChunkSha256(chunk)
+                        },
+                        body: chunk
+                    });
+                    const result = await response.json();
+                    // 위치 불일치(409)는 반환된 offset 부터 이어서 전송하고,
+                    // offset 이 없는 응답(다른 청크 전송 중, 503 등)은 상태를 다시 확인한 뒤 재시도
+                    if ((!result.success && response.status !== 409) || !Number.isInteger(result.offset)) {
+                        throw new Error(result.error || '청크 전송 실패');
+                    }
+                    offset = result.offset;
+                    retries = 0;
+                    console.log(`분할 업로드 진행: ${Math.round(offset / file.size * 100)}%`);
+                } catch (error) {
+                    if (++retries > MAX_UPLOAD_RETRIES) {
+                        throw error;
+                    }
+                    console.warn(`청크 전송 실패, 재시도 ${retries}/${MAX_UPLOAD_RETRIES}:`, error);
+                    await new Promise(resolve => setTimeout(resolve, 1000 * retries));
+                    try {
+                        const status = await (await fetch(uploadUrl, { headers })).json();
+                        if (status.success && Number.isInteger(status.offset)) {
+                            offset = status.offset;
+                        }
+                    } catch (statusError) {
+                        console.warn('업로드 상태 확인 실패:', statusError);
+                    }
+                }
+            }
+
+            // 3) 체크섬과 함께 완료 요청
+            if (hashedOffset !== file.size) {
+                throw new Error('파일 체크섬을 계산하지 못했습니다.');
+            }
+            const sha256 = fileHash.hexDigest();
+            const commitResponse = await fetch(`${uploadUrl}/commit`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    admin_password: adminPassword,
+                    title: title,
+                    description: description,
+                    category: category,
+                    sha256: sha256
+                })
+            });
+            return await commitResponse.json();
+        }
+
+        async computeChunkSha256(chunk) {
+            // SubtleCrypto 는 보안 컨텍스트(HTTPS, localhost)에서만 사용 가능
+            if (!window.crypto || !window.crypto.subtle) {
+                return new Sha256().update(chunk).hexDigest();
+            }
+            const digest = await window.crypto.subtle.digest('SHA-256', chunk);
+            return Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+        }
+
         editMaterial(materialId) {
             // 자료 수정 폼 표시 (현재는 간단한 구현)
             this.showMaterialForm(materialId);
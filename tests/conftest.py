@@ -0,0 +1,16 @@
+"""테스트용 설정
+
+app 은 가져올 때 DATABASE_PATH / UPLOAD_PATH 를 읽으므로, 가져오기 전에 임시 디렉터리로 지정합니다.
+"""
+import os
+import sys
+import tempfile
+
+_test_root = tempfile.mkdtemp(prefix='hanstar-test-')
+os.environ['DATABASE_PATH'] = os.path.join(_test_root, 'test.db')
+os.environ['UPLOAD_PATH'] = os.path.join(_test_root, 'uploads')
+os.environ['BACKUP_FOLDER'] = os.path.join(_test_root, 'backups')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ['DOWNLOAD_COUNT_FLUSH_INTERVAL'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,97 @@
+"""데이터베이스 백업: 보존 정책(회전), 프로세스 간 잠금, 주기 백업 건너뛰기"""
+import gzip
+import hashlib
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+import app
+
+
+@pytest.fixture(autouse=True)
+def backup_folder(tmp_path, monkeypatch):
+    app.ensure_database_schema()
+    monkeypatch.setattr(app, 'BACKUP_FOLDER', str(tmp_path))
+    return tmp_path
+
+
+def make_backup_file(folder, created_at):
+    file_name = f'{app.BACKUP_FILE_PREFIX}{created_at.strftime("%Y%m%d_%H%M%S")}{app.BACKUP_FILE_SUFFIX}'
+    (folder / file_name).write_bytes(b'')
+    (folder / (file_name + '.sha256')).write_text('')
+    return file_name
+
+
+def test_rotation_keeps_one_per_day_and_week(backup_folder, monkeypatch):
+    monkeypatch.setattr(app, 'BACKUP_KEEP_DAILY', 2)
+    monkeypatch.setattr(app, 'BACKUP_KEEP_WEEKLY', 2)
+    monday = datetime(2026, 3, 16, 12, 0, 0)
+    newest = make_backup_file(backup_folder, monday + timedelta(days=2, hours=3))
+    same_day = make_backup_file(backup_folder, monday + timedelta(days=2))
+    previous_day = make_backup_file(backup_folder, monday + timedelta(days=1))
+    monday_backup = make_backup_file(backup_folder, monday)
+    last_week = make_backup_file(backup_folder, monday - timedelta(days=3))
+    two_weeks_ago = make_backup_file(backup_folder, monday - timedelta(days=10))
+    
+    app.rotate_backups()
+    
+    kept = {file_name for _, file_name in app.list_backups()}
+    # 최근 2일(하루 1개) + 최근 2주(주 1개): 이번 주는 newest 가 대표
+    assert kept == {newest, previous_day, last_week}
+    for removed in (same_day, monday_backup, two_weeks_ago):
+        assert not (backup_folder / removed).exists()
+        assert not (backup_folder / (removed + '.sha256')).exists()
+
+
+def test_backup_file_lock_is_exclusive():
+    lock_file = app.acquire_backup_file_lock()
+    assert lock_file is not None
+    try:
+        assert app.acquire_backup_file_lock() is None
+    finally:
+        lock_file.close()
+    second = app.acquire_backup_file_lock()
+    assert second is not None
+    second.close()
+
+
+def test_start_backup_refused_while_another_process_holds_lock():
+    lock_file = app.acquire_backup_file_lock()
+    try:
+        assert app.start_backup() is False
+    finally:
+        lock_file.close()
+
+
+def test_scheduled_backup_skipped_when_recent_backup_exists(backup_folder, monkeypatch):
+    monkeypatch.setattr(app, 'BACKUP_INTERVAL_HOURS', 1)
+    assert app.backup_is_due() is True
+    
+    # 다른 워커가 10분 전에 백업함
+    recent = make_backup_file(backup_folder, datetime.now() - timedelta(minutes=10))
+    assert app.backup_is_due() is False
+    assert app.start_backup(scheduled=True) is False
+    
+    (backup_folder / recent).unlink()
+    make_backup_file(backup_folder, datetime.now() - timedelta(minutes=58))
+    assert app.backup_is_due() is True
+
+
+def test_backup_writes_verified_archive_without_work_files(backup_folder):
+    info = app.backup_database()
+    assert info is not None
+    
+    backup_path = backup_folder / info['file_name']
+    assert hashlib.sha256(backup_path.read_bytes()).hexdigest() == info['sha256']
+    assert (backup_folder / (info['file_name'] + '.sha256')).read_text().startswith(info['sha256'])
+    
+    restored = backup_folder / 'restored.db'
+    restored.write_bytes(gzip.decompress(backup_path.read_bytes()))
+    with sqlite3.connect(restored) as conn:
+        assert conn.execute('PRAGMA integrity_check').fetchone()[0] == 'ok'
+        assert conn.execute('SELECT COUNT(*) FROM inquiries').fetchone() is not None
+    
+    leftovers = [name for name in os.listdir(backup_folder) if name.endswith(('.snapshot', '.tmp'))]
+    assert leftovers == []
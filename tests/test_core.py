@@ -0,0 +1,265 @@
+"""커서 페이지네이션, 쓰기 스레드, 내용 주소 저장소(참조 수/정리) 테스트"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app
+
+
+@pytest.fixture(scope='module', autouse=True)
+def schema():
+    app.ensure_database_schema()
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(app.DATABASE_FILE)
+    yield conn
+    conn.close()
+
+
+def make_temp_file(data):
+    """분할 업로드 임시 폴더에 data 를 기록하고 (경로, SHA-256) 을 반환합니다."""
+    os.makedirs(app.PARTIAL_UPLOAD_FOLDER, exist_ok=True)
+    path = os.path.join(app.PARTIAL_UPLOAD_FOLDER, f'{uuid.uuid4().hex}.tmp')
+    with open(path, 'wb') as temp_file:
+        temp_file.write(data)
+    return path, hashlib.sha256(data).hexdigest()
+
+
+def register(temp_path, content_hash, file_name='a.txt'):
+    """자료를 등록하고 ID 를 반환합니다."""
+    app.run_write(app.register_material, temp_path, content_hash, '제목', '설명', file_name,
+                  '1.0 KB', 'text/plain', '기타')
+    with sqlite3.connect(app.DATABASE_FILE) as conn:
+        return conn.execute('SELECT MAX(id) FROM materials').fetchone()[0]
+
+
+# 커서
+def test_cursor_round_trip():
+    token = app.encode_cursor(['2026-01-02', '03', 7], 'prev')
+    assert app.decode_cursor(token, 3) == ('prev', ['2026-01-02', '03', 7])
+
+
+@pytest.mark.parametrize('token', [
+    'not-base64!',
+    app.encode_cursor(['2026-01-02', 7]),                  # 키 개수 불일치
+    app.encode_cursor([['nested'], 7, 1]),                 # 스칼라가 아닌 키
+    app.encode_cursor(['a', 'b', 1], 'sideways'),          # 잘못된 방향
+    12345,                                                 # 문자열이 아닌 커서
+])
+def test_decode_cursor_rejects_invalid(token):
+    with pytest.raises(ValueError) as error:
+        app.decode_cursor(token, 3)
+    # 내부 예외 메시지를 노출하지 않음
+    assert str(error.value) == '잘못된 커서입니다.'
+
+
+def test_keyset_pages_cover_all_rows_in_order(db):
+    db.execute('CREATE TABLE keyset_rows (id INTEGER PRIMARY KEY, created_at TEXT NOT NULL)')
+    db.executemany('INSERT INTO keyset_rows (id, created_at) VALUES (?, ?)',
+                   [(row_id, f'2026-01-{row_id % 3 + 1:02d}') for row_id in range(1, 24)])
+    cursor = db.cursor()
+    key_columns = ('created_at', 'id')
+    expected = sorted(((f'2026-01-{row_id % 3 + 1:02d}', row_id) for row_id in range(1, 24)), reverse=True)
+    
+    seen = []
+    page_cursors = [None]
+    page_cursor = None
+    page = 1
+    while True:
+        rows, next_cursor, prev_cursor = app.query_keyset_page(cursor, 'keyset_rows', 'id', key_columns, 5,
+                                                              page_cursor=page_cursor, page=page)
+        assert (prev_cursor is None) == (page_cursor is None)
+        if page_cursor:
+            assert app.cursor_page_number(page_cursor) == len(page_cursors)
+        seen.extend((row[1], row[2]) for row in rows)
+        if next_cursor is None:
+            break
+        page_cursor = next_cursor
+        page_cursors.append(next_cursor)
+        page = app.cursor_page_number(next_cursor)
+    assert seen == expected
+    
+    # 마지막 페이지에서 prev 커서로 돌아가면 이전 페이지와 같은 행
+    rows, _, _ = app.query_keyset_page(cursor, 'keyset_rows', 'id', key_columns, 5, page_cursor=page_cursors[-2])
+    last_rows, _, prev_cursor = app.query_keyset_page(cursor, 'keyset_rows', 'id', key_columns, 5,
+                                                      page_cursor=page_cursors[-1], page=len(page_cursors))
+    back_rows, _, _ = app.query_keyset_page(cursor, 'keyset_rows', 'id', key_columns, 5, page_cursor=prev_cursor)
+    assert back_rows == rows
+    assert app.cursor_page_number(prev_cursor) == len(page_cursors) - 1
+
+
+def test_cursor_page_number_rejects_invalid_page():
+    assert app.cursor_page_number(app.encode_cursor(['a', 1])) is None
+    assert app.cursor_page_number(app.encode_cursor(['a', 1], page=3)) == 3
+    for page in (0, -1, '2', True):
+        with pytest.raises(ValueError):
+            app.cursor_page_number(app.encode_cursor(['a', 1], page=page))
+
+
+def test_admin_inquiry_list_rejects_bad_parameters():
+    client = app.app.test_client()
+    for body, error in (({'page': 'abc'}, '잘못된 페이지 번호입니다.'), ({'page': [1]}, '잘못된 페이지 번호입니다.'),
+                        ({'cursor': 5}, '잘못된 커서입니다.'), ({'cursor': {'k': []}}, '잘못된 커서입니다.'),
+                        ({'cursor': 'bad!'}, '잘못된 커서입니다.')):
+        response = client.post('/api/admin/inquiry-list', json=dict(body, admin_password=app.ADMIN_PASSWORD))
+        assert response.status_code == 400
+        assert response.get_json()['error'] == error
+
+
+def test_inquiry_list_rejects_bad_cursor():
+    client = app.app.test_client()
+    client.post('/api/inquiry', json={'name': '이름', 'phone': '010', 'email': 'a@b.c', 'message': '내용', 'password': 'pw'})
+    response = client.get('/api/inquiry-list?cursor=%7Bbad')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == '잘못된 커서입니다.'
+
+
+# 쓰기 스레드
+def test_failed_write_does_not_affect_others_in_batch(db):
+    db.execute('CREATE TABLE IF NOT EXISTS write_items (name TEXT PRIMARY KEY)')
+    db.commit()
+    
+    def insert(cursor, name):
+        cursor.execute('INSERT INTO write_items (name) VALUES (?)', (name,))
+        if name == 'bad':
+            raise RuntimeError('실패')
+        return name
+    
+    # 앞선 작업이 쓰기 스레드를 붙잡고 있는 동안 요청해 나머지가 한 트랜잭션으로 묶이게 함
+    started = threading.Event()
+    release = threading.Event()
+    
+    def block(cursor):
+        started.set()
+        release.wait(5)
+    
+    names = ['a', 'b', 'bad', 'c', 'd']
+    with ThreadPoolExecutor(len(names) + 1) as executor:
+        blocker = executor.submit(app.run_write, block)
+        assert started.wait(5)
+        futures = {name: executor.submit(app.run_write, insert, name) for name in names}
+        while app.get_writer_stats()['queue_depth'] < len(names):
+            time.sleep(0.01)
+        batches_before = app.get_writer_stats()['batches']
+        release.set()
+        blocker.result()
+    
+    # 붙잡고 있던 작업의 트랜잭션 + 나머지 다섯 작업의 트랜잭션 하나
+    assert app.get_writer_stats()['batches'] == batches_before + 2
+    for name, future in futures.items():
+        if name == 'bad':
+            with pytest.raises(RuntimeError):
+                future.result()
+        else:
+            assert future.result() == name
+    stored = {row[0] for row in db.execute('SELECT name FROM write_items')}
+    assert stored == {'a', 'b', 'c', 'd'}
+
+
+def test_write_hooks_run_after_commit_or_rollback():
+    events = []
+    
+    def succeed(cursor):
+        app.on_write_commit(lambda: events.append('commit'))
+        app.on_write_rollback(lambda: events.append('rollback'))
+    
+    def fail(cursor):
+        app.on_write_commit(lambda: events.append('commit-failed'))
+        app.on_write_rollback(lambda: events.append('rollback-failed'))
+        raise RuntimeError('실패')
+    
+    app.run_write(succeed)
+    with pytest.raises(RuntimeError):
+        app.run_write(fail)
+    assert events == ['commit', 'rollback-failed']
+
+
+# 내용 주소 저장소
+def test_failed_registration_restores_temp_file():
+    temp_path, content_hash = make_temp_file(b'rolled back')
+    
+    def register_then_fail(cursor):
+        app.register_material(cursor, temp_path, content_hash, '제목', '설명', 'a.txt', '1.0 KB', 'text/plain', '기타')
+        raise RuntimeError('실패')
+    
+    with pytest.raises(RuntimeError):
+        app.run_write(register_then_fail)
+    assert os.path.exists(temp_path)
+    assert not os.path.exists(app.blob_path(content_hash))
+
+
+def test_blob_is_shared_and_removed_after_last_reference(db):
+    first_path, content_hash = make_temp_file(b'shared content')
+    second_path, _ = make_temp_file(b'shared content')
+    first_id = register(first_path, content_hash)
+    second_id = register(second_path, content_hash, 'b.txt')
+    
+    assert os.path.exists(app.blob_path(content_hash))
+    assert not os.path.exists(first_path) and not os.path.exists(second_path)
+    
+    # 삭제가 되돌려지면 파일도 남음
+    def delete_then_fail(cursor):
+        app.delete_material(cursor, first_id)
+        app.delete_material(cursor, second_id)
+        raise RuntimeError('실패')
+    
+    with pytest.raises(RuntimeError):
+        app.run_write(delete_then_fail)
+    assert os.path.exists(app.blob_path(content_hash))
+    
+    app.run_write(app.delete_material, first_id)
+    assert os.path.exists(app.blob_path(content_hash))
+    app.run_write(app.delete_material, second_id)
+    assert not os.path.exists(app.blob_path(content_hash))
+
+
+def test_sweep_removes_only_unreferenced_files():
+    kept_path, kept_hash = make_temp_file(b'kept')
+    register(kept_path, kept_hash)
+    
+    orphan_hash = hashlib.sha256(b'orphan').hexdigest()
+    orphan_path = app.blob_path(orphan_hash)
+    os.makedirs(os.path.dirname(orphan_path), exist_ok=True)
+    for path in (orphan_path, orphan_path + '.webp'):
+        open(path, 'wb').close()
+    orphan_part = os.path.join(app.PARTIAL_UPLOAD_FOLDER, f'{uuid.uuid4().hex}.part')
+    open(orphan_part, 'wb').close()
+    
+    assert app.sweep_orphan_files() >= 3
+    assert os.path.exists(app.blob_path(kept_hash))
+    assert not os.path.exists(orphan_path)
+    assert not os.path.exists(orphan_path + '.webp')
+    assert not os.path.exists(orphan_part)
+
+
+def test_sweep_keeps_blob_registered_after_candidates_were_listed():
+    temp_path, content_hash = make_temp_file(b'registered during sweep')
+    app.run_write(lambda cursor: app.store_blob(temp_path, content_hash))  # 자료 없이 남은 파일 (고아)
+    candidates = app.find_orphan_file_candidates()
+    assert content_hash in candidates[0]
+    
+    # 후보를 찾은 뒤 같은 내용의 자료가 등록됨
+    second_path, _ = make_temp_file(b'registered during sweep')
+    register(second_path, content_hash)
+    
+    app.run_write(app.remove_orphan_files, candidates)
+    assert os.path.exists(app.blob_path(content_hash))
+
+
+def test_orphan_sweep_is_rate_limited(monkeypatch):
+    started = []
+    monkeypatch.setattr(app, '_orphan_sweep_last', 0.0)
+    monkeypatch.setattr(app, 'sweep_orphan_files', lambda: started.append(True) or 0)
+    assert app.schedule_orphan_sweep() is True
+    assert app.schedule_orphan_sweep() is False
+    
+    monkeypatch.setattr(app, 'ORPHAN_SWEEP_INTERVAL_HOURS', 0)
+    assert app.schedule_orphan_sweep() is False
@@ -0,0 +1,97 @@
+"""데이터 내보내기: CSV 수식 주입 방지, 스트리밍 응답, 형식(csv/jsonl/json)과 gzip"""
+import csv
+import gzip
+import io
+import json
+import sqlite3
+
+import pytest
+
+import app
+
+EXPORT_DAY = '2001-02-03'
+MESSAGES = ['=HYPERLINK("http://example.com")', '+82 10', '-1', '@SUM(A1)', '일반 문의']
+
+
+@pytest.fixture(scope='module', autouse=True)
+def inquiries():
+    """다른 테스트 데이터와 겹치지 않는 날짜로 문의를 넣습니다 (날짜 필터로 이 데이터만 내보냄)."""
+    app.ensure_database_schema()
+    conn = sqlite3.connect(app.DATABASE_FILE)
+    conn.execute('DELETE FROM inquiries WHERE date = ?', (EXPORT_DAY,))
+    conn.executemany('''
+        INSERT INTO inquiries (date, serial, name, phone, email, message, password, created_at)
+        VALUES (?, ?, '내보내기', '010', 'export@example.com', ?, 'secret', ?)
+    ''', [(EXPORT_DAY, f'{index + 1:02d}', message, f'{EXPORT_DAY} 10:00:{index:02d}')
+          for index, message in enumerate(MESSAGES)])
+    conn.commit()
+    conn.close()
+
+
+def export(query, **kwargs):
+    client = app.app.test_client()
+    return client.get(f'/api/admin/export/inquiries?date_from={EXPORT_DAY}&date_to={EXPORT_DAY}&{query}',
+                      headers={'X-Admin-Password': app.ADMIN_PASSWORD}, **kwargs)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('=1+1', "'=1+1"),
+    ('+1', "'+1"),
+    ('-1', "'-1"),
+    ('@SUM(A1)', "'@SUM(A1)"),
+    ('일반 문의', '일반 문의'),
+    ('a=b', 'a=b'),
+    (-1, -1),
+    (None, None),
+])
+def test_escape_csv_cell(value, expected):
+    assert app.escape_csv_cell(value) == expected
+
+
+def test_csv_export_escapes_formulas():
+    response = export('format=csv')
+    assert response.status_code == 200
+    assert response.headers['Content-Disposition'].startswith('attachment;')
+
+    text = response.get_data().decode('utf-8')
+    assert text.startswith('\ufeff')
+    rows = list(csv.DictReader(io.StringIO(text[1:])))
+    assert [row['message'] for row in rows] == [app.escape_csv_cell(message) for message in MESSAGES]
+    # 숫자 셀(id) 은 그대로
+    assert all(row['id'].isdigit() for row in rows)
+    # 문의 비밀번호는 내보내지 않음
+    assert 'password' not in rows[0]
+
+
+def test_export_is_streamed_in_batches(monkeypatch):
+    monkeypatch.setattr(app, 'EXPORT_FETCH_SIZE', 2)
+    response = export('format=jsonl')
+    assert response.is_streamed
+    chunks = [chunk for chunk in response.iter_encoded() if chunk]
+    # 2행씩 읽으므로 5행은 3개 조각으로 나뉨
+    assert len(chunks) == 3
+    assert len(b''.join(chunks).splitlines()) == len(MESSAGES)
+
+
+@pytest.mark.parametrize('export_format', ['csv', 'jsonl', 'json'])
+def test_gzip_export_matches_plain(export_format):
+    plain = export(f'format={export_format}').get_data()
+    compressed = export(f'format={export_format}&gzip=1')
+    assert compressed.mimetype == 'application/gzip'
+    assert compressed.headers['Content-Disposition'].endswith('.gz"')
+    assert gzip.decompress(compressed.get_data()) == plain
+
+
+def test_json_and_jsonl_exports_agree():
+    records = json.loads(export('format=json').get_data())
+    lines = [json.loads(line) for line in export('format=jsonl').get_data().splitlines()]
+    assert records == lines
+    assert [record['message'] for record in records] == MESSAGES  # JSON 은 이스케이프하지 않음
+    assert 'password' not in records[0]
+
+
+def test_export_requires_admin_and_valid_format():
+    client = app.app.test_client()
+    assert client.get('/api/admin/export/inquiries').status_code == 401
+    assert export('format=xml').status_code == 400
+    assert export('answered=maybe').status_code == 400
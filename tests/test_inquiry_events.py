@@ -0,0 +1,93 @@
+"""관리자 알림: 연결 토큰(만료, 서명 검증)과 format=json 폴링"""
+import sqlite3
+import time
+import uuid
+
+import pytest
+
+import app
+
+
+@pytest.fixture(scope='module', autouse=True)
+def schema():
+    app.ensure_database_schema()
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def issue_token(client):
+    response = client.post('/api/admin/inquiry-events/token', json={'admin_password': app.ADMIN_PASSWORD})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def add_inquiry():
+    with sqlite3.connect(app.DATABASE_FILE) as conn:
+        return conn.execute('''
+            INSERT INTO inquiries (date, serial, name, phone, email, message, password)
+            VALUES ('2002-03-04', ?, '알림', '010', 'event@example.com', '새 문의', 'pw')
+        ''', (uuid.uuid4().hex[:8],)).lastrowid
+
+
+def test_created_token_is_valid():
+    assert app.verify_event_token(app.create_event_token())
+
+
+def test_expired_token_rejected():
+    expires = int(time.time()) - 1
+    assert not app.verify_event_token(f'{expires}.{app._event_token_signature(expires)}')
+    assert not app.verify_event_token(f'1.{app._event_token_signature(1)}')
+
+
+def test_tampered_token_rejected():
+    expires, _, signature = app.create_event_token().partition('.')
+    flipped = signature[:-1] + ('0' if signature[-1] != '0' else '1')
+    assert not app.verify_event_token(f'{expires}.{flipped}')
+    # 서명은 그대로 두고 만료 시각만 늘린 토큰
+    assert not app.verify_event_token(f'{int(expires) + 3600}.{signature}')
+
+
+@pytest.mark.parametrize('token', [None, '', 'abc', '123', '123.', '.abc', '-5.abc', '12.34.56'])
+def test_malformed_token_rejected(token):
+    assert not app.verify_event_token(token)
+
+
+def test_token_endpoint_requires_admin(client):
+    response = client.post('/api/admin/inquiry-events/token', json={'admin_password': 'wrong'})
+    assert response.status_code == 401
+    data = issue_token(client)
+    assert app.verify_event_token(data['token'])
+    assert data['expires_in'] == app.INQUIRY_EVENTS_TOKEN_TTL
+    assert data['poll_interval'] == app.INQUIRY_EVENTS_CLIENT_POLL_SECONDS
+
+
+@pytest.mark.parametrize('token', ['', 'abc', f'1.{"0" * 64}'])
+def test_events_endpoint_rejects_bad_token(client, token):
+    assert client.get(f'/api/admin/inquiry-events?token={token}&format=json').status_code == 401
+
+
+def test_events_endpoint_rejects_expired_token(client):
+    token = f'1.{app._event_token_signature(1)}'
+    assert client.get(f'/api/admin/inquiry-events?token={token}&format=json').status_code == 401
+
+
+def test_json_polling_returns_new_events(client):
+    token = issue_token(client)['token']
+    start = client.get(f'/api/admin/inquiry-events?token={token}&format=json').get_json()
+    assert start['events'] == []
+
+    inquiry_id = add_inquiry()
+    data = client.get(f'/api/admin/inquiry-events?token={token}&format=json'
+                      f'&last_event_id={start["last_event_id"]}').get_json()
+    assert [(event['event'], event['inquiry']['id']) for event in data['events']] == [('inquiry_created', inquiry_id)]
+    assert data['last_event_id'] > start['last_event_id']
+
+
+def test_poll_mode_disables_stream(client, monkeypatch):
+    monkeypatch.setattr(app, 'INQUIRY_EVENTS_MODE', 'poll')
+    data = issue_token(client)
+    assert data['stream'] is False
+    assert client.get(f'/api/admin/inquiry-events?token={data["token"]}').status_code == 204
@@ -0,0 +1,116 @@
+"""자료 목록 캐시: 세대 번호 증가와 무효화, 최대 보관 시간"""
+import json
+import sqlite3
+
+import pytest
+
+import app
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    app.ensure_database_schema()
+    with app._materials_cache_lock:
+        app._materials_cache.clear()
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(app.DATABASE_FILE)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def material_id(db):
+    cursor = db.cursor()
+    app.insert_material(cursor, '캐시 자료', '설명', 'cache.txt', 'c' * 64, '1.0 KB', 'text/plain', '기타')
+    db.commit()
+    return cursor.lastrowid
+
+
+def generation(db):
+    return app.get_materials_generation(db.cursor())
+
+
+def test_generation_ignores_download_count(db, material_id):
+    before = generation(db)
+    db.execute('UPDATE materials SET download_count = download_count + 5 WHERE id = ?', (material_id,))
+    db.commit()
+    assert generation(db) == before
+
+
+@pytest.mark.parametrize('column, value', [
+    ('title', '바뀐 제목'),
+    ('description', '바뀐 설명'),
+    ('category', '무역'),
+    ('is_active', 0),
+    ('file_name', 'renamed.txt'),
+])
+def test_generation_bumped_by_visible_columns(db, material_id, column, value):
+    before = generation(db)
+    db.execute(f'UPDATE materials SET {column} = ? WHERE id = ?', (value, material_id))
+    db.commit()
+    assert generation(db) == before + 1
+
+
+def test_generation_bumped_by_insert_and_delete(db):
+    before = generation(db)
+    cursor = db.cursor()
+    app.insert_material(cursor, '추가 자료', '', 'added.txt', 'd' * 64, '1.0 KB', 'text/plain', '기타')
+    db.commit()
+    assert generation(db) == before + 1
+    db.execute('DELETE FROM materials WHERE id = ?', (cursor.lastrowid,))
+    db.commit()
+    assert generation(db) == before + 2
+
+
+def test_cached_response_rebuilt_after_generation_change(db, material_id):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'count': len(builds)}
+
+    def fetch():
+        return json.loads(app.cached_materials_response(db.cursor(), ('test',), build).get_data())
+
+    hits = app.materials_cache_stats['hits']
+    assert fetch() == {'count': 1}
+    assert fetch() == {'count': 1}
+    assert app.materials_cache_stats['hits'] == hits + 1
+
+    # 다운로드 카운트만 바뀌면 캐시 유지
+    db.execute('UPDATE materials SET download_count = download_count + 1 WHERE id = ?', (material_id,))
+    db.commit()
+    assert fetch() == {'count': 1}
+
+    db.execute("UPDATE materials SET title = '새 제목' WHERE id = ?", (material_id,))
+    db.commit()
+    assert fetch() == {'count': 2}
+
+
+def test_cached_response_expires_after_max_age(db, monkeypatch):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'count': len(builds)}
+
+    monkeypatch.setattr(app, 'MATERIALS_CACHE_MAX_AGE', 0)
+    app.cached_materials_response(db.cursor(), ('expiry',), build)
+    app.cached_materials_response(db.cursor(), ('expiry',), build)
+    assert len(builds) == 2
+
+
+def test_materials_endpoint_reflects_update(db, material_id):
+    client = app.app.test_client()
+
+    def titles():
+        response = client.get('/api/materials?limit=200&fields=title')
+        return {material['id']: material['title'] for material in response.get_json()['materials']}
+
+    assert titles()[material_id] == '캐시 자료'
+    db.execute("UPDATE materials SET title = '수정된 자료' WHERE id = ?", (material_id,))
+    db.commit()
+    assert titles()[material_id] == '수정된 자료'
@@ -0,0 +1,109 @@
+"""목록 개수 카운터(row_counts): 트리거가 유지하는 값이 실제 COUNT(*) 와 일치하는지 확인"""
+import sqlite3
+import uuid
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def db():
+    app.ensure_database_schema()
+    conn = sqlite3.connect(app.DATABASE_FILE)
+    yield conn
+    conn.close()
+
+
+def actual_inquiry_counts(db):
+    answered, total = db.execute(
+        "SELECT COALESCE(SUM(COALESCE(answer, '') != ''), 0), COUNT(*) FROM inquiries"
+    ).fetchone()
+    return {'total': total, 'answered': answered, 'unanswered': total - answered}
+
+
+def actual_category_counts(db, active_only):
+    where = 'WHERE is_active = 1' if active_only else ''
+    return dict(db.execute(f'SELECT category, COUNT(*) FROM materials {where} GROUP BY category').fetchall())
+
+
+def assert_counts_exact(db):
+    cursor = db.cursor()
+    assert app.get_inquiry_counts(cursor) == actual_inquiry_counts(db)
+    assert app.get_material_category_counts(cursor, True) == actual_category_counts(db, True)
+    assert app.get_material_category_counts(cursor, False) == actual_category_counts(db, False)
+
+
+def add_inquiry(db, answer=None):
+    cursor = db.execute('''
+        INSERT INTO inquiries (date, serial, name, phone, email, message, password, answer)
+        VALUES ('2020-01-01', ?, '카운트', '010', 'count@example.com', '문의', 'pw', ?)
+    ''', (uuid.uuid4().hex[:8], answer))
+    db.commit()
+    return cursor.lastrowid
+
+
+def add_material(db, category, is_active=True):
+    cursor = db.cursor()
+    app.insert_material(cursor, '카운트 자료', '', 'count.txt', 'e' * 64, '1.0 KB', 'text/plain', category)
+    cursor.execute('UPDATE materials SET is_active = ? WHERE id = ?', (int(is_active), cursor.lastrowid))
+    db.commit()
+    return cursor.lastrowid
+
+
+def test_inquiry_counts_follow_answers(db):
+    unanswered = add_inquiry(db)
+    answered = add_inquiry(db, '답변')
+    assert_counts_exact(db)
+
+    steps = [
+        ("UPDATE inquiries SET answer = '새 답변' WHERE id = ?", unanswered),   # 대기 -> 완료
+        ("UPDATE inquiries SET answer = '고친 답변' WHERE id = ?", answered),   # 완료 -> 완료 (개수 변화 없음)
+        ("UPDATE inquiries SET answer = '' WHERE id = ?", answered),           # 빈 답변은 대기
+        ('UPDATE inquiries SET answer = NULL WHERE id = ?', unanswered),
+        ("UPDATE inquiries SET name = '이름만 수정' WHERE id = ?", answered),
+        ('DELETE FROM inquiries WHERE id = ?', unanswered),
+    ]
+    for sql, inquiry_id in steps:
+        db.execute(sql, (inquiry_id,))
+        db.commit()
+        assert_counts_exact(db)
+
+
+def test_inquiry_counts_after_add_answer_endpoint(db):
+    inquiry_id = add_inquiry(db)
+    response = app.app.test_client().post('/api/admin/add-answer', json={
+        'admin_password': app.ADMIN_PASSWORD, 'inquiry_id': inquiry_id, 'answer_content': '엔드포인트 답변'
+    })
+    assert response.status_code == 200
+    assert_counts_exact(db)
+
+
+def test_material_counts_follow_category_and_active(db):
+    material_id = add_material(db, '무역')
+    inactive_id = add_material(db, '운송', is_active=False)
+    assert_counts_exact(db)
+
+    steps = [
+        ("UPDATE materials SET category = '정비' WHERE id = ?", material_id),
+        ('UPDATE materials SET is_active = 0 WHERE id = ?', material_id),
+        ("UPDATE materials SET category = '기타', is_active = 1 WHERE id = ?", material_id),
+        ('UPDATE materials SET is_active = 1 WHERE id = ?', material_id),             # 변화 없음
+        ("UPDATE materials SET title = '제목만 수정' WHERE id = ?", inactive_id),
+        ('UPDATE materials SET download_count = download_count + 3 WHERE id = ?', inactive_id),
+        ('DELETE FROM materials WHERE id = ?', inactive_id),
+        ('DELETE FROM materials WHERE id = ?', material_id),
+    ]
+    for sql, target_id in steps:
+        db.execute(sql, (target_id,))
+        db.commit()
+        assert_counts_exact(db)
+
+
+def test_material_counts_after_admin_update(db):
+    material_id = add_material(db, '무역')
+    response = app.app.test_client().put(f'/api/admin/materials/{material_id}', json={
+        'admin_password': app.ADMIN_PASSWORD, 'title': '수정', 'category': '정비', 'is_active': False
+    })
+    assert response.status_code == 200
+    assert_counts_exact(db)